@@ -1,21 +1,36 @@
 """Public package exports for dev_environment."""
 
-from .data import BaseTimeSeries, BlockBuffer, build_timeseries, collate_block
+from .data import (
+    BaseTimeSeries,
+    BlockBuffer,
+    MultiSensorBlock,
+    TimeSeriesBatch,
+    build_timeseries,
+    collate_block,
+)
 from .io import (
     AdapterStreamDataset,
+    AsyncDataSourceAdapter,
+    BlockLogDataset,
+    BlockLogWriter,
     BufferedStreamDataset,
     CollatedStreamDataset,
     DataSourceAdapter,
     IterableDataSourceAdapter,
     IteratorStreamDataset,
+    MemmapDataSourceAdapter,
+    MultiSensorStreamDataset,
+    RechunkStreamDataset,
     SequenceDataSourceAdapter,
     StreamDataLoader,
     StreamDataset,
+    StreamingIterableDataSourceAdapter,
 )
 from .monitoring import ConsoleMonitor, ErrorPolicy, PipelineMonitor
 from .pipeline import (
     IdentityNode,
     MovingAverageNode,
+    MultiStreamOrchestrator,
     NormaliseAmplitudeNode,
     PipelineBuilder,
     PipelineOrchestrator,
@@ -25,22 +40,32 @@ from .pipeline import (
 __all__ = [
     "BaseTimeSeries",
     "BlockBuffer",
+    "MultiSensorBlock",
+    "TimeSeriesBatch",
     "build_timeseries",
     "collate_block",
     "AdapterStreamDataset",
+    "AsyncDataSourceAdapter",
+    "BlockLogDataset",
+    "BlockLogWriter",
     "BufferedStreamDataset",
     "CollatedStreamDataset",
     "DataSourceAdapter",
     "IterableDataSourceAdapter",
     "IteratorStreamDataset",
+    "MemmapDataSourceAdapter",
+    "MultiSensorStreamDataset",
+    "RechunkStreamDataset",
     "SequenceDataSourceAdapter",
     "StreamDataLoader",
     "StreamDataset",
+    "StreamingIterableDataSourceAdapter",
     "ConsoleMonitor",
     "ErrorPolicy",
     "PipelineMonitor",
     "IdentityNode",
     "MovingAverageNode",
+    "MultiStreamOrchestrator",
     "NormaliseAmplitudeNode",
     "PipelineBuilder",
     "PipelineOrchestrator",
@@ -2,11 +2,17 @@
 
 from .block_buffer import BlockBuffer
 from .collate import collate_block
-from .models import BaseTimeSeries, build_timeseries
+from .models import BaseTimeSeries, MultiSensorBlock, TimeSeriesBatch, build_timeseries
+from .shared import SHARE_MIN_BYTES, SharedTimeSeries, share_timeseries
 
 __all__ = [
     "BaseTimeSeries",
     "BlockBuffer",
     "collate_block",
     "build_timeseries",
+    "MultiSensorBlock",
+    "TimeSeriesBatch",
+    "SHARE_MIN_BYTES",
+    "SharedTimeSeries",
+    "share_timeseries",
 ]
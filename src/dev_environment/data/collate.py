@@ -5,13 +5,17 @@ from __future__ import annotations
 from collections.abc import Mapping, Sequence
 from typing import Any
 
-from .models import BaseTimeSeries, build_timeseries
+from .models import BaseTimeSeries, MultiSensorBlock, TimeSeriesBatch, build_timeseries
 
 
-def collate_block(sample: Any) -> BaseTimeSeries:
-    """Normalize dataset output into a ``BaseTimeSeries`` instance."""
+def collate_block(sample: Any) -> BaseTimeSeries | MultiSensorBlock | TimeSeriesBatch:
+    """Normalize dataset output into a ``BaseTimeSeries`` instance.
 
-    if isinstance(sample, BaseTimeSeries):
+    ``MultiSensorBlock`` and ``TimeSeriesBatch`` samples are already collated and pass
+    through as-is.
+    """
+
+    if isinstance(sample, (BaseTimeSeries, MultiSensorBlock, TimeSeriesBatch)):
         return sample
 
     if isinstance(sample, Mapping):
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping, Sequence
 
 import numpy as np
 import numpy.typing as npt
@@ -105,6 +105,128 @@ class BaseTimeSeries:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class TimeSeriesBatch:
+    """Stack of consecutive same-shape blocks sharing a leading batch axis.
+
+    ``values`` has shape ``(batch, samples, ...)``; ``start_timestamps`` and ``metadata``
+    hold the per-block fields in parallel tuples.
+    """
+
+    values: FloatArray
+    sample_rate: float
+    start_timestamps: tuple[datetime, ...]
+    metadata: tuple[Mapping[str, Any], ...]
+
+    def __post_init__(self) -> None:
+        values = np.asarray(self.values)
+        if values.ndim < 2:
+            raise ValueError("batched values must be at least 2-D")
+        if values.shape[0] == 0 or values.shape[1] == 0:
+            raise ValueError("batch must contain at least one non-empty block")
+        object.__setattr__(self, "values", values)
+
+        if self.sample_rate <= 0:
+            raise ValueError("sample_rate must be positive")
+
+        if not len(self.start_timestamps) == len(self.metadata) == values.shape[0]:
+            raise ValueError("start_timestamps and metadata must match the batch size")
+
+    @classmethod
+    def stack(cls, blocks: Sequence[BaseTimeSeries]) -> "TimeSeriesBatch":
+        """Stack same-shape blocks with a common sample rate into one batch."""
+
+        if not blocks:
+            raise ValueError("Cannot stack an empty sequence of blocks")
+        sample_rate = blocks[0].sample_rate
+        if any(block.sample_rate != sample_rate for block in blocks):
+            raise ValueError("Blocks in a batch must share a sample rate")
+        return cls(
+            values=np.stack([block.values for block in blocks]),
+            sample_rate=sample_rate,
+            start_timestamps=tuple(block.start_timestamp for block in blocks),
+            metadata=tuple(block.metadata or {} for block in blocks),
+        )
+
+    @property
+    def batch_size(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def block_size(self) -> int:
+        return int(self.values.shape[1])
+
+    def __len__(self) -> int:
+        return self.batch_size
+
+    def __getitem__(self, index: int) -> BaseTimeSeries:
+        return BaseTimeSeries(
+            values=self.values[index],
+            sample_rate=self.sample_rate,
+            start_timestamp=self.start_timestamps[index],
+            metadata=self.metadata[index],
+        )
+
+    def unbatch(self) -> list[BaseTimeSeries]:
+        """Split the batch back into individual blocks (views of ``values``)."""
+
+        return [self[index] for index in range(self.batch_size)]
+
+    def copy_with(
+        self,
+        *,
+        values: FloatArray | None = None,
+        metadata: Sequence[Mapping[str, Any]] | None = None,
+    ) -> "TimeSeriesBatch":
+        """Return a new batch with overridden values or per-block metadata."""
+
+        new_values = np.asarray(values) if values is not None else self.values.copy()
+        new_metadata = tuple(metadata) if metadata is not None else self.metadata
+        return TimeSeriesBatch(
+            values=new_values,
+            sample_rate=self.sample_rate,
+            start_timestamps=self.start_timestamps,
+            metadata=new_metadata,
+        )
+
+
+class MultiSensorBlock(Mapping[str, BaseTimeSeries]):
+    """Read-only mapping of sensor name to the latest block as of ``timestamp``.
+
+    The name-to-slot index is shared by every block from the same source, so each block
+    only stores a tuple of per-sensor blocks. Sensors without data yet are absent.
+    """
+
+    __slots__ = ("_index", "_blocks", "timestamp", "updated")
+
+    def __init__(
+        self,
+        index: Mapping[str, int],
+        blocks: tuple[BaseTimeSeries | None, ...],
+        timestamp: datetime,
+        updated: tuple[str, ...],
+    ) -> None:
+        self._index = index
+        self._blocks = blocks
+        self.timestamp = timestamp
+        self.updated = updated
+
+    def __getitem__(self, key: str) -> BaseTimeSeries:
+        block = self._blocks[self._index[key]]
+        if block is None:
+            raise KeyError(key)
+        return block
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, slot in self._index.items() if self._blocks[slot] is not None)
+
+    def __len__(self) -> int:
+        return sum(block is not None for block in self._blocks)
+
+    def __repr__(self) -> str:
+        return f"MultiSensorBlock(timestamp={self.timestamp!r}, keys={list(self)!r})"
+
+
 def build_timeseries(sample: Mapping[str, Any]) -> BaseTimeSeries:
     """Helper to construct ``BaseTimeSeries`` from a mapping."""
 
@@ -0,0 +1,133 @@
+"""Shared-memory transport for ``BaseTimeSeries`` blocks crossing process boundaries."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Any, Mapping
+
+import numpy as np
+
+from .models import BaseTimeSeries
+
+SHARE_MIN_BYTES = 256 * 1024
+"""Blocks smaller than this travel inline through pickle, which is cheaper than a segment."""
+
+
+class _MappedSegment:
+    """Buffer owner that keeps an attached segment mapped while any array views it.
+
+    NumPy keeps the object passed as ``buffer`` as the base of the array and of every view
+    derived from it, so the mapping is closed only once the last of them is collected.
+    """
+
+    __slots__ = ("_segment",)
+
+    def __init__(self, segment: shared_memory.SharedMemory) -> None:
+        self._segment = segment
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._segment.buf
+
+    def __del__(self) -> None:
+        self._segment.close()
+
+
+@dataclass(slots=True, frozen=True)
+class SharedTimeSeries:
+    """Picklable handle to a block whose values live in a shared-memory segment.
+
+    Only the segment name, array layout and the small scalar fields travel through the
+    pickle channel. ``attach`` maps the segment and returns a view of it, without copying
+    the samples. Blocks below ``SHARE_MIN_BYTES`` carry their ``values`` inline instead
+    and have no segment.
+    """
+
+    segment: str | None
+    shape: tuple[int, ...]
+    dtype: str
+    sample_rate: float
+    start_timestamp: datetime
+    metadata: Mapping[str, Any]
+    values: np.ndarray | None = None
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # Positional reconstruction pickles faster than the slots-dataclass state dict.
+        return (
+            SharedTimeSeries,
+            (
+                self.segment,
+                self.shape,
+                self.dtype,
+                self.sample_rate,
+                self.start_timestamp,
+                self.metadata,
+                self.values,
+            ),
+        )
+
+    def attach(self) -> BaseTimeSeries:
+        """Materialise the block in this process, taking ownership of the segment.
+
+        The segment name is unlinked immediately; the mapping stays valid for as long as
+        the returned values, or any view of them, are alive.
+        """
+
+        values = self.values
+        if values is None:
+            assert self.segment is not None
+            segment = shared_memory.SharedMemory(name=self.segment)
+            segment.unlink()
+            values = np.ndarray(
+                self.shape, dtype=np.dtype(self.dtype), buffer=_MappedSegment(segment)
+            )
+
+        return BaseTimeSeries(
+            values=values,
+            sample_rate=self.sample_rate,
+            start_timestamp=self.start_timestamp,
+            metadata=self.metadata,
+        )
+
+    def release(self) -> None:
+        """Discard the segment without reading it."""
+
+        if self.segment is None:
+            return
+        segment = shared_memory.SharedMemory(name=self.segment)
+        segment.close()
+        segment.unlink()
+
+
+def share_timeseries(
+    series: BaseTimeSeries,
+    *,
+    min_bytes: int = SHARE_MIN_BYTES,
+) -> SharedTimeSeries:
+    """Return a handle that moves ``series`` to another process with one copy.
+
+    Values of at least ``min_bytes`` are copied into a new shared-memory segment whose
+    ownership passes to whichever process calls ``attach`` or ``release`` on the handle;
+    smaller values are carried inline.
+    """
+
+    values = np.ascontiguousarray(series.values)
+    fields = dict(
+        shape=tuple(values.shape),
+        dtype=values.dtype.str,
+        sample_rate=series.sample_rate,
+        start_timestamp=series.start_timestamp,
+        metadata=dict(series.metadata or {}),
+    )
+    if values.nbytes < min_bytes:
+        return SharedTimeSeries(segment=None, values=values, **fields)
+
+    segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        target = np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)
+        target[...] = values
+        del target
+    finally:
+        segment.close()
+    return SharedTimeSeries(segment=segment.name, **fields)
@@ -1,23 +1,55 @@
 """I/O layer exports."""
 
-from .adapters import DataSourceAdapter, IterableDataSourceAdapter, SequenceDataSourceAdapter
-from .dataloader import StreamDataLoader
+from .adapters import (
+    AsyncDataSourceAdapter,
+    DataSourceAdapter,
+    IterableDataSourceAdapter,
+    MemmapDataSourceAdapter,
+    SequenceDataSourceAdapter,
+    StreamingIterableDataSourceAdapter,
+)
+from .blocklog import BlockLogDataset, BlockLogWriter
+from .dataloader import PrefetchStats, StreamDataLoader
 from .dataset import (
     AdapterStreamDataset,
     BufferedStreamDataset,
     CollatedStreamDataset,
     IteratorStreamDataset,
+    MultiSensorStreamDataset,
+    RechunkStreamDataset,
     StreamDataset,
 )
+from .sinks import (
+    BlockLogSink,
+    CallbackSink,
+    DataSinkAdapter,
+    OverflowPolicy,
+    SinkStage,
+    SinkStats,
+)
 
 __all__ = [
     "AdapterStreamDataset",
+    "AsyncDataSourceAdapter",
+    "BlockLogDataset",
+    "BlockLogSink",
+    "BlockLogWriter",
     "BufferedStreamDataset",
+    "CallbackSink",
     "CollatedStreamDataset",
+    "DataSinkAdapter",
     "DataSourceAdapter",
     "IterableDataSourceAdapter",
     "IteratorStreamDataset",
+    "MemmapDataSourceAdapter",
+    "MultiSensorStreamDataset",
+    "OverflowPolicy",
+    "PrefetchStats",
+    "RechunkStreamDataset",
     "SequenceDataSourceAdapter",
+    "SinkStage",
+    "SinkStats",
     "StreamDataLoader",
     "StreamDataset",
+    "StreamingIterableDataSourceAdapter",
 ]
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
-from typing import Generic, Iterable, Iterator, List, Sequence, TypeVar
+from datetime import datetime, timedelta
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Mapping, Sequence, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.data.models import _ensure_datetime
 
 T = TypeVar("T")
 
@@ -21,6 +29,19 @@ class DataSourceAdapter(Generic[T], ABC):
         raise NotImplementedError
 
 
+class AsyncDataSourceAdapter(Generic[T], ABC):
+    """Abstract interface for sources that deliver blocks from an event loop."""
+
+    @abstractmethod
+    async def aread_block(self) -> T | None:
+        """Await the next raw block or return ``None`` when the stream is exhausted."""
+
+    def reset(self) -> None:
+        """Reset the stream to its initial position if supported."""
+
+        raise NotImplementedError
+
+
 class IterableDataSourceAdapter(DataSourceAdapter[T]):
     """Simple adapter that steps through an in-memory iterable."""
 
@@ -54,14 +75,176 @@ class IterableDataSourceAdapter(DataSourceAdapter[T]):
         return len(self._original)
 
 
+class StreamingIterableDataSourceAdapter(DataSourceAdapter[T]):
+    """Adapter that pulls lazily from an iterable instead of materialising it.
+
+    ``data`` is either an iterable or a zero-argument factory returning a fresh iterable.
+    ``reset()`` and ``cycle=True`` restart the stream by calling the factory. Without a
+    factory they replay the first ``replay_cache`` items held in a bounded cache and then
+    continue from the live iterator, which only works while no more than ``replay_cache``
+    items have been consumed (or the stream ended within that bound). With ``cycle=True``
+    and no factory, reading past ``replay_cache`` items raises ``ValueError`` at once
+    instead of failing when the stream wraps around.
+    """
+
+    def __init__(
+        self,
+        data: Iterable[T] | Callable[[], Iterable[T]],
+        *,
+        cycle: bool = False,
+        replay_cache: int = 0,
+    ) -> None:
+        if replay_cache < 0:
+            raise ValueError("replay_cache must be non-negative")
+        if callable(data) and not isinstance(data, Iterable):
+            self._factory: Callable[[], Iterable[T]] | None = data
+            self._live: Iterator[T] = iter(data())
+        else:
+            self._factory = None
+            self._live = iter(data)  # type: ignore[arg-type]
+        if cycle and self._factory is None and replay_cache == 0:
+            raise ValueError("cycle=True requires a factory or a replay_cache")
+        self._cycle = cycle
+        self._cache_limit = replay_cache
+        self._cache: List[T] = []
+        self._pulled = 0
+        self._live_done = False
+        self._replay_cursor: int | None = None
+
+    def read_block(self) -> T | None:
+        item = self._next_item()
+        if item is not None or not self._cycle:
+            return item
+
+        self.reset()
+        return self._next_item()
+
+    def _next_item(self) -> T | None:
+        if self._replay_cursor is not None:
+            if self._replay_cursor < len(self._cache):
+                item = self._cache[self._replay_cursor]
+                self._replay_cursor += 1
+                return item
+            self._replay_cursor = None
+
+        if self._live_done:
+            return None
+
+        try:
+            item = next(self._live)
+        except StopIteration:
+            self._live_done = True
+            return None
+
+        self._pulled += 1
+        if self._pulled <= self._cache_limit:
+            self._cache.append(item)
+        elif self._cycle and self._factory is None:
+            raise ValueError(
+                f"cycle=True without a factory replays at most replay_cache={self._cache_limit} "
+                "items, but the stream is longer; pass a factory or a larger replay_cache"
+            )
+        return item
+
+    def reset(self) -> None:
+        if self._factory is not None:
+            self._live = iter(self._factory())
+            self._live_done = False
+            self._replay_cursor = None
+            self._pulled = 0
+            self._cache.clear()
+            return
+
+        if self._pulled > self._cache_limit:
+            raise NotImplementedError(
+                f"Cannot rewind: {self._pulled} items consumed but only "
+                f"{self._cache_limit} cached and no factory was given"
+            )
+        self._replay_cursor = 0
+
+
+class _ArrayBlockAdapter(DataSourceAdapter[BaseTimeSeries]):
+    """Slices fixed-size blocks out of one array as views along the first axis."""
+
+    def __init__(
+        self,
+        array: npt.NDArray[Any],
+        *,
+        block_size: int,
+        sample_rate: float,
+        start_timestamp: datetime | float | int | str = 0.0,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        if sample_rate <= 0:
+            raise ValueError("sample_rate must be positive")
+        if array.ndim == 0:
+            raise ValueError("array must be at least 1-D")
+        self._array = array
+        self._block_size = block_size
+        self._sample_rate = float(sample_rate)
+        self._origin = _ensure_datetime(start_timestamp)
+        self._metadata = dict(metadata or {})
+        self._cursor = 0
+
+    def read_block(self) -> BaseTimeSeries | None:
+        start = self._cursor
+        if start >= self._array.shape[0]:
+            return None
+
+        self._cursor = start + self._block_size
+        return BaseTimeSeries(
+            values=self._array[start : self._cursor],
+            sample_rate=self._sample_rate,
+            start_timestamp=self._origin + timedelta(seconds=start / self._sample_rate),
+            metadata=self._metadata,
+        )
+
+    def reset(self) -> None:
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return -(-self._array.shape[0] // self._block_size)
+
+
 class SequenceDataSourceAdapter(DataSourceAdapter[T]):
-    """Adapter backed by a random-access sequence."""
+    """Adapter backed by a random-access sequence.
 
-    def __init__(self, data: Sequence[T]) -> None:
+    When ``data`` is a single NumPy array and ``block_size`` is given, fixed-size blocks are
+    sliced as views along the first axis and returned as ready ``BaseTimeSeries`` (which
+    ``collate_block`` passes through untouched) instead of indexing sample by sample.
+    """
+
+    def __init__(
+        self,
+        data: Sequence[T] | npt.NDArray[Any],
+        *,
+        block_size: int | None = None,
+        sample_rate: float | None = None,
+        start_timestamp: datetime | float | int | str = 0.0,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
         self._data = data
         self._cursor = 0
+        self._blocks: _ArrayBlockAdapter | None = None
+        if block_size is not None:
+            if not isinstance(data, np.ndarray):
+                raise TypeError("block_size requires data to be a NumPy array")
+            if sample_rate is None:
+                raise ValueError("block_size requires sample_rate")
+            self._blocks = _ArrayBlockAdapter(
+                data,
+                block_size=block_size,
+                sample_rate=sample_rate,
+                start_timestamp=start_timestamp,
+                metadata=metadata,
+            )
 
     def read_block(self) -> T | None:
+        if self._blocks is not None:
+            return self._blocks.read_block()  # type: ignore[return-value]
+
         if self._cursor >= len(self._data):
             return None
 
@@ -70,7 +253,67 @@ class SequenceDataSourceAdapter(DataSourceAdapter[T]):
         return item
 
     def reset(self) -> None:
+        if self._blocks is not None:
+            self._blocks.reset()
         self._cursor = 0
 
     def __len__(self) -> int:
+        if self._blocks is not None:
+            return len(self._blocks)
         return len(self._data)
+
+
+class MemmapDataSourceAdapter(_ArrayBlockAdapter):
+    """Adapter that replays a recording on disk through ``numpy.memmap`` views.
+
+    ``.npy`` files carry their own dtype and shape. Any other file is treated as raw
+    interleaved samples and needs ``dtype`` and ``channels``; trailing bytes that do not
+    form a whole frame are ignored. The final block is shorter when the sample count is
+    not a multiple of ``block_size``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        block_size: int,
+        sample_rate: float,
+        dtype: npt.DTypeLike | None = None,
+        channels: int | None = None,
+        offset: int = 0,
+        start_timestamp: datetime | float | int | str = 0.0,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._path = os.fspath(path)
+        if self._path.endswith(".npy"):
+            array = np.load(self._path, mmap_mode="r")
+        else:
+            if dtype is None or channels is None:
+                raise ValueError("Raw recordings require dtype and channels")
+            if channels <= 0:
+                raise ValueError("channels must be positive")
+            frame_bytes = np.dtype(dtype).itemsize * channels
+            frames = (os.path.getsize(self._path) - offset) // frame_bytes
+            if frames <= 0:
+                raise ValueError(f"Recording {self._path!r} holds no complete frame")
+            array = np.memmap(
+                self._path,
+                dtype=dtype,
+                mode="r",
+                offset=offset,
+                shape=(frames, channels),
+            )
+
+        super().__init__(
+            array,
+            block_size=block_size,
+            sample_rate=sample_rate,
+            start_timestamp=start_timestamp,
+            metadata=metadata,
+        )
+
+    @property
+    def num_samples(self) -> int:
+        """Number of samples in the recording, read from the header only."""
+
+        return int(self._array.shape[0])
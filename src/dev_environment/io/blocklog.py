@@ -0,0 +1,266 @@
+"""Append-only on-disk block log for recording and replaying ``BaseTimeSeries`` streams.
+
+File layout (little endian)::
+
+    header   magic, version, index offset/count, tables offset/length
+    records  raw sample values per block, each aligned to ``_ALIGNMENT`` bytes
+    tables   JSON with the distinct layouts (dtype, trailing shape, sample rate) and the
+             distinct metadata mappings, each stored once
+    index    one fixed-size row per block: value offset, sample count, start time in
+             microseconds since the epoch, layout id and metadata id
+
+The tables and index are written by ``BlockLogWriter.close``; a log that was never closed
+has no index and cannot be opened for replay.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.data.models import _ensure_datetime
+
+from .dataset import StreamDataset
+
+_MAGIC = b"DEVBLOG1"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQQ")
+_ALIGNMENT = 64
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SCALARS = (str, int, float, bool, type(None))
+_INDEX_DTYPE = np.dtype(
+    [
+        ("offset", "<u8"),
+        ("samples", "<u8"),
+        ("start_us", "<i8"),
+        ("layout", "<u4"),
+        ("metadata", "<u4"),
+    ]
+)
+
+
+def _to_microseconds(timestamp: datetime) -> int:
+    # Naive timestamps are taken as UTC, as ``_ensure_datetime`` does for strings.
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+
+def _same_metadata(metadata: Mapping[str, Any], previous: Mapping[str, Any]) -> bool:
+    if metadata.keys() != previous.keys():
+        return False
+    for key, value in metadata.items():
+        other = previous[key]
+        if value is other:
+            continue
+        scalar = type(value) in _SCALARS or isinstance(value, np.generic)
+        if not scalar or type(value) is not type(other) or value != other:
+            return False
+    return True
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Metadata value of type {type(value)!r} is not serialisable")
+
+
+class BlockLogWriter:
+    """Sink that appends blocks to a block log file.
+
+    Metadata is compared by its JSON encoding, which is skipped when every value is the
+    same object as in the previous block or a plain scalar of the same type and value;
+    distinct encodings are stored once in the tables section and referenced by id from
+    the index.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = os.fspath(path)
+        self._file = open(self._path, "wb")
+        self._file.write(b"\0" * _HEADER.size)
+        self._position = _HEADER.size
+        self._rows: list[tuple[int, int, int, int, int]] = []
+        self._layouts: list[tuple[str, tuple[int, ...], float]] = []
+        self._layout_ids: dict[tuple[str, tuple[int, ...], float], int] = {}
+        self._metadata: list[str] = []
+        self._metadata_ids: dict[str, int] = {}
+        self._last_source: Mapping[str, Any] | None = None
+        self._last_metadata: str | None = None
+        self._last_metadata_id = 0
+        self._closed = False
+
+    def write(self, block: BaseTimeSeries) -> int:
+        """Append ``block`` and return its index in the log."""
+
+        if self._closed:
+            raise ValueError("BlockLogWriter is closed")
+
+        values = np.ascontiguousarray(block.values)
+        layout = (values.dtype.str, tuple(values.shape[1:]), float(block.sample_rate))
+        layout_id = self._layout_ids.get(layout)
+        if layout_id is None:
+            layout_id = self._layout_ids[layout] = len(self._layouts)
+            self._layouts.append(layout)
+
+        # Compare encoded forms: values such as arrays have no boolean equality.
+        metadata = block.metadata or {}
+        if self._last_source is None or not _same_metadata(metadata, self._last_source):
+            encoded = json.dumps(metadata, sort_keys=True, default=_json_default)
+            if encoded != self._last_metadata:
+                metadata_id = self._metadata_ids.get(encoded)
+                if metadata_id is None:
+                    metadata_id = self._metadata_ids[encoded] = len(self._metadata)
+                    self._metadata.append(encoded)
+                self._last_metadata = encoded
+                self._last_metadata_id = metadata_id
+            self._last_source = metadata
+
+        padding = -self._position % _ALIGNMENT
+        if padding:
+            self._file.write(b"\0" * padding)
+            self._position += padding
+
+        offset = self._position
+        self._file.write(memoryview(values).cast("B"))
+        self._position += values.nbytes
+        self._rows.append(
+            (
+                offset,
+                values.shape[0],
+                _to_microseconds(block.start_timestamp),
+                layout_id,
+                self._last_metadata_id,
+            )
+        )
+        return len(self._rows) - 1
+
+    def close(self) -> None:
+        """Write the tables and index and finalise the header."""
+
+        if self._closed:
+            return
+
+        tables = json.dumps(
+            {
+                "layouts": [[dtype, list(shape), rate] for dtype, shape, rate in self._layouts],
+                "metadata": self._metadata,
+            }
+        ).encode("utf-8")
+        tables_offset = self._position
+        self._file.write(tables)
+        self._position += len(tables)
+
+        padding = -self._position % _ALIGNMENT
+        self._file.write(b"\0" * padding)
+        self._position += padding
+        index = np.array(self._rows, dtype=_INDEX_DTYPE)
+        self._file.write(index.tobytes())
+
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                0,
+                self._position,
+                len(self._rows),
+                tables_offset,
+                len(tables),
+            )
+        )
+        self._file.close()
+        self._closed = True
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self) -> "BlockLogWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class BlockLogDataset(StreamDataset[BaseTimeSeries]):
+    """Replays a block log through a read-only memory map.
+
+    Block values are views into the mapping. ``seek`` positions the cursor by block index
+    and ``seek_time`` by timestamp with a binary search over the in-file index, which
+    assumes blocks were written in non-decreasing timestamp order. Metadata round-trips
+    through JSON, so tuples come back as lists.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = os.fspath(path)
+        self._map = np.memmap(self._path, dtype=np.uint8, mode="r")
+        header = _HEADER.unpack_from(self._map, 0)
+        magic, version, _, index_offset, count, tables_offset, tables_length = header
+        if magic != _MAGIC:
+            raise ValueError(f"{self._path!r} is not a block log")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported block log version {version}")
+        if index_offset == 0:
+            raise ValueError(f"Block log {self._path!r} was not closed")
+
+        tables = json.loads(bytes(self._map[tables_offset : tables_offset + tables_length]))
+        self._layouts = [
+            (np.dtype(dtype), tuple(shape), float(rate)) for dtype, shape, rate in tables["layouts"]
+        ]
+        self._metadata = [json.loads(encoded) for encoded in tables["metadata"]]
+        self._index = np.ndarray(
+            (count,),
+            dtype=_INDEX_DTYPE,
+            buffer=self._map,
+            offset=index_offset,
+        )
+        self._cursor = 0
+
+    def block_at(self, position: int) -> BaseTimeSeries:
+        """Return the block stored at ``position`` without moving the cursor."""
+
+        offset, samples, start_us, layout_id, metadata_id = self._index[position].tolist()
+        dtype, tail, sample_rate = self._layouts[layout_id]
+        values = np.ndarray((samples, *tail), dtype=dtype, buffer=self._map, offset=offset)
+        return BaseTimeSeries(
+            values=values,
+            sample_rate=sample_rate,
+            start_timestamp=_EPOCH + timedelta(microseconds=start_us),
+            metadata=self._metadata[metadata_id],
+        )
+
+    def next_block(self) -> BaseTimeSeries | None:
+        if self._cursor >= len(self._index):
+            return None
+        block = self.block_at(self._cursor)
+        self._cursor += 1
+        return block
+
+    def seek(self, position: int) -> None:
+        """Move the cursor so that the next block returned is ``position``."""
+
+        if not 0 <= position <= len(self._index):
+            raise IndexError(f"Block index {position} out of range")
+        self._cursor = position
+
+    def seek_time(self, timestamp: datetime | float | int | str) -> int:
+        """Move the cursor to the last block starting at or before ``timestamp``."""
+
+        target = _to_microseconds(_ensure_datetime(timestamp))
+        position = int(np.searchsorted(self._index["start_us"], target, side="right"))
+        self._cursor = max(position - 1, 0)
+        return self._cursor
+
+    def reset(self) -> None:
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
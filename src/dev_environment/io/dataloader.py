@@ -2,19 +2,203 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
-from typing import Generic, TypeVar
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
 
-from dev_environment.data import BaseTimeSeries, collate_block
+from dev_environment.data import (
+    BaseTimeSeries,
+    SharedTimeSeries,
+    TimeSeriesBatch,
+    collate_block,
+    share_timeseries,
+)
 
 from .dataset import StreamDataset
 
 RawBlock = TypeVar("RawBlock")
 Block = TypeVar("Block", bound=BaseTimeSeries)
 
+_END = object()
+
+
+@dataclass(slots=True, frozen=True)
+class PrefetchStats:
+    """Snapshot of the prefetch ring occupancy and hand-off counters."""
+
+    capacity: int
+    depth: int
+    peak_depth: int
+    consumer_waits: int
+    producer_waits: int
+
+
+@dataclass(slots=True, frozen=True)
+class _PrefetchError:
+    error: BaseException
+
+
+class _Prefetcher:
+    """Background thread that fills a bounded ring with ready blocks."""
+
+    def __init__(self, fetch: Callable[[], Any], capacity: int) -> None:
+        self._fetch = fetch
+        self._capacity = capacity
+        self._ring: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._peak_depth = 0
+        self._consumer_waits = 0
+        self._producer_waits = 0
+        self._thread = threading.Thread(target=self._run, name="StreamDataLoader-prefetch")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        with self._cond:
+            if len(self._ring) >= self._capacity and not self._stopped:
+                self._producer_waits += 1
+                while len(self._ring) >= self._capacity and not self._stopped:
+                    self._cond.wait()
+            if self._stopped:
+                return False
+            self._ring.append(item)
+            self._peak_depth = max(self._peak_depth, len(self._ring))
+            self._cond.notify_all()
+            return True
+
+    def _run(self) -> None:
+        while True:
+            try:
+                block = self._fetch()
+            except BaseException as error:  # forwarded to the consumer thread
+                self._put(_PrefetchError(error))
+                return
+
+            if block is None:
+                self._put(_END)
+                return
+
+            if not self._put(block):
+                return
+
+    def get(self) -> Any:
+        with self._cond:
+            if not self._ring:
+                self._consumer_waits += 1
+                while not self._ring:
+                    self._cond.wait()
+            item = self._ring.popleft()
+            self._cond.notify_all()
+
+        if isinstance(item, _PrefetchError):
+            raise item.error
+        return item
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._ring.clear()
+            self._cond.notify_all()
+        self._thread.join()
+
+    def stats(self) -> PrefetchStats:
+        with self._cond:
+            return PrefetchStats(
+                capacity=self._capacity,
+                depth=len(self._ring),
+                peak_depth=self._peak_depth,
+                consumer_waits=self._consumer_waits,
+                producer_waits=self._producer_waits,
+            )
+
+
+_WORKER_STATE: tuple[Callable[[Any], Any] | None, Callable[[Any], BaseTimeSeries]] | None = None
+
+
+def _init_worker(
+    transform: Callable[[Any], Any] | None,
+    collate_fn: Callable[[Any], BaseTimeSeries],
+) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (transform, collate_fn)
+
+
+def _collate_in_worker(raw: Any) -> SharedTimeSeries:
+    assert _WORKER_STATE is not None
+    transform, collate_fn = _WORKER_STATE
+    sample = raw if transform is None else transform(raw)
+    return share_timeseries(collate_fn(sample))
+
+
+class _WorkerPool:
+    """Process pool that collates raw blocks and hands them back in submission order."""
+
+    def __init__(
+        self,
+        num_workers: int,
+        *,
+        transform: Callable[[Any], Any] | None,
+        collate_fn: Callable[[Any], BaseTimeSeries],
+        mp_context: str | None,
+    ) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(transform, collate_fn),
+        )
+        self._pending: deque[Future[SharedTimeSeries]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, raw: Any) -> None:
+        self._pending.append(self._executor.submit(_collate_in_worker, raw))
+
+    def pop(self) -> BaseTimeSeries:
+        return self._pending.popleft().result().attach()
+
+    def discard(self) -> None:
+        """Drop queued results, releasing the shared-memory segments they own."""
+
+        while self._pending:
+            future = self._pending.popleft()
+            try:
+                handle = future.result()
+            except Exception:
+                continue
+            handle.release()
+
+    def shutdown(self) -> None:
+        self.discard()
+        self._executor.shutdown()
+
 
 class StreamDataLoader(Generic[RawBlock, Block]):
-    """Serial data loader that fetches one block at a time."""
+    """Serial data loader that fetches one block at a time.
+
+    With ``prefetch=N`` a background thread reads and collates up to ``N`` blocks ahead of
+    the consumer so that source I/O overlaps with node execution. Block order, ``max_blocks``
+    and exhaustion behave exactly as in the serial mode.
+
+    With ``num_workers=N`` the dataset ``transform`` and ``collate_fn`` run in a pool of
+    ``N`` processes while raw reads stay on the calling thread. Results come back through
+    shared memory and are emitted in source order. Both callables must be picklable.
+
+    With ``batch_size=K`` each item is a ``TimeSeriesBatch`` stacking up to ``K``
+    consecutive blocks; a block whose shape or sample rate differs from the current batch
+    starts the next one. ``max_blocks`` and ``consumed_blocks`` still count single blocks.
+
+    ``anext_block`` and ``async for`` provide an event-loop path for datasets backed by an
+    ``AsyncDataSourceAdapter``; prefetching, worker processes and batching apply to the
+    synchronous path only.
+    """
 
     def __init__(
         self,
@@ -22,18 +206,59 @@ class StreamDataLoader(Generic[RawBlock, Block]):
         *,
         collate_fn: Callable[[RawBlock], Block] = collate_block,
         max_blocks: int | None = None,
+        prefetch: int = 0,
+        num_workers: int = 0,
+        mp_context: str | None = None,
+        batch_size: int = 1,
     ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if prefetch < 0:
+            raise ValueError("prefetch must be non-negative")
+        if num_workers < 0:
+            raise ValueError("num_workers must be non-negative")
         self._dataset = dataset
         self._collate_fn = collate_fn
         self._max_blocks = max_blocks
+        self._prefetch = prefetch
+        self._prefetcher: _Prefetcher | None = None
+        self._last_stats: PrefetchStats | None = None
+        self._num_workers = num_workers
+        self._mp_context = mp_context
+        self._workers: _WorkerPool | None = None
+        self._submitted = 0
+        self._source_done = False
+        self._batch_size = batch_size
+        self._held: Block | None = None
         self._consumed = 0
         self._exhausted = False
 
     def reset(self) -> None:
+        self._stop_prefetch()
+        if self._workers is not None:
+            self._workers.discard()
         self._dataset.reset()
+        self._last_stats = None
+        self._submitted = 0
+        self._source_done = False
+        self._held = None
         self._consumed = 0
         self._exhausted = False
 
+    def close(self) -> None:
+        """Stop background threads and worker processes, discarding read-ahead blocks."""
+
+        self._stop_prefetch()
+        if self._workers is not None:
+            self._workers.shutdown()
+            self._workers = None
+
+    def _stop_prefetch(self) -> None:
+        if self._prefetcher is not None:
+            self._last_stats = self._prefetcher.stats()
+            self._prefetcher.stop()
+            self._prefetcher = None
+
     def __iter__(self) -> Iterator[Block]:
         self.reset()
         return self
@@ -44,7 +269,17 @@ class StreamDataLoader(Generic[RawBlock, Block]):
             raise StopIteration
         return block
 
-    def next_block(self) -> Block | None:
+    def __aiter__(self) -> AsyncIterator[Block]:
+        self.reset()
+        return self
+
+    async def __anext__(self) -> Block:
+        block = await self.anext_block()
+        if block is None:
+            raise StopAsyncIteration
+        return block
+
+    async def anext_block(self) -> Block | None:
         if self._exhausted:
             return None
 
@@ -52,7 +287,7 @@ class StreamDataLoader(Generic[RawBlock, Block]):
             self._exhausted = True
             return None
 
-        raw_block = self._dataset.next_block()
+        raw_block = await self._dataset.anext_block()
         if raw_block is None:
             self._exhausted = True
             return None
@@ -61,6 +296,118 @@ class StreamDataLoader(Generic[RawBlock, Block]):
         self._consumed += 1
         return block
 
+    def next_block(self) -> Block | None:
+        if self._batch_size == 1:
+            return self._next_single()
+        return self._next_batch()  # type: ignore[return-value]
+
+    def _next_batch(self) -> TimeSeriesBatch | None:
+        blocks: list[BaseTimeSeries] = []
+        if self._held is not None:
+            blocks.append(self._held)
+            self._held = None
+
+        while len(blocks) < self._batch_size:
+            block = self._next_single()
+            if block is None:
+                break
+            if blocks and (
+                block.values.shape != blocks[0].values.shape
+                or block.sample_rate != blocks[0].sample_rate
+            ):
+                self._held = block
+                break
+            blocks.append(block)
+
+        if not blocks:
+            return None
+        return TimeSeriesBatch.stack(blocks)
+
+    def _next_single(self) -> Block | None:
+        if self._exhausted:
+            return None
+
+        if self._prefetch:
+            return self._next_prefetched()
+
+        if self._max_blocks is not None and self._consumed >= self._max_blocks:
+            self._exhausted = True
+            return None
+
+        block = self._read_next()
+        if block is None:
+            self._exhausted = True
+            return None
+
+        self._consumed += 1
+        return block
+
+    def _read_next(self) -> Block | None:
+        if self._num_workers:
+            return self._read_next_from_workers()
+
+        raw_block = self._dataset.next_block()
+        if raw_block is None:
+            return None
+        return self._collate_fn(raw_block)
+
+    def _read_next_from_workers(self) -> Block | None:
+        if self._workers is None:
+            self._workers = _WorkerPool(
+                self._num_workers,
+                transform=self._dataset.transform,
+                collate_fn=self._collate_fn,
+                mp_context=self._mp_context,
+            )
+
+        window = self._num_workers * 2
+        while not self._source_done and self._workers.in_flight < window:
+            if self._max_blocks is not None and self._submitted >= self._max_blocks:
+                self._source_done = True
+                break
+            raw_block = self._dataset.next_raw_block()
+            if raw_block is None:
+                self._source_done = True
+                break
+            self._workers.submit(raw_block)
+            self._submitted += 1
+
+        if not self._workers.in_flight:
+            return None
+        return self._workers.pop()  # type: ignore[return-value]
+
+    def _next_prefetched(self) -> Block | None:
+        if self._prefetcher is None:
+            self._prefetcher = _Prefetcher(self._make_fetch(), self._prefetch)
+
+        try:
+            item = self._prefetcher.get()
+        except BaseException:
+            self._exhausted = True
+            self._stop_prefetch()
+            raise
+
+        if item is _END:
+            self._exhausted = True
+            self._stop_prefetch()
+            return None
+
+        self._consumed += 1
+        return item
+
+    def _make_fetch(self) -> Callable[[], Block | None]:
+        remaining = None if self._max_blocks is None else self._max_blocks - self._consumed
+
+        def fetch() -> Block | None:
+            nonlocal remaining
+            if remaining is not None:
+                if remaining <= 0:
+                    return None
+                remaining -= 1
+            return self._read_next()
+
+        return fetch
+
     @property
     def consumed_blocks(self) -> int:
         """Return the total number of blocks emitted since the last reset."""
@@ -71,4 +418,22 @@ class StreamDataLoader(Generic[RawBlock, Block]):
     def is_exhausted(self) -> bool:
         """Whether the loader has no more blocks to provide."""
 
-        return self._exhausted
+        return self._exhausted and self._held is None
+
+    @property
+    def prefetch_stats(self) -> PrefetchStats | None:
+        """Queue-depth counters of the prefetch ring, or ``None`` in serial mode."""
+
+        if not self._prefetch:
+            return None
+        if self._prefetcher is not None:
+            return self._prefetcher.stats()
+        if self._last_stats is not None:
+            return self._last_stats
+        return PrefetchStats(
+            capacity=self._prefetch,
+            depth=0,
+            peak_depth=0,
+            consumer_waits=0,
+            producer_waits=0,
+        )
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import Callable, Generic, Iterator, List, Optional, Sequence, TypeVar
-
-from dev_environment.data import collate_block
-
-from .adapters import DataSourceAdapter
+from collections import deque
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import numpy as np
+
+from dev_environment.data import BaseTimeSeries, MultiSensorBlock, collate_block
+from dev_environment.data.models import _ensure_datetime
+
+from .adapters import AsyncDataSourceAdapter, DataSourceAdapter
 
 RawBlock = TypeVar("RawBlock")
 Block = TypeVar("Block")
@@ -27,10 +44,40 @@ class StreamDataset(ABC, Generic[Block]):
                 break
             yield block
 
+    def __aiter__(self) -> AsyncIterator[Block]:
+        return self.astream()
+
+    async def astream(self) -> AsyncIterator[Block]:
+        while True:
+            block = await self.anext_block()
+            if block is None:
+                break
+            yield block
+
     @abstractmethod
     def next_block(self) -> Block | None:
         """Return the next block or ``None`` when the dataset is exhausted."""
 
+    async def anext_block(self) -> Block | None:
+        """Await the next block; synchronous datasets simply delegate to ``next_block``."""
+
+        return self.next_block()
+
+    def next_raw_block(self) -> object | None:
+        """Return the next block before ``transform`` is applied.
+
+        Loaders that move the transform off the consumer thread call this together with
+        ``transform``; datasets without a separable transform return finished blocks here.
+        """
+
+        return self.next_block()
+
+    @property
+    def transform(self) -> Callable[[Any], Block] | None:
+        """Callable turning ``next_raw_block`` output into a block, if separable."""
+
+        return None
+
     def reset(self) -> None:
         """Reset the dataset to its initial position if supported."""
 
@@ -61,23 +108,42 @@ class IteratorStreamDataset(StreamDataset[Block]):
 
 
 class AdapterStreamDataset(StreamDataset[Block], Generic[RawBlock, Block]):
-    """Dataset that wraps a ``DataSourceAdapter`` with optional transformation."""
+    """Dataset that wraps a ``DataSourceAdapter`` with optional transformation.
+
+    ``AsyncDataSourceAdapter`` sources are only readable through ``anext_block``.
+    """
 
     def __init__(
         self,
-        source: DataSourceAdapter[RawBlock],
+        source: DataSourceAdapter[RawBlock] | AsyncDataSourceAdapter[RawBlock],
         *,
         transform: Callable[[RawBlock], Block] | None = None,
     ) -> None:
         self._source = source
-        self._transform = transform or (lambda item: item)  # type: ignore[assignment]
+        self._transform = transform
 
     def next_block(self) -> Block | None:
-        raw = self._source.read_block()
-        if raw is None:
-            return None
+        return self._apply(self.next_raw_block())
+
+    async def anext_block(self) -> Block | None:
+        if isinstance(self._source, AsyncDataSourceAdapter):
+            return self._apply(await self._source.aread_block())
+        return self.next_block()
+
+    def next_raw_block(self) -> RawBlock | None:
+        if isinstance(self._source, AsyncDataSourceAdapter):
+            raise TypeError("Asynchronous sources must be read with anext_block()")
+        return self._source.read_block()
+
+    def _apply(self, raw: RawBlock | None) -> Block | None:
+        if raw is None or self._transform is None:
+            return raw  # type: ignore[return-value]
         return self._transform(raw)
 
+    @property
+    def transform(self) -> Callable[[RawBlock], Block] | None:
+        return self._transform
+
     def reset(self) -> None:
         try:
             self._source.reset()
@@ -114,5 +180,208 @@ class BufferedStreamDataset(StreamDataset[Block]):
 class CollatedStreamDataset(AdapterStreamDataset[RawBlock, Block]):
     """Convenience wrapper that applies ``collate_block`` to raw samples."""
 
-    def __init__(self, source: DataSourceAdapter[RawBlock], transform=None) -> None:
+    def __init__(
+        self,
+        source: DataSourceAdapter[RawBlock] | AsyncDataSourceAdapter[RawBlock],
+        transform=None,
+    ) -> None:
         super().__init__(source, transform=transform or collate_block)
+
+
+class RechunkStreamDataset(StreamDataset[BaseTimeSeries]):
+    """Re-blocks a stream of arbitrary-length blocks into fixed-size blocks.
+
+    Give either ``block_size`` in samples or ``duration`` in seconds (converted with the
+    first block's sample rate). Whole blocks inside an incoming packet are emitted as views
+    of it; samples straddling packet boundaries are gathered in a carry buffer allocated
+    once. Output timestamps advance from the first input timestamp by emitted sample count,
+    so they stay sample-accurate regardless of packet jitter. Each output block carries the
+    metadata of the packet it starts in. A trailing partial block is emitted on exhaustion
+    unless ``drop_remainder`` is set.
+    """
+
+    def __init__(
+        self,
+        dataset: StreamDataset[Any],
+        *,
+        block_size: int | None = None,
+        duration: float | None = None,
+        drop_remainder: bool = False,
+    ) -> None:
+        if (block_size is None) == (duration is None):
+            raise ValueError("Specify exactly one of block_size or duration")
+        if block_size is not None and block_size <= 0:
+            raise ValueError("block_size must be positive")
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be positive")
+        self._dataset = dataset
+        self._requested_size = block_size
+        self._duration = duration
+        self._drop_remainder = drop_remainder
+        self._clear()
+
+    def _clear(self) -> None:
+        self._block_size = self._requested_size or 0
+        self._carry: np.ndarray | None = None
+        self._fill = 0
+        self._carry_metadata: Mapping[str, Any] = {}
+        self._sample_rate = 0.0
+        self._origin: datetime | None = None
+        self._emitted = 0
+        self._pending: deque[tuple[np.ndarray, Mapping[str, Any]]] = deque()
+        self._source_done = False
+
+    def next_block(self) -> BaseTimeSeries | None:
+        while not self._pending and not self._source_done:
+            self._accept(self._dataset.next_block())
+        return self._emit()
+
+    async def anext_block(self) -> BaseTimeSeries | None:
+        while not self._pending and not self._source_done:
+            self._accept(await self._dataset.anext_block())
+        return self._emit()
+
+    def _accept(self, raw: Any) -> None:
+        if raw is not None:
+            self._consume(collate_block(raw))
+            return
+        self._source_done = True
+        if self._fill and not self._drop_remainder:
+            assert self._carry is not None
+            self._pending.append((self._carry[: self._fill].copy(), self._carry_metadata))
+            self._fill = 0
+
+    def _emit(self) -> BaseTimeSeries | None:
+        if not self._pending:
+            return None
+        values, metadata = self._pending.popleft()
+        assert self._origin is not None
+        start = self._origin + timedelta(seconds=self._emitted / self._sample_rate)
+        self._emitted += values.shape[0]
+        return BaseTimeSeries(
+            values=values,
+            sample_rate=self._sample_rate,
+            start_timestamp=start,
+            metadata=metadata,
+        )
+
+    def _consume(self, packet: BaseTimeSeries) -> None:
+        values = packet.values
+        if self._carry is None:
+            self._sample_rate = packet.sample_rate
+            self._origin = _ensure_datetime(packet.start_timestamp)
+            if self._duration is not None:
+                self._block_size = max(1, round(self._duration * self._sample_rate))
+            self._carry = np.empty((self._block_size, *values.shape[1:]), dtype=values.dtype)
+        elif packet.sample_rate != self._sample_rate:
+            raise ValueError(
+                f"sample_rate changed from {self._sample_rate} to {packet.sample_rate}"
+            )
+        elif values.shape[1:] != self._carry.shape[1:]:
+            raise ValueError(
+                f"channel shape changed from {self._carry.shape[1:]} to {values.shape[1:]}"
+            )
+
+        size = self._block_size
+        total = values.shape[0]
+        position = 0
+        if self._fill:
+            position = min(size - self._fill, total)
+            self._carry[self._fill : self._fill + position] = values[:position]
+            self._fill += position
+            if self._fill < size:
+                return
+            self._pending.append((self._carry.copy(), self._carry_metadata))
+            self._fill = 0
+
+        whole = (total - position) // size
+        if whole:
+            stop = position + whole * size
+            chunks = values[position:stop].reshape(whole, size, *values.shape[1:])
+            self._pending.extend((chunk, packet.metadata) for chunk in chunks)
+            position = stop
+
+        if position < total:
+            self._fill = total - position
+            self._carry[: self._fill] = values[position:]
+            self._carry_metadata = packet.metadata
+
+    def reset(self) -> None:
+        self._dataset.reset()
+        self._clear()
+
+
+class MultiSensorStreamDataset(StreamDataset[MultiSensorBlock]):
+    """Merges several sensor streams into timestamp-aligned ``MultiSensorBlock`` items.
+
+    A heap keyed on ``start_timestamp`` always advances the sensor with the earliest
+    pending block, so the cost per emitted block is O(log n) in the number of sensors and
+    block sizes or sample rates may differ freely. Blocks sharing a start timestamp are
+    emitted together; each item maps every sensor seen so far to its latest block and
+    lists the sensors that changed in ``updated``. Exhausted sensors keep their last block
+    until all sensors are exhausted.
+    """
+
+    def __init__(self, sensors: Mapping[str, StreamDataset[Any]]) -> None:
+        if not sensors:
+            raise ValueError("MultiSensorStreamDataset needs at least one sensor")
+        self._names = tuple(sensors)
+        self._datasets = tuple(sensors.values())
+        self._index = {name: slot for slot, name in enumerate(self._names)}
+        self._clear()
+
+    def _clear(self) -> None:
+        self._latest: list[BaseTimeSeries | None] = [None] * len(self._names)
+        self._heap: list[tuple[datetime, int, BaseTimeSeries]] = []
+        self._primed = False
+
+    def _push(self, slot: int, raw: Any) -> None:
+        if raw is not None:
+            block = collate_block(raw)
+            heapq.heappush(self._heap, (block.start_timestamp, slot, block))
+
+    def _pop_earliest(self) -> tuple[datetime, list[int]]:
+        # Each sensor has at most one pending entry, so refilling only after this
+        # equal-timestamp sweep keeps a sensor from contributing twice to one block.
+        timestamp = self._heap[0][0]
+        slots: list[int] = []
+        while self._heap and self._heap[0][0] == timestamp:
+            _, slot, block = heapq.heappop(self._heap)
+            self._latest[slot] = block
+            slots.append(slot)
+        return timestamp, slots
+
+    def _merged(self, timestamp: datetime, slots: Sequence[int]) -> MultiSensorBlock:
+        updated = tuple(self._names[slot] for slot in slots)
+        return MultiSensorBlock(self._index, tuple(self._latest), timestamp, updated)
+
+    def next_block(self) -> MultiSensorBlock | None:
+        if not self._primed:
+            for slot, dataset in enumerate(self._datasets):
+                self._push(slot, dataset.next_block())
+            self._primed = True
+        if not self._heap:
+            return None
+
+        timestamp, slots = self._pop_earliest()
+        for slot in slots:
+            self._push(slot, self._datasets[slot].next_block())
+        return self._merged(timestamp, slots)
+
+    async def anext_block(self) -> MultiSensorBlock | None:
+        if not self._primed:
+            for slot, dataset in enumerate(self._datasets):
+                self._push(slot, await dataset.anext_block())
+            self._primed = True
+        if not self._heap:
+            return None
+
+        timestamp, slots = self._pop_earliest()
+        for slot in slots:
+            self._push(slot, await self._datasets[slot].anext_block())
+        return self._merged(timestamp, slots)
+
+    def reset(self) -> None:
+        for dataset in self._datasets:
+            dataset.reset()
+        self._clear()
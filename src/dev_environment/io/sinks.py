@@ -0,0 +1,249 @@
+"""Output sinks and the bounded background stage that feeds them."""
+
+from __future__ import annotations
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from dev_environment.data import BaseTimeSeries
+
+from .blocklog import BlockLogWriter
+
+_STOP = object()
+
+
+class DataSinkAdapter(ABC):
+    """Abstract interface that receives selected outputs of each processed block."""
+
+    @abstractmethod
+    def write(self, block_index: int, outputs: Mapping[str, BaseTimeSeries]) -> None:
+        """Deliver the outputs of block ``block_index``."""
+
+    def flush(self) -> None:
+        """Push buffered data to its destination."""
+
+    def close(self) -> None:
+        """Flush and release any resources held by the sink."""
+
+        self.flush()
+
+
+class CallbackSink(DataSinkAdapter):
+    """Forwards every block to ``callback(block_index, outputs)``."""
+
+    def __init__(self, callback: Callable[[int, Mapping[str, BaseTimeSeries]], Any]) -> None:
+        self._callback = callback
+
+    def write(self, block_index: int, outputs: Mapping[str, BaseTimeSeries]) -> None:
+        self._callback(block_index, outputs)
+
+
+class BlockLogSink(DataSinkAdapter):
+    """Appends each key to its own block log ``<directory>/<key>.blog``.
+
+    Logs are opened on the first block that carries the key and finalised on ``close``.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = os.fspath(directory)
+        self._writers: dict[str, BlockLogWriter] = {}
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key.replace(os.sep, '_')}.blog")
+
+    def write(self, block_index: int, outputs: Mapping[str, BaseTimeSeries]) -> None:
+        for key, block in outputs.items():
+            writer = self._writers.get(key)
+            if writer is None:
+                os.makedirs(self.directory, exist_ok=True)
+                writer = self._writers[key] = BlockLogWriter(self.path_for(key))
+            writer.write(block)
+
+    def close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+
+class OverflowPolicy(str, Enum):
+    """What ``SinkStage.submit`` does when the hand-off queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SAMPLE = "sample"
+
+
+@dataclass(slots=True, frozen=True)
+class SinkStats:
+    """Snapshot of a sink stage's queue occupancy and hand-off counters."""
+
+    capacity: int
+    depth: int
+    peak_depth: int
+    submitted: int
+    written: int
+    dropped: int
+    producer_waits: int
+
+
+class SinkStage:
+    """Background thread that hands selected keys to a sink through a bounded queue.
+
+    ``submit`` returns as soon as the block is queued, so a slow disk or log collector
+    only stalls block processing under ``OverflowPolicy.BLOCK``. When the queue is full,
+    ``DROP_OLDEST`` evicts the oldest queued block, and ``SAMPLE`` keeps one in every
+    ``sample_every`` offered blocks (evicting the oldest) and drops the rest until the
+    queue has room again. ``keys`` selects what is delivered; ``None`` forwards every
+    output of the block.
+
+    An exception raised by the sink is re-raised by the next ``submit``, ``flush`` or
+    ``close``; blocks dequeued before that are discarded. ``close`` drains the queue
+    before closing the sink.
+    """
+
+    def __init__(
+        self,
+        sink: DataSinkAdapter,
+        *,
+        keys: Sequence[str] | None = None,
+        capacity: int = 64,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        sample_every: int = 10,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if sample_every <= 0:
+            raise ValueError("sample_every must be positive")
+        self.sink = sink
+        self.keys = tuple(keys) if keys is not None else None
+        self._capacity = capacity
+        self._overflow = OverflowPolicy(overflow)
+        self._sample_every = sample_every
+        self._queue: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._error: BaseException | None = None
+        self._closed = False
+        self._overflowed = 0
+        self._peak_depth = 0
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._producer_waits = 0
+        self._thread: threading.Thread | None = None
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="SinkStage", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                item = self._queue.popleft()
+                if item is _STOP:
+                    return
+                self._busy = True
+                self._cond.notify_all()
+
+            block_index, outputs = item
+            try:
+                if self._error is None:
+                    self.sink.write(block_index, outputs)
+            except BaseException as error:  # re-raised on the producer side
+                with self._cond:
+                    self._error = error
+            with self._cond:
+                self._busy = False
+                if self._error is None:
+                    self._written += 1
+                self._cond.notify_all()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Sink failed while writing a block") from error
+
+    def submit(self, block_index: int, outputs: Mapping[str, BaseTimeSeries]) -> None:
+        """Queue the selected keys of one block without waiting for the sink."""
+
+        if self._closed:
+            raise ValueError("SinkStage is closed")
+        if self.keys is not None:
+            outputs = {key: outputs[key] for key in self.keys if key in outputs}
+        if not outputs:
+            return
+
+        self._start()
+        with self._cond:
+            self._raise_error()
+            self._submitted += 1
+            if len(self._queue) >= self._capacity:
+                if self._overflow is OverflowPolicy.BLOCK:
+                    self._producer_waits += 1
+                    while len(self._queue) >= self._capacity and self._error is None:
+                        self._cond.wait()
+                    self._raise_error()
+                elif self._overflow is OverflowPolicy.SAMPLE and (
+                    self._overflowed % self._sample_every
+                ):
+                    self._overflowed += 1
+                    self._dropped += 1
+                    return
+                else:
+                    self._overflowed += 1
+                    self._queue.popleft()
+                    self._dropped += 1
+            else:
+                self._overflowed = 0
+            self._queue.append((block_index, dict(outputs)))
+            self._peak_depth = max(self._peak_depth, len(self._queue))
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Wait until every queued block has reached the sink, then flush the sink."""
+
+        if self._thread is not None:
+            with self._cond:
+                while (self._queue or self._busy) and self._error is None:
+                    self._cond.wait()
+                self._raise_error()
+        self.sink.flush()
+
+    def close(self) -> None:
+        """Drain the queue, stop the worker and close the sink."""
+
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            if self._thread is not None:
+                with self._cond:
+                    self._queue.clear()
+                    self._queue.append(_STOP)
+                    self._cond.notify_all()
+                self._thread.join()
+                self._thread = None
+            self.sink.close()
+
+    def stats(self) -> SinkStats:
+        with self._cond:
+            return SinkStats(
+                capacity=self._capacity,
+                depth=len(self._queue),
+                peak_depth=self._peak_depth,
+                submitted=self._submitted,
+                written=self._written,
+                dropped=self._dropped,
+                producer_waits=self._producer_waits,
+            )
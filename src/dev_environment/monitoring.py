@@ -16,11 +16,22 @@ class ErrorPolicy(str, Enum):
 
 @dataclass(slots=True, frozen=True)
 class BlockSummary:
-    """Basic telemetry returned when a block completes."""
+    """Basic telemetry returned when a block completes.
+
+    ``duration_seconds`` covers node execution; ``latency_seconds`` runs from the request
+    to the loader until the outputs are ready, so it includes read time and, in pipelined
+    mode, time spent queued behind earlier blocks. ``skipped`` names the optional nodes
+    left out to meet the latency budget. ``cache_hits`` and ``cache_misses`` count result
+    cache lookups made for the block.
+    """
 
     block_index: int
     duration_seconds: float
     outputs: Mapping[str, object] | None
+    latency_seconds: float | None = None
+    skipped: tuple[str, ...] = ()
+    cache_hits: int = 0
+    cache_misses: int = 0
 
 
 @runtime_checkable
@@ -68,7 +79,15 @@ class ConsoleMonitor(PipelineMonitor):
 
     def on_block_end(self, summary: BlockSummary) -> None:
         duration = summary.duration_seconds
-        print(f"{self._prefix} block {summary.block_index} end duration={duration:.4f}s")
+        message = f"{self._prefix} block {summary.block_index} end duration={duration:.4f}s"
+        if summary.latency_seconds is not None:
+            message += f" latency={summary.latency_seconds:.4f}s"
+        lookups = summary.cache_hits + summary.cache_misses
+        if lookups:
+            message += f" cache={summary.cache_hits}/{lookups}"
+        if summary.skipped:
+            message += f" skipped={','.join(summary.skipped)}"
+        print(message)
 
     def on_node_start(self, block_index: int, node_name: str) -> None:
         print(f"{self._prefix} block {block_index} node {node_name} start")
@@ -6,9 +6,31 @@ from .base import (
     PipelineOrchestrator,
     ProcessingNode,
 )
+from .cache import CacheStats, NodeResultCache
+from .codegen import CompiledRunner
+from .fusion import FusedNode
+from .incremental import IntermediateStore, ReplayStreamDataset
+from .multistream import MultiStreamOrchestrator
 from .nodes import IdentityNode, MovingAverageNode, NormaliseAmplitudeNode
+from .plan import ExecutionPlan, NodeStep, compile_plan, prune_dead_nodes
+from .schedule import EveryNBlocks, OnTrigger, Periodic, RunCondition
 
 __all__ = [
+    "ExecutionPlan",
+    "NodeStep",
+    "compile_plan",
+    "CacheStats",
+    "NodeResultCache",
+    "CompiledRunner",
+    "FusedNode",
+    "IntermediateStore",
+    "ReplayStreamDataset",
+    "prune_dead_nodes",
+    "EveryNBlocks",
+    "OnTrigger",
+    "Periodic",
+    "RunCondition",
+    "MultiStreamOrchestrator",
     "PipelineBuilder",
     "PipelineExecutionError",
     "PipelineOrchestrator",
@@ -2,18 +2,71 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator, Mapping
-from dataclasses import dataclass
+import copy
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, replace
 from time import perf_counter
-from typing import Dict, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Sequence, Union
 
-from dev_environment.data import BaseTimeSeries, BlockBuffer
-from dev_environment.io import StreamDataLoader
+import numpy as np
+
+from dev_environment.data import BaseTimeSeries, MultiSensorBlock, TimeSeriesBatch
+from dev_environment.io import SinkStage, StreamDataLoader
 from dev_environment.monitoring import BlockSummary, ErrorPolicy, PipelineMonitor
 
+from .cache import NodeResultCache
+from .deadline import CostHistory, check_optional_dependencies
+from .incremental import (
+    IntermediateRecorder,
+    IntermediateStore,
+    ReplayStreamDataset,
+    lineage_fingerprints,
+)
+from .isolated import IsolatedNode, isolate_plan
+from .plan import ExecutionPlan, NodeStep, compile_plan
+from .schedule import BlockSchedule, RunCondition
+from .staged import InFlightBlock, StagePipeline
+
+if TYPE_CHECKING:
+    from .codegen import CompiledRunner
+    from .multistream import MultiStreamOrchestrator
+
+Gain = Union[float, np.ndarray]
+KernelResult = tuple[np.ndarray, Gain, Sequence[Mapping[str, Any]] | None]
+
 
 class ProcessingNode:
-    """Base class for pipeline processing nodes."""
+    """Base class for pipeline processing nodes.
+
+    Nodes that set ``supports_batch`` accept ``TimeSeriesBatch`` inputs in ``process`` and
+    return batches; the orchestrator splits batches into single blocks for other nodes.
+
+    Nodes that set ``isolated`` run in a dedicated worker process that lives for the whole
+    run, which keeps GIL-bound Python loops from stalling the rest of the block. The node
+    must be picklable; its state is held by the worker, not by the instance passed to the
+    builder.
+
+    Nodes that set ``pure`` promise that outputs depend only on the current inputs and that
+    ``process`` keeps no state between blocks, so one instance may serve several streams.
+
+    A ``rate`` (see ``EveryNBlocks``, ``OnTrigger`` and ``Periodic``) limits the blocks a
+    node runs on; on other blocks its outputs stay empty and nodes reading them are skipped.
+
+    Nodes that set ``optional`` may be skipped when a block runs short of its latency
+    budget; only other optional nodes may consume their outputs.
+
+    Nodes that set ``fusible`` take one input, produce one output and implement ``kernel``;
+    chains of them whose intermediates are not requested are fused into a single pass
+    when the pipeline is built with ``fuse=True``.
+    """
+
+    supports_batch: bool = False
+    isolated: bool = False
+    pure: bool = False
+    fusible: bool = False
+    optional: bool = False
+    rate: RunCondition | None = None
 
     def __init__(self, name: str | None = None) -> None:
         self.name = name or self.__class__.__name__
@@ -31,38 +84,169 @@ class ProcessingNode:
     def reset(self) -> None:
         """Reset any internal state before a new run."""
 
+    def fingerprint(self) -> Hashable | None:
+        """Hashable description of the configuration that determines the outputs.
+
+        Two nodes of the same type with equal fingerprints and the same input values are
+        assumed to produce the same outputs, in ``produces`` order, so the plan runs only
+        the first and aliases the other's output keys to its results. Output key names must
+        not be part of the fingerprint. The default ``None`` opts out.
+        """
+
+        return None
+
+    def kernel(self, values: np.ndarray, gain: Gain, *, batched: bool) -> KernelResult:
+        """Array-level form of ``process`` used when the node is fused into a chain.
+
+        The logical input is ``values * gain``, where ``gain`` is a scalar or, for batches,
+        one factor per item broadcastable against ``values``. Return the new values, the
+        gain still to apply to them and optional per-item metadata updates (a single entry
+        for a plain block). Never write into ``values``; return it unchanged to pass
+        through. Only linear operations may leave a pending gain in place. A subclass that
+        overrides ``process`` must override ``kernel`` as well to stay fusible.
+        """
+
+        raise NotImplementedError
+
     def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
         """Perform processing and return outputs keyed by produced names."""
 
         raise NotImplementedError
 
+    def process_span(
+        self,
+        inputs: Mapping[str, BaseTimeSeries],
+        lengths: np.ndarray,
+    ) -> Mapping[str, BaseTimeSeries]:
+        """Process many consecutive blocks, concatenated along time, in one call.
+
+        ``lengths`` holds the sample count of each block. Outputs must equal calling
+        ``process`` block by block and concatenating the results, with the same block
+        lengths. A stateful node carries its state (filter memory, overlap) across blocks
+        and across calls, as it would in ``process``. Used by
+        ``PipelineOrchestrator.run_batch``; nodes that do not implement it run per block.
+        """
+
+        raise NotImplementedError
+
+
+def defining_class(node: object, attribute: str) -> type:
+    """The most derived class in the MRO of ``node`` that defines ``attribute`` itself.
+
+    Optional capabilities such as ``kernel`` or ``process_span`` only count when they are
+    defined on a class at least as derived as the one defining ``process``.
+    """
+
+    return next(cls for cls in type(node).__mro__ if attribute in vars(cls))
+
+
+class _ScheduledNode(ProcessingNode):
+    """Registration of ``node`` under a ``rate`` given to ``PipelineBuilder.add_node``.
+
+    The wrapped node is neither modified nor copied, so its state stays visible to the
+    caller; the condition is copied so that registrations never share its state.
+    """
+
+    def __init__(self, node: ProcessingNode, rate: RunCondition) -> None:
+        super().__init__(node.name)
+        self.node = node
+        self.rate = copy.deepcopy(rate)
+        self.supports_batch = node.supports_batch
+        self.isolated = node.isolated
+        self.optional = node.optional
+
+    def requires(self) -> Sequence[str]:
+        return self.node.requires()
+
+    def produces(self) -> Sequence[str]:
+        return self.node.produces()
+
+    def reset(self) -> None:
+        self.node.reset()
+
+    def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
+        return self.node.process(inputs)
+
 
 @dataclass(frozen=True)
 class PipelineSpec:
     input_key: str
     nodes: Sequence[ProcessingNode]
     output_keys: Sequence[str] | None
+    input_keys: Sequence[str] = ()
+
+    @property
+    def source_keys(self) -> tuple[str, ...]:
+        """Keys seeded from the loader before any node runs."""
+
+        return tuple(self.input_keys) or (self.input_key,)
 
 
 class PipelineBuilder:
-    """Registers processing nodes and resolves an execution plan."""
+    """Registers processing nodes and compiles them into an ``ExecutionPlan``.
+
+    Dependency resolution, slot assignment and contract checks happen once in ``build``.
+
+    ``input_keys`` declares the sensor names delivered by a loader that yields
+    ``MultiSensorBlock`` items; each present sensor is seeded under its own key. A node
+    without a ``rate`` runs only on blocks where every sensor it reads was updated, and
+    nodes reading the outputs of a node that sat a block out sit it out as well.
+    """
 
     def __init__(
         self,
         *,
         input_key: str = "input",
+        input_keys: Sequence[str] | None = None,
         output_keys: Sequence[str] | None = None,
     ) -> None:
         self._input_key = input_key
+        self._input_keys = tuple(input_keys) if input_keys is not None else ()
         self._output_keys = tuple(output_keys) if output_keys is not None else None
         self._nodes: list[ProcessingNode] = []
 
-    def add_node(self, node: ProcessingNode) -> "PipelineBuilder":
-        self._nodes.append(node)
+    def add_node(
+        self,
+        node: ProcessingNode,
+        *,
+        rate: RunCondition | None = None,
+    ) -> "PipelineBuilder":
+        """Register ``node``; ``rate`` overrides the node's own execution-rate declaration.
+
+        The override applies to this registration only: ``node`` is left unchanged and each
+        registration runs on its own copy of ``rate``.
+        """
+
+        self._nodes.append(node if rate is None else _ScheduledNode(node, rate))
         return self
 
+    def build_multi(
+        self,
+        streams: Mapping[Hashable, StreamDataLoader],
+        *,
+        monitor: PipelineMonitor | None = None,
+        on_error: ErrorPolicy = ErrorPolicy.STOP,
+    ) -> "MultiStreamOrchestrator":
+        """Compile the registered nodes once and run them for every loader in ``streams``.
+
+        Each stream yields single blocks, so the graph must have exactly one source key.
+        """
+
+        from .multistream import MultiStreamOrchestrator
+
+        source_keys = self._input_keys or (self._input_key,)
+        if len(source_keys) != 1:
+            raise ValueError("build_multi requires a single input key")
+        plan = compile_plan(source_keys, self._resolve_order(), self._output_keys)
+        return MultiStreamOrchestrator(
+            streams=streams,
+            plan=plan,
+            monitor=monitor,
+            on_error=on_error,
+        )
+
     def _resolve_order(self) -> list[ProcessingNode]:
-        available = {self._input_key}
+        available = set(self._input_keys) or {self._input_key}
         pending = list(self._nodes)
         order: list[ProcessingNode] = []
 
@@ -91,147 +275,940 @@ class PipelineBuilder:
         *,
         monitor: PipelineMonitor | None = None,
         on_error: ErrorPolicy = ErrorPolicy.STOP,
+        executor: Executor | None = None,
+        pipelined: bool = False,
+        mp_context: str | None = None,
+        fuse: bool = False,
+        budget_seconds: float | None = None,
+        cache: NodeResultCache | None = None,
+        store: IntermediateStore | None = None,
+        persist_keys: Sequence[str] = (),
+        sinks: Sequence[SinkStage] = (),
+        codegen: bool = False,
     ) -> "PipelineOrchestrator":
+        """Compile the registered nodes and bind them to ``dataloader``.
+
+        With a thread-based ``executor`` (for example ``ThreadPoolExecutor``), nodes whose
+        dependencies have finished run concurrently within each block. The caller owns the
+        executor and shuts it down.
+
+        With ``pipelined=True`` every node runs on its own stage thread and consecutive
+        blocks overlap across stages, so throughput approaches the rate of the slowest node.
+        Call ``PipelineOrchestrator.close`` to stop the stage threads early.
+
+        ``mp_context`` selects the start method for the worker processes of ``isolated``
+        nodes; ``close`` shuts those workers down.
+
+        With ``fuse=True`` and ``output_keys`` set, adjacent fusible nodes whose
+        intermediate keys are not requested run as one ``FusedNode`` step; see
+        ``ExecutionPlan.fused``. A fused step is named after its members joined with ``+``
+        (for example ``"NormaliseAmplitudeNode+MovingAverageNode"``), and monitors and
+        ``PipelineExecutionError.node_name`` report that name instead of the member names,
+        which is why fusion is opt-in.
+
+        ``budget_seconds`` sets a per-block latency budget for sequential execution.
+        Before each ``optional`` node starts, its expected cost and that of the remaining
+        required nodes, taken from a rolling history of run times, are added to the time
+        already spent on the block; if the sum exceeds the budget the node is skipped and
+        listed in ``BlockSummary.skipped``.
+
+        ``cache`` memoises the outputs of ``pure`` nodes that declare a ``fingerprint``;
+        per-block hits and misses are reported in ``BlockSummary``.
+
+        ``persist_keys`` are written to ``store`` for every block, together with the lineage
+        fingerprints that ``build_incremental`` later compares. They are kept out of
+        pruning and fusion but are not added to the returned outputs.
+
+        Each ``SinkStage`` in ``sinks`` receives its ``keys`` (by default the outputs) of
+        every successful block on a background thread; the keys are protected like
+        ``persist_keys``. Sinks are flushed when the loader is exhausted and closed by
+        ``PipelineOrchestrator.close``.
+
+        With ``codegen`` every block runs through one generated function (see
+        ``CompiledRunner``) instead of the interpreted step loop; it requires sequential
+        execution without budget, cache, rate-scheduled nodes, persisted keys or keyed
+        sinks.
+        """
+
         order = self._resolve_order()
-        spec = PipelineSpec(input_key=self._input_key, nodes=order, output_keys=self._output_keys)
+        spec = PipelineSpec(
+            input_key=self._input_key,
+            nodes=order,
+            output_keys=self._output_keys,
+            input_keys=self._input_keys,
+        )
+        plan = _compile(spec, fuse=fuse, keep=_kept_keys(persist_keys, sinks))
         return PipelineOrchestrator(
             dataloader=dataloader,
             spec=spec,
+            plan=plan,
+            monitor=monitor,
+            on_error=on_error,
+            executor=executor,
+            pipelined=pipelined,
+            mp_context=mp_context,
+            budget_seconds=budget_seconds,
+            cache=cache,
+            store=store,
+            persist_keys=persist_keys,
+            sinks=sinks,
+            codegen=codegen,
+        )
+
+    def build_incremental(
+        self,
+        dataloader: StreamDataLoader,
+        store: IntermediateStore,
+        *,
+        monitor: PipelineMonitor | None = None,
+        on_error: ErrorPolicy = ErrorPolicy.STOP,
+    ) -> "PipelineOrchestrator":
+        """Re-run a recorded session, recomputing only what changed since it was persisted.
+
+        Persisted keys whose lineage fingerprint still matches the current graph are read
+        from ``store``; only nodes needed to derive ``output_keys`` from them are executed.
+        ``dataloader`` (the original source) is read only when some node still needs the
+        input key. Nodes served from the store appear in ``ExecutionPlan.pruned`` and the
+        keys read from disk in ``ExecutionPlan.source_keys``.
+        """
+
+        if self._output_keys is None:
+            raise ValueError("build_incremental requires output_keys")
+        order = self._resolve_order()
+        source_keys = self._input_keys or (self._input_key,)
+        reusable = store.reusable(lineage_fingerprints(source_keys, order))
+
+        live = set(self._output_keys)
+        kept: list[ProcessingNode] = []
+        for node in reversed(order):
+            produced = set(node.produces())
+            if produced and not produced & (live - reusable):
+                continue
+            live -= produced
+            live.update(node.requires())
+            kept.append(node)
+        kept.reverse()
+
+        loaded = sorted(live & reusable)
+        needed = sorted(live.intersection(source_keys) - reusable)
+        if len(needed) > 1 or (needed and self._input_keys):
+            raise ValueError("build_incremental supports a single input_key source")
+        source_key = needed[0] if needed else None
+        dataset = ReplayStreamDataset(
+            {key: store.dataset(key) for key in loaded},
+            source_key=source_key,
+            source=dataloader if source_key is not None else None,
+            missing=store.missing_blocks(),
+        )
+        spec = PipelineSpec(
+            input_key=self._input_key,
+            nodes=kept,
+            output_keys=self._output_keys,
+            input_keys=(*loaded, *needed),
+        )
+        plan = compile_plan(spec.source_keys, kept, self._output_keys)
+        skipped = tuple(node.name for node in order if node not in kept)
+        return PipelineOrchestrator(
+            dataloader=StreamDataLoader(dataset),
+            spec=spec,
+            plan=replace(plan, pruned=skipped + plan.pruned),
             monitor=monitor,
             on_error=on_error,
         )
 
 
 class PipelineOrchestrator:
-    """Coordinates the sequential execution of processing nodes per block."""
+    """Coordinates the sequential execution of processing nodes per block.
+
+    Blocks run against a compiled ``ExecutionPlan``: every key lives in a fixed slot of one
+    list that is reused across blocks. A plan is compiled from ``spec`` when not given.
+    """
 
     def __init__(
         self,
         *,
         dataloader: StreamDataLoader,
         spec: PipelineSpec,
+        plan: ExecutionPlan | None = None,
         monitor: PipelineMonitor | None = None,
         on_error: ErrorPolicy = ErrorPolicy.STOP,
+        executor: Executor | None = None,
+        pipelined: bool = False,
+        mp_context: str | None = None,
+        budget_seconds: float | None = None,
+        cache: NodeResultCache | None = None,
+        store: IntermediateStore | None = None,
+        persist_keys: Sequence[str] = (),
+        sinks: Sequence[SinkStage] = (),
+        codegen: bool = False,
     ) -> None:
+        if executor is not None and pipelined:
+            raise ValueError("executor and pipelined modes are mutually exclusive")
+        if budget_seconds is not None:
+            if budget_seconds <= 0:
+                raise ValueError("budget_seconds must be positive")
+            if executor is not None or pipelined:
+                raise ValueError("budget_seconds requires sequential execution")
         self._dataloader = dataloader
         self._spec = spec
-        self._buffer: BlockBuffer[BaseTimeSeries] | None = None
+        if persist_keys and store is None:
+            raise ValueError("persist_keys requires a store")
+        kept = _kept_keys(persist_keys, sinks)
+        self._plan = isolate_plan(plan or _compile(spec, keep=kept), mp_context=mp_context)
+        missing = [key for key in kept if key not in self._plan.slots]
+        if missing:
+            raise ValueError(f"Persisted or sink keys are never produced: {missing}")
+        self._store = store
+        self._persist_keys = tuple(persist_keys)
+        self._persist_slots = tuple((key, self._plan.slots[key]) for key in persist_keys)
+        self._recorder: IntermediateRecorder | None = None
+        self._sinks = tuple(
+            (
+                stage,
+                None
+                if stage.keys is None
+                else tuple((key, self._plan.slots[key]) for key in stage.keys),
+            )
+            for stage in sinks
+        )
+        self._empty: list[BaseTimeSeries | None] = [None] * self._plan.slot_count
+        self._values = list(self._empty)
+        self._input_slot = self._plan.slots[self._plan.source_keys[0]]
+        self._executor = executor
+        self._dependents = self._plan.dependents()
+        self._budget = budget_seconds
+        self._cache = cache
+        self._tally = [0, 0]
+        self._costs: CostHistory | None = None
+        self._skipped: list[str] = []
+        if budget_seconds is not None:
+            check_optional_dependencies(self._plan.steps)
+            self._costs = CostHistory(len(self._plan.steps))
+        self._scheduled = any(step.node.rate is not None for step in self._plan.steps)
+        self._pipelined = pipelined
+        self._stages: StagePipeline | None = None
+        self._in_flight = 0
+        self._feed_done = False
+        self._runner: CompiledRunner | None = None
+        if codegen:
+            if (
+                executor is not None
+                or pipelined
+                or budget_seconds is not None
+                or cache is not None
+                or self._scheduled
+                or persist_keys
+                or any(stage.keys is not None for stage in sinks)
+            ):
+                raise ValueError(
+                    "codegen requires sequential execution without budget, cache, "
+                    "rate-scheduled nodes, persisted keys or keyed sinks"
+                )
+            from .codegen import CompiledRunner
+
+            self._runner = CompiledRunner(
+                self._plan, monitored=monitor is not None, keyed=bool(spec.input_keys)
+            )
         self._monitor = monitor
         self._error_policy = on_error
         self._next_block_index = 0
 
+    @property
+    def plan(self) -> ExecutionPlan:
+        """The compiled plan executed for every block."""
+
+        return self._plan
+
+    @property
+    def generated_source(self) -> str | None:
+        """Source of the generated block function when built with ``codegen``."""
+
+        return None if self._runner is None else self._runner.source
+
     def reset(self) -> None:
+        """Rewind the loader and node state; cost history for the budget is kept."""
+
+        self._stop_stages()
+        self._finish_recording()
         self._dataloader.reset()
-        for node in self._spec.nodes:
-            node.reset()
-        self._buffer = None
+        for step in self._plan.steps:
+            step.node.reset()
+            if step.node.rate is not None:
+                step.node.rate.reset()
+        self._values[:] = self._empty
         self._next_block_index = 0
 
+    def close(self) -> None:
+        """Stop pipelined stage threads and isolated-node worker processes.
+
+        Blocks still in flight are abandoned; a later call starts fresh workers. An open
+        intermediate recording is finalised and sinks are drained and closed.
+        """
+
+        self._stop_stages()
+        self._finish_recording()
+        for step in self._plan.steps:
+            if isinstance(step.node, IsolatedNode):
+                step.node.close()
+        for stage, _ in self._sinks:
+            stage.close()
+
+    def _stop_stages(self) -> None:
+        if self._stages is not None:
+            self._stages.stop()
+            self._stages = None
+        self._in_flight = 0
+        self._feed_done = False
+
     def process_next(self) -> Mapping[str, BaseTimeSeries] | None:
+        if self._pipelined:
+            return self._process_next_pipelined()
+
         while True:
+            read_start = perf_counter()
             raw_block = self._dataloader.next_block()
             if raw_block is None:
+                self._finish_recording()
+                self._flush_sinks()
                 return None
 
-            block_index = self._next_block_index
-            self._next_block_index += 1
-            block_start = perf_counter()
-            if self._monitor:
-                self._monitor.on_block_start(block_index)
+            produced = self._handle_block(raw_block, read_start)
+            if produced is not None:
+                return produced
 
-            try:
-                produced = self._execute_block(block_index, raw_block)
-            except PipelineExecutionError as error:
-                duration = perf_counter() - block_start
-                if self._monitor:
-                    self._monitor.on_error(block_index, error.node_name, error.__cause__ or error)
-                    self._monitor.on_block_end(
-                        BlockSummary(
-                            block_index=block_index,
-                            duration_seconds=duration,
-                            outputs=None,
-                        )
-                    )
+    async def aprocess_next(self) -> Mapping[str, BaseTimeSeries] | None:
+        """Await the next block from the loader and run the nodes on it synchronously."""
+
+        while True:
+            read_start = perf_counter()
+            raw_block = await self._dataloader.anext_block()
+            if raw_block is None:
+                self._finish_recording()
+                self._flush_sinks()
+                return None
 
-                if self._error_policy is ErrorPolicy.STOP:
-                    raise error
+            produced = self._handle_block(raw_block, read_start)
+            if produced is not None:
+                return produced
 
-                # Error policy CONTINUE: skip this block and attempt the next one.
-                continue
+    def run(self, *, max_blocks: int | None = None) -> Iterator[Mapping[str, BaseTimeSeries]]:
+        count = 0
+        while True:
+            if max_blocks is not None and count >= max_blocks:
+                return
+            result = self.process_next()
+            if result is None:
+                return
+            count += 1
+            yield result
+
+    def run_batch(self, *, chunk_blocks: int | None = None) -> Iterator[Dict[str, BaseTimeSeries]]:
+        """Process the remaining recording offline, ``chunk_blocks`` blocks per node call.
 
-            duration = perf_counter() - block_start
+        Each chunk yields one block per output key, with the values of every block
+        concatenated along time; ``None`` reads the whole recording into one chunk. Nodes
+        that implement ``process_span`` run once per chunk unless a node without it reads
+        their outputs; the others run block by block, so every node sees the same data and
+        metadata as in ``run`` and results match the concatenated streaming outputs up to
+        floating-point rounding. A chunk carries the metadata of its first block.
+
+        The monitor sees one "block" per chunk, numbered from zero. Under
+        ``ErrorPolicy.CONTINUE`` a failing chunk is dropped. The loader must yield single
+        ``BaseTimeSeries`` blocks and the plan may not contain rate-scheduled nodes;
+        caching, the latency budget, intermediate recording and sinks do not apply.
+        """
+
+        from .batch import run_chunk
+
+        if chunk_blocks is not None and chunk_blocks <= 0:
+            raise ValueError("chunk_blocks must be positive")
+        if len(self._plan.source_keys) != 1:
+            raise ValueError("run_batch requires a single input key")
+        if self._scheduled:
+            raise ValueError("run_batch does not support rate-scheduled nodes")
+
+        chunk_index = 0
+        exhausted = False
+        while not exhausted:
+            read_start = perf_counter()
+            blocks: list[BaseTimeSeries] = []
+            while chunk_blocks is None or len(blocks) < chunk_blocks:
+                raw_block = self._dataloader.next_block()
+                if raw_block is None:
+                    exhausted = True
+                    break
+                if not isinstance(raw_block, BaseTimeSeries):
+                    raise TypeError("run_batch requires a loader of single BaseTimeSeries blocks")
+                blocks.append(raw_block)
+            if not blocks:
+                return
+
+            if self._monitor:
+                self._monitor.on_block_start(chunk_index)
+            chunk_start = perf_counter()
+            produced: Dict[str, BaseTimeSeries] | None = None
+            failure: PipelineExecutionError | None = None
+            try:
+                produced = run_chunk(self._plan, blocks, chunk_index, self._monitor)
+            except PipelineExecutionError as error:
+                failure = error
+            chunk_end = perf_counter()
             if self._monitor:
+                if failure is not None:
+                    self._monitor.on_error(
+                        chunk_index, failure.node_name, failure.__cause__ or failure
+                    )
                 self._monitor.on_block_end(
                     BlockSummary(
-                        block_index=block_index,
-                        duration_seconds=duration,
+                        block_index=chunk_index,
+                        duration_seconds=chunk_end - chunk_start,
                         outputs=produced,
+                        latency_seconds=chunk_end - read_start,
                     )
                 )
-            return produced
+            chunk_index += 1
+
+            if failure is not None and self._error_policy is ErrorPolicy.STOP:
+                raise failure
+            if produced is not None:
+                yield produced
+
+    async def arun(
+        self,
+        *,
+        max_blocks: int | None = None,
+    ) -> AsyncIterator[Mapping[str, BaseTimeSeries]]:
+        """Async counterpart of ``run`` that yields control to the event loop between reads."""
 
-    def run(self, *, max_blocks: int | None = None) -> Iterator[Mapping[str, BaseTimeSeries]]:
         count = 0
         while True:
             if max_blocks is not None and count >= max_blocks:
                 return
-            result = self.process_next()
+            result = await self.aprocess_next()
             if result is None:
                 return
             count += 1
             yield result
 
-    def available_outputs(self) -> Iterable[str]:
-        produced = {self._spec.input_key}
-        for node in self._spec.nodes:
-            produced.update(node.produces())
+    def _handle_block(
+        self,
+        raw_block: BaseTimeSeries | MultiSensorBlock | TimeSeriesBatch,
+        read_start: float,
+    ) -> Dict[str, BaseTimeSeries] | None:
+        """Execute one block, returning ``None`` when it was skipped under CONTINUE."""
+
+        block_index = self._next_block_index
+        self._next_block_index += 1
+        block_start = perf_counter()
+        self._skipped.clear()
+        self._tally = [0, 0]
+        if self._monitor:
+            self._monitor.on_block_start(block_index)
+
+        try:
+            produced = self._execute_block(block_index, raw_block, block_start)
+        except PipelineExecutionError as error:
+            block_end = perf_counter()
+            if self._monitor:
+                self._monitor.on_error(block_index, error.node_name, error.__cause__ or error)
+                self._monitor.on_block_end(
+                    BlockSummary(
+                        block_index=block_index,
+                        duration_seconds=block_end - block_start,
+                        outputs=None,
+                        latency_seconds=block_end - read_start,
+                        skipped=tuple(self._skipped),
+                        cache_hits=self._tally[0],
+                        cache_misses=self._tally[1],
+                    )
+                )
+
+            if self._error_policy is ErrorPolicy.STOP:
+                raise error
+
+            # Error policy CONTINUE: skip this block and attempt the next one.
+            self._record(None)
+            return None
+
+        self._record(self._values)
+        self._emit(block_index, self._values, produced)
+
+        block_end = perf_counter()
+        if self._monitor:
+            self._monitor.on_block_end(
+                BlockSummary(
+                    block_index=block_index,
+                    duration_seconds=block_end - block_start,
+                    outputs=produced,
+                    latency_seconds=block_end - read_start,
+                    skipped=tuple(self._skipped),
+                    cache_hits=self._tally[0],
+                    cache_misses=self._tally[1],
+                )
+            )
+        return produced
+
+    def _process_next_pipelined(self) -> Mapping[str, BaseTimeSeries] | None:
+        if self._stages is None:
+            self._stages = StagePipeline(self._plan.steps, self._run_staged_step)
+
+        capacity = len(self._plan.steps) + 1
+        while True:
+            while not self._feed_done and self._in_flight < capacity:
+                read_start = perf_counter()
+                raw_block = self._dataloader.next_block()
+                if raw_block is None:
+                    self._feed_done = True
+                    break
+                values = list(self._empty)
+                self._seed(values, raw_block)
+                block = InFlightBlock(
+                    self._next_block_index,
+                    values,
+                    isinstance(raw_block, TimeSeriesBatch),
+                    read_start,
+                    perf_counter(),
+                    len(self._plan.steps),
+                )
+                block.schedule = self._schedule_for(self._next_block_index, raw_block)
+                self._next_block_index += 1
+                self._stages.submit(block)
+                self._in_flight += 1
+
+            if not self._in_flight:
+                self._stop_stages()
+                self._finish_recording()
+                self._flush_sinks()
+                return None
+
+            block = self._stages.collect()
+            self._in_flight -= 1
+            produced = self._finish_in_flight(block)
+            if produced is not None:
+                return produced
+
+    def _run_staged_step(self, block: InFlightBlock, index: int, step: NodeStep) -> None:
+        """Execute ``step`` for ``block`` on a stage thread, recording any failure."""
+
+        schedule = block.schedule
+        if schedule is not None and schedule.skips(step, block.values):
+            return
+        block.started[index] = True
+        try:
+            required = _gather_inputs(block.index, step, block.values)
+            node_start = perf_counter()
+            try:
+                outputs = _call_node(step, required, block.batched, self._cache, block.tally)
+            except Exception as error:  # pragma: no cover - user code
+                raise PipelineExecutionError(block.index, step.name, error) from error
+            finally:
+                block.durations[index] = perf_counter() - node_start
+            _store_outputs(block.index, step, outputs, block.values)
+            if schedule is not None:
+                schedule.ran(step)
+        except PipelineExecutionError as error:
+            block.failure = error
+            block.failed_at = index
+
+    def _finish_in_flight(self, block: InFlightBlock) -> Dict[str, BaseTimeSeries] | None:
+        """Replay monitor events for a completed block and apply the error policy."""
+
+        block_end = perf_counter()
+        steps = self._plan.steps
+        last = block.failed_at if block.failed_at is not None else len(steps) - 1
+        failure = block.failure
+        produced = None if failure is not None else self._collect_outputs(block.values)
+
+        monitor = self._monitor
+        if monitor:
+            monitor.on_block_start(block.index)
+            for index in range(last + 1):
+                if not block.started[index]:
+                    continue
+                monitor.on_node_start(block.index, steps[index].name)
+                duration = block.durations[index]
+                if duration is not None:
+                    monitor.on_node_end(block.index, steps[index].name, duration)
+            if isinstance(failure, PipelineExecutionError):
+                monitor.on_error(block.index, failure.node_name, failure.__cause__ or failure)
+            monitor.on_block_end(
+                BlockSummary(
+                    block_index=block.index,
+                    duration_seconds=block_end - block.enter,
+                    outputs=produced,
+                    latency_seconds=block_end - block.read_start,
+                    cache_hits=block.tally[0],
+                    cache_misses=block.tally[1],
+                )
+            )
+
+        if failure is not None:
+            if self._error_policy is ErrorPolicy.STOP:
+                self._stop_stages()
+                raise failure
+            self._record(None)
+            return None
+        self._record(block.values)
+        self._emit(block.index, block.values, produced)  # type: ignore[arg-type]
         return produced
 
+    def _record(self, values: list[BaseTimeSeries | None] | None) -> None:
+        """Persist the selected keys of a finished block, or a gap for a failed one."""
+
+        if self._store is None or not self._persist_keys:
+            return
+        if self._recorder is None:
+            lineage = lineage_fingerprints(self._spec.source_keys, self._spec.nodes)
+            self._recorder = self._store.recorder(self._persist_keys, lineage)
+        if values is None:
+            self._recorder.skip()
+        else:
+            self._recorder.write({key: values[slot] for key, slot in self._persist_slots})
+
+    def _emit(
+        self,
+        block_index: int,
+        values: list[BaseTimeSeries | None],
+        produced: Mapping[str, BaseTimeSeries],
+    ) -> None:
+        for stage, slots in self._sinks:
+            if slots is None:
+                stage.submit(block_index, produced)
+            else:
+                selected = {key: values[slot] for key, slot in slots}
+                stage.submit(block_index, {k: v for k, v in selected.items() if v is not None})
+
+    def _flush_sinks(self) -> None:
+        for stage, _ in self._sinks:
+            stage.flush()
+
+    def _finish_recording(self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def available_outputs(self) -> Iterable[str]:
+        return set(self._plan.keys)
+
     def _execute_block(
         self,
         block_index: int,
-        raw_block: BaseTimeSeries,
+        raw_block: BaseTimeSeries | MultiSensorBlock | TimeSeriesBatch,
+        block_start: float,
     ) -> Dict[str, BaseTimeSeries]:
-        self._buffer = BlockBuffer()
-        self._buffer.push(self._spec.input_key, raw_block)
-        produced: Dict[str, BaseTimeSeries] = {self._spec.input_key: raw_block}
+        if self._runner is not None:
+            batched = isinstance(raw_block, TimeSeriesBatch)
+            return self._runner(block_index, raw_block, batched, self._monitor)
 
-        for node in self._spec.nodes:
-            node_start = perf_counter()
-            if self._monitor:
-                self._monitor.on_node_start(block_index, node.name)
+        values = self._values
+        values[:] = self._empty
+        self._seed(values, raw_block)
+        batched = isinstance(raw_block, TimeSeriesBatch)
+        schedule = self._schedule_for(block_index, raw_block)
 
-            try:
-                required = {key: self._buffer.get(key) for key in node.requires()}
-            except KeyError as error:
-                raise PipelineExecutionError(block_index, node.name, error) from error
+        if self._executor is None:
+            self._run_steps(block_index, values, batched, block_start, schedule)
+        else:
+            self._run_steps_parallel(block_index, values, batched, schedule)
+
+        return self._collect_outputs(values)
+
+    def _schedule_for(
+        self,
+        block_index: int,
+        raw_block: BaseTimeSeries | MultiSensorBlock | TimeSeriesBatch,
+    ) -> BlockSchedule | None:
+        slots = self._plan.slots
+        if isinstance(raw_block, MultiSensorBlock):
+            # Sensors tick independently, so every multi-sensor block needs a schedule.
+            sources = [(key, slots[key]) for key in self._plan.source_keys]
+            stale = frozenset(
+                slot for key, slot in sources if key in raw_block and key not in raw_block.updated
+            )
+            absent = frozenset(slot for key, slot in sources if key not in raw_block)
+            return BlockSchedule(block_index, raw_block.timestamp, stale, slots, absent)
+
+        if not self._scheduled:
+            return None
+        if isinstance(raw_block, TimeSeriesBatch):
+            timestamp = raw_block.start_timestamps[0]
+        else:
+            timestamp = raw_block.start_timestamp
+        return BlockSchedule(block_index, timestamp, frozenset(), slots)
 
+    def _seed(
+        self,
+        values: list[BaseTimeSeries | None],
+        raw_block: BaseTimeSeries | MultiSensorBlock | TimeSeriesBatch,
+    ) -> None:
+        if isinstance(raw_block, MultiSensorBlock):
+            for key, block in raw_block.items():
+                slot = self._plan.slots.get(key)
+                if slot is not None:
+                    values[slot] = block
+        else:
+            values[self._input_slot] = raw_block
+
+    def _collect_outputs(self, values: list[BaseTimeSeries | None]) -> Dict[str, BaseTimeSeries]:
+        plan = self._plan
+        selected = plan.slots.items() if plan.output_slots is None else plan.output_slots
+        return {key: values[slot] for key, slot in selected if values[slot] is not None}
+
+    def _run_steps(
+        self,
+        block_index: int,
+        values: list[BaseTimeSeries | None],
+        batched: bool,
+        block_start: float,
+        schedule: BlockSchedule | None,
+    ) -> None:
+        monitor = self._monitor
+        costs = self._costs
+        steps = self._plan.steps
+        for index, step in enumerate(steps):
+            if schedule is not None and schedule.skips(step, values):
+                continue
+            if costs is not None and step.node.optional:
+                if any(values[slot] is None for _, slot in step.inputs) or (
+                    self._over_budget(index, block_start)
+                ):
+                    self._skipped.append(step.name)
+                    continue
+
+            node_start = perf_counter()
+            if monitor:
+                monitor.on_node_start(block_index, step.name)
+
+            required = _gather_inputs(block_index, step, values)
             try:
-                outputs = node.process(required)
+                outputs = _call_node(step, required, batched, self._cache, self._tally)
             except Exception as error:  # pragma: no cover - user code
-                raise PipelineExecutionError(block_index, node.name, error) from error
+                raise PipelineExecutionError(block_index, step.name, error) from error
             finally:
-                if self._monitor:
-                    self._monitor.on_node_end(
-                        block_index,
-                        node.name,
-                        perf_counter() - node_start,
-                    )
+                duration = perf_counter() - node_start
+                if costs is not None:
+                    costs.record(index, duration)
+                if monitor:
+                    monitor.on_node_end(block_index, step.name, duration)
+
+            _store_outputs(block_index, step, outputs, values)
+            if schedule is not None:
+                schedule.ran(step)
+
+    def _over_budget(self, index: int, block_start: float) -> bool:
+        """Whether running optional step ``index`` would push the block past its budget."""
+
+        assert self._costs is not None and self._budget is not None
+        steps = self._plan.steps
+        expected = self._costs.estimate(index) + sum(
+            self._costs.estimate(later)
+            for later in range(index + 1, len(steps))
+            if not steps[later].node.optional
+        )
+        return perf_counter() - block_start + expected > self._budget
+
+    def _run_steps_parallel(
+        self,
+        block_index: int,
+        values: list[BaseTimeSeries | None],
+        batched: bool,
+        schedule: BlockSchedule | None,
+    ) -> None:
+        """Run independent steps concurrently while keeping sequential-mode observables.
+
+        Slots are only read and written on this thread. Once a step fails, only steps
+        earlier in plan order are still launched, the earliest failure is raised, and
+        monitor events are replayed in plan order up to it, so errors and callbacks match
+        the sequential path. Later steps that were already running may still complete.
+        """
+
+        assert self._executor is not None
+        steps = self._plan.steps
+        remaining = [len(step.dependencies) for step in steps]
+        started = [False] * len(steps)
+        durations: list[float | None] = [None] * len(steps)
+        failures: dict[int, PipelineExecutionError] = {}
+        running: dict[Future[tuple[Mapping[str, BaseTimeSeries], float]], int] = {}
+
+        def release(index: int) -> None:
+            for dependent in self._dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    launch(dependent)
+
+        def launch(index: int) -> None:
+            if failures and index > min(failures):
+                return
+            step = steps[index]
+            if schedule is not None and schedule.skips(step, values):
+                release(index)
+                return
+            started[index] = True
+            try:
+                required = _gather_inputs(block_index, step, values)
+            except PipelineExecutionError as error:
+                failures[index] = error
+                return
+            future = self._executor.submit(
+                _timed_call, step, required, batched, self._cache, self._tally
+            )
+            running[future] = index
+
+        for index, count in enumerate(remaining):
+            if count == 0:
+                launch(index)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=running.__getitem__):
+                index = running.pop(future)
+                step = steps[index]
+                try:
+                    outputs, durations[index] = future.result()
+                    _store_outputs(block_index, step, outputs, values)
+                    if schedule is not None:
+                        schedule.ran(step)
+                except _NodeFailure as failure:
+                    durations[index] = failure.duration
+                    failures[index] = PipelineExecutionError(block_index, step.name, failure.error)
+                    continue
+                except PipelineExecutionError as error:
+                    failures[index] = error
+                    continue
+
+                release(index)
+
+        last = min(failures) if failures else len(steps) - 1
+        if self._monitor:
+            for index in range(last + 1):
+                if not started[index]:
+                    continue
+                self._monitor.on_node_start(block_index, steps[index].name)
+                duration = durations[index]
+                if duration is not None:
+                    self._monitor.on_node_end(block_index, steps[index].name, duration)
+
+        if failures:
+            raise failures[last]
+
+
+def _kept_keys(persist_keys: Sequence[str], sinks: Sequence[SinkStage]) -> tuple[str, ...]:
+    keys = dict.fromkeys(persist_keys)
+    for stage in sinks:
+        keys.update(dict.fromkeys(stage.keys or ()))
+    return tuple(keys)
+
+
+def _compile(
+    spec: PipelineSpec,
+    *,
+    fuse: bool = False,
+    keep: Sequence[str] = (),
+) -> ExecutionPlan:
+    """Compile ``spec``, protecting ``keep`` from pruning and fusion without returning it."""
+
+    output_keys = spec.output_keys
+    if output_keys is None or not keep:
+        return compile_plan(spec.source_keys, spec.nodes, output_keys, fuse=fuse)
+
+    extended = [*output_keys, *(key for key in keep if key not in output_keys)]
+    plan = compile_plan(spec.source_keys, spec.nodes, extended, fuse=fuse)
+    return replace(plan, output_slots=tuple((key, plan.slots[key]) for key in output_keys))
+
+
+class _NodeFailure(Exception):
+    """Carries a node exception and its run time back from a worker thread."""
+
+    def __init__(self, error: Exception, duration: float) -> None:
+        super().__init__(error)
+        self.error = error
+        self.duration = duration
+
+
+def _gather_inputs(
+    block_index: int,
+    step: NodeStep,
+    values: list[BaseTimeSeries | None],
+) -> Dict[str, BaseTimeSeries]:
+    required = {}
+    for key, slot in step.inputs:
+        value = values[slot]
+        if value is None:
+            error = KeyError(f"Block '{key}' not found")
+            raise PipelineExecutionError(block_index, step.name, error) from error
+        required[key] = value
+    return required
+
+
+def _call_node(
+    step: NodeStep,
+    required: Mapping[str, BaseTimeSeries],
+    batched: bool,
+    cache: NodeResultCache | None = None,
+    tally: list[int] | None = None,
+) -> Mapping[str, BaseTimeSeries]:
+    key = cache.key_for(step.node, required) if cache is not None else None
+    produces = tuple(step.node.produces()) if key is not None else ()
+    if key is not None:
+        cached = cache.get(key, tally, produces=produces)  # type: ignore[union-attr]
+        if cached is not None:
+            return cached
+
+    if batched and not step.node.supports_batch:
+        outputs = _process_unbatched(step.node, required)  # type: ignore[arg-type]
+    else:
+        outputs = step.node.process(required)
+    if key is not None:
+        cache.put(key, outputs, produces=produces)  # type: ignore[union-attr]
+    return outputs
+
+
+def _timed_call(
+    step: NodeStep,
+    required: Mapping[str, BaseTimeSeries],
+    batched: bool,
+    cache: NodeResultCache | None = None,
+    tally: list[int] | None = None,
+) -> tuple[Mapping[str, BaseTimeSeries], float]:
+    start = perf_counter()
+    try:
+        outputs = _call_node(step, required, batched, cache, tally)
+    except Exception as error:  # pragma: no cover - user code
+        raise _NodeFailure(error, perf_counter() - start) from error
+    return outputs, perf_counter() - start
+
+
+def _store_outputs(
+    block_index: int,
+    step: NodeStep,
+    outputs: Mapping[str, BaseTimeSeries],
+    values: list[BaseTimeSeries | None],
+) -> None:
+    for key, value in outputs.items():
+        slot = step.outputs.get(key)
+        if slot is None:
+            raise PipelineExecutionError(
+                block_index,
+                step.name,
+                ValueError(f"Node {step.name} produced unexpected key '{key}'"),
+            )
+        values[slot] = value
 
-            for key, value in outputs.items():
-                if key not in node.produces():
-                    raise PipelineExecutionError(
-                        block_index,
-                        node.name,
-                        ValueError(f"Node {node.name} produced unexpected key '{key}'"),
-                    )
-                self._buffer.push(key, value)
-                produced[key] = value
 
-        if self._spec.output_keys is None:
-            return produced
+def _process_unbatched(
+    node: ProcessingNode,
+    inputs: Mapping[str, TimeSeriesBatch],
+) -> Dict[str, TimeSeriesBatch]:
+    """Run a block-only node over each item of batched inputs and restack the outputs."""
 
-        return {key: produced[key] for key in self._spec.output_keys if key in produced}
+    columns = {key: batch.unbatch() for key, batch in inputs.items()}
+    size = len(next(iter(columns.values()))) if columns else 0
+    collected: Dict[str, list[BaseTimeSeries]] = {}
+    for index in range(size):
+        outputs = node.process({key: blocks[index] for key, blocks in columns.items()})
+        for key, value in outputs.items():
+            collected.setdefault(key, []).append(value)
+    return {key: TimeSeriesBatch.stack(blocks) for key, blocks in collected.items()}
 
 
 class PipelineExecutionError(RuntimeError):
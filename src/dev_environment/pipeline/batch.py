@@ -0,0 +1,183 @@
+"""Offline execution of a plan over many consecutive blocks per node call."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, Sequence
+
+import numpy as np
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.monitoring import PipelineMonitor
+
+from .base import PipelineExecutionError, ProcessingNode, defining_class
+from .fusion import FusedNode
+from .plan import ExecutionPlan
+
+
+def spans_blocks(node: object) -> bool:
+    """Whether ``node`` implements ``process_span`` for what its ``process`` computes.
+
+    As with ``kernel`` for fusion, a subclass that overrides ``process`` without
+    overriding ``process_span`` falls back to block-by-block calls.
+    """
+
+    if isinstance(node, FusedNode):
+        return all(spans_blocks(member) for member in node.nodes)
+    if not isinstance(node, ProcessingNode):
+        return False
+    return issubclass(defining_class(node, "process_span"), defining_class(node, "process"))
+
+
+class _Span:
+    """One key over a chunk, held as per-block items, one concatenated block, or both.
+
+    Each form is built from the other on first use, so chains of span-capable nodes never
+    split and chains of per-block nodes never concatenate.
+    """
+
+    __slots__ = ("lengths", "starts", "_blocks", "_series")
+
+    def __init__(
+        self,
+        lengths: np.ndarray,
+        starts: Sequence[datetime],
+        *,
+        blocks: Sequence[BaseTimeSeries] | None = None,
+        series: BaseTimeSeries | None = None,
+    ) -> None:
+        self.lengths = lengths
+        self.starts = starts
+        self._blocks = blocks
+        self._series = series
+
+    @classmethod
+    def from_blocks(cls, blocks: Sequence[BaseTimeSeries]) -> "_Span":
+        lengths = np.fromiter((block.block_size for block in blocks), np.int64, len(blocks))
+        starts = [block.start_timestamp for block in blocks]
+        return cls(lengths, starts, blocks=blocks)
+
+    def series(self) -> BaseTimeSeries:
+        if self._series is None:
+            assert self._blocks is not None
+            self._series = _concatenate(self._blocks)
+        return self._series
+
+    def blocks(self) -> Sequence[BaseTimeSeries]:
+        if self._blocks is None:
+            assert self._series is not None
+            series = self._series
+            pieces = np.split(series.values, np.cumsum(self.lengths)[:-1])
+            self._blocks = [
+                BaseTimeSeries(
+                    values=values,
+                    sample_rate=series.sample_rate,
+                    start_timestamp=start,
+                    metadata=series.metadata,
+                )
+                for values, start in zip(pieces, self.starts)
+            ]
+        return self._blocks
+
+
+def _concatenate(blocks: Sequence[BaseTimeSeries]) -> BaseTimeSeries:
+    first = blocks[0]
+    if len(blocks) == 1:
+        return first
+    for block in blocks[1:]:
+        if block.sample_rate != first.sample_rate:
+            raise ValueError("Blocks of one key must share a sample rate to be concatenated")
+        if block.values.shape[1:] != first.values.shape[1:]:
+            raise ValueError("Blocks of one key must share their trailing shape")
+    return first.copy_with(values=np.concatenate([block.values for block in blocks]))
+
+
+def run_chunk(
+    plan: ExecutionPlan,
+    blocks: Sequence[BaseTimeSeries],
+    chunk_index: int,
+    monitor: PipelineMonitor | None,
+) -> Dict[str, BaseTimeSeries]:
+    """Execute every step of ``plan`` once over ``blocks`` and return concatenated outputs."""
+
+    spans: list[_Span | None] = [None] * plan.slot_count
+    spans[plan.slots[plan.source_keys[0]]] = _Span.from_blocks(blocks)
+
+    for step, spanning in zip(plan.steps, spanning_steps(plan)):
+        if monitor:
+            monitor.on_node_start(chunk_index, step.name)
+        node_start = perf_counter()
+        try:
+            inputs = [(key, spans[slot]) for key, slot in step.inputs]
+            missing = [key for key, span in inputs if span is None]
+            if missing:
+                raise KeyError(f"Block '{missing[0]}' not found")
+            produced = _run_step(step.node, inputs, len(blocks), spanning)  # type: ignore[arg-type]
+            for key, span in produced.items():
+                slot = step.outputs.get(key)
+                if slot is None:
+                    raise ValueError(f"Node {step.name} produced unexpected key '{key}'")
+                spans[slot] = span
+        except Exception as error:  # pragma: no cover - user code
+            raise PipelineExecutionError(chunk_index, step.name, error) from error
+        finally:
+            if monitor:
+                monitor.on_node_end(chunk_index, step.name, perf_counter() - node_start)
+
+    selected = plan.slots.items() if plan.output_slots is None else plan.output_slots
+    return {key: span.series() for key, slot in selected if (span := spans[slot]) is not None}
+
+
+def spanning_steps(plan: ExecutionPlan) -> list[bool]:
+    """Which steps of ``plan`` run once per chunk through ``process_span``.
+
+    A span output carries the metadata of the chunk's first block only, so a step spans
+    only when every step reading its outputs spans too; otherwise per-block consumers
+    would all see the first block's metadata.
+    """
+
+    spanning = [False] * len(plan.steps)
+    per_block: set[int] = set()
+    for index in range(len(plan.steps) - 1, -1, -1):
+        step = plan.steps[index]
+        spanning[index] = (
+            bool(step.inputs)
+            and spans_blocks(step.node)
+            and per_block.isdisjoint(step.outputs.values())
+        )
+        if not spanning[index]:
+            per_block.update(slot for _, slot in step.inputs)
+    return spanning
+
+
+def _run_step(
+    node: ProcessingNode,
+    inputs: Sequence[tuple[str, _Span]],
+    count: int,
+    spanning: bool,
+) -> Dict[str, _Span]:
+    if spanning:
+        lengths = inputs[0][1].lengths
+        starts = inputs[0][1].starts
+        total = int(lengths.sum())
+        outputs = node.process_span({key: span.series() for key, span in inputs}, lengths)
+        for key, value in outputs.items():
+            if value.block_size != total:
+                raise ValueError(
+                    f"process_span returned {value.block_size} samples for '{key}', "
+                    f"expected {total}"
+                )
+        return {key: _Span(lengths, starts, series=value) for key, value in outputs.items()}
+
+    columns = [(key, span.blocks()) for key, span in inputs]
+    collected: Dict[str, list[BaseTimeSeries]] = {}
+    for position in range(count):
+        outputs = node.process({key: items[position] for key, items in columns})
+        for key, value in outputs.items():
+            collected.setdefault(key, []).append(value)
+    incomplete = [key for key, items in collected.items() if len(items) != count]
+    if incomplete:
+        raise ValueError(f"Keys {incomplete} were not produced for every block")
+    return {key: _Span.from_blocks(items) for key, items in collected.items()}
+
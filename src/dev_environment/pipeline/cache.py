@@ -0,0 +1,161 @@
+"""Content-addressed result cache for pure nodes."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from dev_environment.data import BaseTimeSeries, TimeSeriesBatch
+
+if TYPE_CHECKING:
+    from .base import ProcessingNode
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    """Cumulative counters of a ``NodeResultCache``."""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _digest(block: BaseTimeSeries | TimeSeriesBatch) -> bytes:
+    values = np.ascontiguousarray(block.values)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{values.dtype.str}{values.shape}".encode())
+    digest.update(values)
+    if isinstance(block, TimeSeriesBatch):
+        fields = (block.sample_rate, block.start_timestamps, block.metadata)
+    else:
+        fields = (block.sample_rate, block.start_timestamp, sorted(block.metadata.items()))
+    digest.update(repr(fields).encode())
+    return digest.digest()
+
+
+class NodeResultCache:
+    """LRU cache of node outputs bounded by the bytes of the cached arrays.
+
+    Entries are keyed on the node type, its ``fingerprint`` and a BLAKE2 digest of every
+    input's values, timestamps and metadata, so one cache can serve several orchestrators
+    built from different graphs, for example successive replays of a recorded session.
+    Only nodes that are ``pure`` and declare a fingerprint are cached. Output key names are
+    not part of the key: given ``produces``, outputs are stored by position and renamed to
+    the requesting node's keys on a hit. Cached outputs are shared between hits, so nodes
+    must not write into their input arrays.
+    """
+
+    def __init__(self, *, max_bytes: int = 256 * 1024 * 1024) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[dict[int | str, BaseTimeSeries], int]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def key_for(
+        self,
+        node: "ProcessingNode",
+        inputs: Mapping[str, BaseTimeSeries],
+    ) -> Hashable | None:
+        """Cache key for running ``node`` on ``inputs``, or ``None`` if it is not cacheable."""
+
+        if not node.pure:
+            return None
+        fingerprint = node.fingerprint()
+        if fingerprint is None:
+            return None
+        digests = tuple((key, _digest(value)) for key, value in sorted(inputs.items()))
+        return (type(node), fingerprint, digests)
+
+    def get(
+        self,
+        key: Hashable,
+        tally: list[int] | None = None,
+        *,
+        produces: Sequence[str] | None = None,
+    ) -> Mapping[str, BaseTimeSeries] | None:
+        """Return cached outputs or ``None``; ``tally`` counts ``[hits, misses]``.
+
+        Outputs stored by position are returned under the names in ``produces``.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None
+            if hit:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+            if tally is not None:
+                tally[0 if hit else 1] += 1
+        if entry is None:
+            return None
+        if produces is None:
+            return {str(name): value for name, value in entry[0].items()}
+        return {
+            produces[name] if isinstance(name, int) else name: value
+            for name, value in entry[0].items()
+        }
+
+    def put(
+        self,
+        key: Hashable,
+        outputs: Mapping[str, BaseTimeSeries],
+        *,
+        produces: Sequence[str] | None = None,
+    ) -> None:
+        """Store ``outputs``; with ``produces`` they are kept by position in that order."""
+
+        stored: dict[int | str, BaseTimeSeries] = dict(outputs)
+        if produces is not None:
+            positions = {name: position for position, name in enumerate(produces)}
+            if any(name not in positions for name in outputs):
+                return
+            stored = {positions[name]: value for name, value in outputs.items()}
+        size = sum(np.asarray(value.values).nbytes for value in outputs.values())
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (stored, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,185 @@
+"""Compile an execution plan into one generated Python function per block."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from time import perf_counter
+from types import CodeType
+from typing import Any, Callable, Dict, Hashable
+
+from dev_environment.data import BaseTimeSeries
+
+from .base import PipelineExecutionError, _process_unbatched
+from .plan import ExecutionPlan
+
+_CODE_CACHE: OrderedDict[Hashable, tuple[str, CodeType]] = OrderedDict()
+_CODE_CACHE_SIZE = 128
+_CODE_LOCK = threading.Lock()
+
+
+def plan_signature(plan: ExecutionPlan, *, monitored: bool, keyed: bool) -> Hashable:
+    """Everything the generated source depends on; node instances are bound separately."""
+
+    return (
+        keyed,
+        plan.source_keys,
+        tuple(plan.slots[key] for key in plan.source_keys),
+        tuple(
+            (step.inputs, tuple(step.outputs.items()), step.node.supports_batch)
+            for step in plan.steps
+        ),
+        plan.output_slots if plan.output_slots is not None else tuple(plan.slots.items()),
+        monitored,
+    )
+
+
+def generate_source(plan: ExecutionPlan, *, monitored: bool, keyed: bool) -> str:
+    """Python source of a factory that binds the plan's nodes into a ``run_block`` closure.
+
+    Every slot becomes a local variable ``s<slot>`` and every node call a direct
+    ``n<step>.process`` call; the only exception handler wraps the whole block. Monitor
+    hooks are emitted only when ``monitored`` is set. With ``keyed`` the block is a
+    ``MultiSensorBlock`` and each source key is looked up in it; as with
+    ``BlockSchedule``, a node whose sensor input is missing or was not updated is
+    skipped, and so is every node reading the outputs of a skipped one.
+    """
+
+    steps = plan.steps
+    lines = [
+        "def make_runner(nodes, names, unbatched, perf_counter, PipelineExecutionError):",
+    ]
+    if steps:
+        lines.append(f"    {', '.join(f'n{index}' for index in range(len(steps)))}, = nodes")
+    lines += [
+        "",
+        "    def run_block(block_index, source, batched, monitor):",
+        "        step = 0",
+    ]
+    if monitored:
+        lines.append("        started = None")
+    lines.append("        try:")
+    body: list[str] = []
+    source_slots = {plan.slots[key]: key for key in plan.source_keys}
+    if keyed:
+        body.append("updated = source.updated")
+    for key in plan.source_keys:
+        slot = plan.slots[key]
+        if keyed:
+            body.append(f"s{slot} = source.get({key!r})")
+            body.append(f"f{slot} = s{slot} is not None and {key!r} in updated")
+        else:
+            body.append(f"s{slot} = source")
+
+    for index, step in enumerate(steps):
+        body.append(f"step = {index}")
+        indent = ""
+        if keyed and step.inputs:
+            ready = " and ".join(
+                f"f{slot}" if slot in source_slots else f"s{slot} is not None"
+                for _, slot in step.inputs
+            )
+            body.append(f"if not ({ready}):")
+            body += [f"    s{slot} = None" for slot in step.outputs.values()]
+            body.append("else:")
+            indent = "    "
+        step_body: list[str] = []
+        arguments = "{" + ", ".join(f"{key!r}: s{slot}" for key, slot in step.inputs) + "}"
+        call = f"n{index}.process({arguments})"
+        if not step.node.supports_batch:
+            call = f"(unbatched(n{index}, {arguments}) if batched else {call})"
+        if monitored:
+            step_body.append(f"monitor.on_node_start(block_index, names[{index}])")
+            step_body.append("started = perf_counter()")
+        step_body.append(f"out = {call}")
+        if monitored:
+            step_body.append(
+                f"monitor.on_node_end(block_index, names[{index}], perf_counter() - started)"
+            )
+            step_body.append("started = None")
+        # A result of the expected size holds no extra key, as a missing key fails below.
+        expected = tuple(step.outputs)
+        step_body.append(f"if len(out) != {len(expected)}:")
+        step_body.append("    for key in out:")
+        step_body.append(f"        if key not in {expected!r}:")
+        step_body.append(
+            "            raise ValueError(f\"Node {names[step]} produced unexpected key '{key}'\")"
+        )
+        for key, slot in step.outputs.items():
+            step_body.append(f"s{slot} = out[{key!r}]")
+        body += [f"{indent}{line}" for line in step_body]
+
+    selected = plan.slots.items() if plan.output_slots is None else plan.output_slots
+    result = "{" + ", ".join(f"{key!r}: s{slot}" for key, slot in selected) + "}"
+    body.append(f"result = {result}")
+    lines += [f"            {line}" for line in body]
+    lines += ["        except Exception as error:"]
+    if monitored:
+        lines += [
+            "            if started is not None:",
+            "                monitor.on_node_end(",
+            "                    block_index, names[step], perf_counter() - started",
+            "                )",
+        ]
+    lines += [
+        "            raise PipelineExecutionError(block_index, names[step], error) from error",
+    ]
+    if keyed:
+        lines.append(
+            "        return {key: value for key, value in result.items() if value is not None}"
+        )
+    else:
+        lines.append("        return result")
+    lines += ["", "    return run_block", ""]
+    return "\n".join(lines)
+
+
+class CompiledRunner:
+    """One generated function that executes every step of ``plan`` for a block.
+
+    Generated code is cached by ``plan_signature``, so graphs with the same layout share
+    one code object and only bind their own nodes; the cache keeps the most recently used
+    layouts. ``source`` holds the generated text and ``fingerprint`` a digest of the
+    signature. As on the interpreted path, an unexpected output key fails the node; unlike
+    it, so does an output key missing from the node's result.
+    """
+
+    def __init__(
+        self,
+        plan: ExecutionPlan,
+        *,
+        monitored: bool = False,
+        keyed: bool = False,
+    ) -> None:
+        signature = plan_signature(plan, monitored=monitored, keyed=keyed)
+        self.fingerprint = hashlib.blake2b(repr(signature).encode(), digest_size=8).hexdigest()
+        with _CODE_LOCK:
+            cached = _CODE_CACHE.get(signature)
+            if cached is None:
+                source = generate_source(plan, monitored=monitored, keyed=keyed)
+                cached = (source, compile(source, f"<pipeline {self.fingerprint}>", "exec"))
+                _CODE_CACHE[signature] = cached
+                if len(_CODE_CACHE) > _CODE_CACHE_SIZE:
+                    _CODE_CACHE.popitem(last=False)
+            else:
+                _CODE_CACHE.move_to_end(signature)
+        self.source, code = cached
+        namespace: dict[str, Any] = {}
+        exec(code, namespace)
+        self._run: Callable[..., Dict[str, BaseTimeSeries]] = namespace["make_runner"](
+            tuple(step.node for step in plan.steps),
+            tuple(step.name for step in plan.steps),
+            _process_unbatched,
+            perf_counter,
+            PipelineExecutionError,
+        )
+
+    def __call__(
+        self,
+        block_index: int,
+        source: Any,
+        batched: bool,
+        monitor: Any = None,
+    ) -> Dict[str, BaseTimeSeries]:
+        return self._run(block_index, source, batched, monitor)
@@ -0,0 +1,61 @@
+"""Rolling per-step cost estimates for deadline-aware scheduling."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Sequence
+
+from .plan import NodeStep
+
+
+class CostHistory:
+    """Keeps the last ``window`` run times of every plan step.
+
+    ``estimate`` is the mean of the recorded runs, or ``0.0`` before a step has run once,
+    so every node gets at least one chance to be measured.
+    """
+
+    def __init__(self, steps: int, *, window: int = 16) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self._runs: list[deque[float]] = [deque(maxlen=window) for _ in range(steps)]
+        self._totals = [0.0] * steps
+
+    def record(self, index: int, duration: float) -> None:
+        runs = self._runs[index]
+        if len(runs) == runs.maxlen:
+            self._totals[index] -= runs[0]
+        runs.append(duration)
+        self._totals[index] += duration
+
+    def estimate(self, index: int) -> float:
+        runs = self._runs[index]
+        return self._totals[index] / len(runs) if runs else 0.0
+
+    def clear(self) -> None:
+        for index, runs in enumerate(self._runs):
+            runs.clear()
+            self._totals[index] = 0.0
+
+
+def check_optional_dependencies(steps: Sequence[NodeStep]) -> None:
+    """Raise ``ValueError`` when a required node reads a key only an optional node writes.
+
+    Skipping an optional node leaves its outputs empty, so only other optional nodes may
+    consume them.
+    """
+
+    optional_slots: dict[int, str] = {}
+    for step in steps:
+        if step.node.optional:
+            for slot in step.outputs.values():
+                optional_slots[slot] = step.name
+            continue
+        for key, slot in step.inputs:
+            if slot in optional_slots:
+                raise ValueError(
+                    f"Node {step.name} requires '{key}', which optional node "
+                    f"{optional_slots[slot]} produces"
+                )
+        for slot in step.outputs.values():
+            optional_slots.pop(slot, None)
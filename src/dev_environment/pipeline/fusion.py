@@ -0,0 +1,158 @@
+"""Fusion of chains of elementwise and linear nodes into single-pass nodes."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Hashable, Mapping
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from dev_environment.data import BaseTimeSeries, TimeSeriesBatch
+
+from .base import ProcessingNode, defining_class
+
+
+def declares_pure(node: ProcessingNode) -> bool:
+    """Whether ``node`` is ``pure`` by its own declaration rather than by inheritance.
+
+    A subclass that overrides ``process`` may add state, so ``pure`` only counts when it is
+    set on the instance or on a class at least as derived as the one defining ``process``.
+    """
+
+    if not node.pure:
+        return False
+    if "pure" in getattr(node, "__dict__", {}):
+        return True
+    return issubclass(defining_class(node, "pure"), defining_class(node, "process"))
+
+
+def is_fusible(node: ProcessingNode) -> bool:
+    """Whether ``node`` can join a fused chain.
+
+    A subclass that overrides ``process`` without overriding ``kernel`` is excluded, since
+    its kernel no longer describes what it computes, and so are ``isolated`` nodes and
+    nodes with a ``rate``.
+    """
+
+    if not node.fusible or node.isolated or node.rate is not None:
+        return False
+    if len(node.requires()) != 1 or len(node.produces()) != 1:
+        return False
+    return issubclass(defining_class(node, "kernel"), defining_class(node, "process"))
+
+
+class FusedNode(ProcessingNode):
+    """Runs the kernels of a node chain and materialises one ``BaseTimeSeries`` at the end.
+
+    A gain left pending by the kernels is applied in place when the final array does not
+    overlap the input block, so a normalise-then-average chain allocates one array per
+    block. Results match unfused execution up to floating-point rounding.
+    """
+
+    supports_batch = True
+    fusible = False
+
+    def __init__(self, nodes: Sequence[ProcessingNode]) -> None:
+        super().__init__("+".join(node.name for node in nodes))
+        self.nodes = tuple(nodes)
+        self.pure = all(declares_pure(node) for node in self.nodes)
+        self.optional = all(node.optional for node in self.nodes)
+        self._input_key = next(iter(self.nodes[0].requires()))
+        self._output_key = next(iter(self.nodes[-1].produces()))
+
+    def requires(self) -> Sequence[str]:
+        return [self._input_key]
+
+    def produces(self) -> Sequence[str]:
+        return [self._output_key]
+
+    def reset(self) -> None:
+        for node in self.nodes:
+            node.reset()
+
+    def fingerprint(self) -> Hashable | None:
+        parts = []
+        for node in self.nodes:
+            fingerprint = node.fingerprint()
+            if fingerprint is None:
+                return None
+            parts.append((type(node), fingerprint))
+        return tuple(parts)
+
+    def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
+        source = inputs[self._input_key]
+        batched = isinstance(source, TimeSeriesBatch)
+        values = source.values
+        gain: Any = 1.0
+        updates: list[dict[str, Any]] = [{} for _ in range(len(source) if batched else 1)]
+        for node in self.nodes:
+            values, gain, node_updates = node.kernel(values, gain, batched=batched)
+            for item, update in zip(updates, node_updates or ()):
+                item.update(update)
+
+        if not (np.isscalar(gain) and gain == 1.0):
+            owned = not np.may_share_memory(values, source.values)
+            if owned and values.dtype.kind in "fc":
+                np.multiply(values, gain, out=values, casting="unsafe")
+            else:
+                values = values * gain
+
+        if batched:
+            metadata: Any = [{**item, **update} for item, update in zip(source.metadata, updates)]
+        else:
+            metadata = {**source.metadata, **updates[0]}
+        return {self._output_key: source.copy_with(values=values, metadata=metadata)}
+
+    def process_span(
+        self,
+        inputs: Mapping[str, BaseTimeSeries],
+        lengths: np.ndarray,
+    ) -> Mapping[str, BaseTimeSeries]:
+        # Only reached when every member implements ``process_span`` (see ``run_batch``).
+        current = inputs[self._input_key]
+        for node in self.nodes:
+            (key,) = node.requires()
+            (current,) = node.process_span({key: current}, lengths).values()
+        return {self._output_key: current}
+
+
+def fuse_chains(
+    nodes: Sequence[ProcessingNode],
+    output_keys: Iterable[str],
+) -> list[ProcessingNode]:
+    """Replace runs of adjacent fusible nodes with ``FusedNode`` instances.
+
+    Two neighbours are fused when the second reads only the first's output, that
+    intermediate key is neither requested, read by another node nor written elsewhere,
+    and both nodes agree on ``optional``.
+    """
+
+    requested = set(output_keys)
+    readers = Counter(key for node in nodes for key in node.requires())
+    writers = Counter(key for node in nodes for key in node.produces())
+
+    def links(first: ProcessingNode, second: ProcessingNode) -> bool:
+        (key,) = first.produces()
+        return (
+            list(second.requires()) == [key]
+            and first.optional == second.optional
+            and key not in requested
+            and readers[key] == 1
+            and writers[key] == 1
+        )
+
+    result: list[ProcessingNode] = []
+    chain: list[ProcessingNode] = []
+    for node in [*nodes, None]:
+        if node is not None and is_fusible(node) and (not chain or links(chain[-1], node)):
+            chain.append(node)
+            continue
+        if len(chain) > 1:
+            result.append(FusedNode(chain))
+        else:
+            result.extend(chain)
+        chain = [node] if node is not None and is_fusible(node) else []
+        if node is not None and not chain:
+            result.append(node)
+    return result
@@ -0,0 +1,207 @@
+"""Persist intermediate keys of a run and re-execute only what a graph change affects."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from dev_environment.data import BaseTimeSeries, MultiSensorBlock
+from dev_environment.io import BlockLogDataset, BlockLogWriter, StreamDataLoader, StreamDataset
+
+if TYPE_CHECKING:
+    from .base import ProcessingNode
+
+_MANIFEST = "manifest.json"
+_VERSION = 1
+
+
+def lineage_fingerprints(
+    source_keys: Sequence[str],
+    nodes: Sequence["ProcessingNode"],
+) -> dict[str, str | None]:
+    """Digest of everything that determines each key, following nodes in order.
+
+    A key's lineage combines the producing node's type and ``fingerprint`` with the
+    lineages of its inputs. It is ``None`` when any node on the way has no fingerprint or
+    a ``rate``, since then an unchanged result cannot be proven.
+    """
+
+    lineage: dict[str, str | None] = {
+        key: hashlib.blake2b(f"source:{key}".encode(), digest_size=16).hexdigest()
+        for key in source_keys
+    }
+    for node in nodes:
+        fingerprint = node.fingerprint()
+        inputs = [lineage.get(key) for key in node.requires()]
+        digest: str | None = None
+        if fingerprint is not None and node.rate is None and None not in inputs:
+            node_type = f"{type(node).__module__}.{type(node).__qualname__}"
+            payload = repr((node_type, fingerprint, inputs))
+            digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        for position, key in enumerate(node.produces()):
+            lineage[key] = None if digest is None else f"{digest}:{position}"
+    return lineage
+
+
+class IntermediateStore:
+    """Directory holding one block log per persisted key plus a manifest.
+
+    The manifest records each key's lineage fingerprint and the indices of blocks that
+    failed under ``ErrorPolicy.CONTINUE`` and therefore have no record, so a later run can
+    keep the persisted keys aligned with the source.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = os.fspath(directory)
+
+    def manifest(self) -> dict[str, Any]:
+        path = os.path.join(self.directory, _MANIFEST)
+        if not os.path.exists(path):
+            return {"version": _VERSION, "keys": {}, "missing": []}
+        with open(path, encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if manifest.get("version") != _VERSION:
+            raise ValueError(f"Unsupported intermediate store version {manifest.get('version')}")
+        return manifest
+
+    def reusable(self, lineage: Mapping[str, str | None]) -> set[str]:
+        """Persisted keys whose recorded lineage equals ``lineage``."""
+
+        stored = self.manifest()["keys"]
+        return {
+            key
+            for key, entry in stored.items()
+            if lineage.get(key) is not None and entry["lineage"] == lineage[key]
+        }
+
+    def dataset(self, key: str) -> BlockLogDataset:
+        entry = self.manifest()["keys"][key]
+        return BlockLogDataset(os.path.join(self.directory, entry["file"]))
+
+    def missing_blocks(self) -> frozenset[int]:
+        return frozenset(self.manifest()["missing"])
+
+    def recorder(
+        self,
+        keys: Sequence[str],
+        lineage: Mapping[str, str | None],
+    ) -> "IntermediateRecorder":
+        return IntermediateRecorder(self, keys, lineage)
+
+
+class IntermediateRecorder:
+    """Writes the selected keys of every block and finalises the manifest on ``close``."""
+
+    def __init__(
+        self,
+        store: IntermediateStore,
+        keys: Sequence[str],
+        lineage: Mapping[str, str | None],
+    ) -> None:
+        os.makedirs(store.directory, exist_ok=True)
+        self._store = store
+        self._keys = tuple(keys)
+        self._lineage = {key: lineage.get(key) for key in self._keys}
+        self._files = {key: f"key_{position:03d}.blog" for position, key in enumerate(self._keys)}
+        self._writers = {
+            key: BlockLogWriter(os.path.join(store.directory, name))
+            for key, name in self._files.items()
+        }
+        self._missing: list[int] = []
+        self._blocks = 0
+
+    def write(self, outputs: Mapping[str, Any]) -> None:
+        for key in self._keys:
+            value = outputs.get(key)
+            if not isinstance(value, BaseTimeSeries):
+                raise TypeError(
+                    f"Persisted key '{key}' must hold a BaseTimeSeries on every block, "
+                    f"got {type(value).__name__}"
+                )
+        for key, writer in self._writers.items():
+            writer.write(outputs[key])
+        self._blocks += 1
+
+    def skip(self) -> None:
+        """Record that the current block produced nothing."""
+
+        self._missing.append(self._blocks)
+        self._blocks += 1
+
+    def close(self) -> None:
+        if not self._writers:
+            return
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+        manifest = {
+            "version": _VERSION,
+            "keys": {
+                key: {"lineage": self._lineage[key], "file": self._files[key]}
+                for key in self._keys
+            },
+            "missing": self._missing,
+        }
+        path = os.path.join(self._store.directory, _MANIFEST)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+
+
+class ReplayStreamDataset(StreamDataset[MultiSensorBlock]):
+    """Zips persisted keys with the original source, one record per recorded block.
+
+    Source blocks whose index is in ``missing`` are dropped so both sides stay aligned.
+    Every key is reported as updated in each block.
+    """
+
+    def __init__(
+        self,
+        persisted: Mapping[str, StreamDataset[BaseTimeSeries]],
+        *,
+        source_key: str | None = None,
+        source: StreamDataLoader | None = None,
+        missing: frozenset[int] = frozenset(),
+    ) -> None:
+        self._persisted = dict(persisted)
+        self._source_key = source_key
+        self._source = source
+        self._missing = missing
+        keys = list(self._persisted)
+        if source_key is not None:
+            keys.append(source_key)
+        self._index = {key: slot for slot, key in enumerate(keys)}
+        self._updated = tuple(keys)
+        self._position = 0
+
+    def next_block(self) -> MultiSensorBlock | None:
+        blocks: list[BaseTimeSeries] = []
+        for dataset in self._persisted.values():
+            block = dataset.next_block()
+            if block is None:
+                return None
+            blocks.append(block)
+
+        if self._source is not None:
+            while True:
+                block = self._source.next_block()
+                if block is None:
+                    return None
+                position = self._position
+                self._position += 1
+                if position not in self._missing:
+                    break
+            blocks.append(block)
+
+        return MultiSensorBlock(
+            self._index, tuple(blocks), blocks[0].start_timestamp, self._updated
+        )
+
+    def reset(self) -> None:
+        for dataset in self._persisted.values():
+            dataset.reset()
+        if self._source is not None:
+            self._source.reset()
+        self._position = 0
@@ -0,0 +1,173 @@
+"""Long-lived worker processes for nodes marked ``isolated``."""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Mapping
+from dataclasses import replace
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING, Any, Sequence
+
+from dev_environment.data import SHARE_MIN_BYTES, BaseTimeSeries, share_timeseries
+
+from .plan import ExecutionPlan
+
+if TYPE_CHECKING:
+    from .base import ProcessingNode
+
+
+def _share_all(blocks: Mapping[str, BaseTimeSeries], min_bytes: int) -> dict[str, Any]:
+    return {key: share_timeseries(block, min_bytes=min_bytes) for key, block in blocks.items()}
+
+
+def _attach_all(handles: Mapping[str, Any]) -> dict[str, BaseTimeSeries]:
+    return {key: handle.attach() for key, handle in handles.items()}
+
+
+def _serve(node: "ProcessingNode", connection: Connection, min_bytes: int) -> None:
+    """Worker loop: the node and its state live here until the parent closes the pipe."""
+
+    while True:
+        try:
+            command, payload = connection.recv()
+        except EOFError:
+            return
+
+        if command == "stop":
+            return
+        try:
+            if command == "reset":
+                node.reset()
+                result: Any = None
+            else:
+                result = _share_all(node.process(_attach_all(payload)), min_bytes)
+        except Exception as error:  # forwarded to the orchestrator
+            try:
+                connection.send(("error", error))
+            except Exception:
+                connection.send(("error", RuntimeError(repr(error))))
+            continue
+        connection.send(("ok", result))
+
+
+class IsolatedNode:
+    """Parent-side proxy that forwards ``process`` and ``reset`` to a worker process.
+
+    The worker starts on first use with a pickled copy of the node, so state accumulated
+    by ``process`` lives in the worker and is not visible on the original instance. Block
+    values of at least ``share_min_bytes`` cross the process boundary through a
+    shared-memory segment that the receiving side maps without copying; smaller blocks
+    travel inline through the pipe.
+    """
+
+    supports_batch = False
+    isolated = False
+    pure = False
+
+    def __init__(
+        self,
+        node: "ProcessingNode",
+        *,
+        mp_context: str | None = None,
+        share_min_bytes: int = SHARE_MIN_BYTES,
+    ) -> None:
+        self.node = node
+        self.name = node.name
+        self.optional = node.optional
+        self.rate = node.rate
+        self._mp_context = mp_context
+        self._share_min_bytes = share_min_bytes
+        self._process: Any = None
+        self._connection: Connection | None = None
+        self._lock = threading.Lock()
+
+    def requires(self) -> Sequence[str]:
+        return self.node.requires()
+
+    def produces(self) -> Sequence[str]:
+        return self.node.produces()
+
+    def _start(self) -> Connection:
+        if self._connection is None:
+            context = multiprocessing.get_context(self._mp_context)
+            parent, child = context.Pipe()
+            self._process = context.Process(
+                target=_serve,
+                args=(self.node, child, self._share_min_bytes),
+                name=f"pipeline-node-{self.name}",
+                daemon=True,
+            )
+            self._process.start()
+            child.close()
+            self._connection = parent
+        return self._connection
+
+    def _request(self, command: str, payload: Any) -> Any:
+        with self._lock:
+            connection = self._start()
+            try:
+                connection.send((command, payload))
+                status, result = connection.recv()
+            except (EOFError, OSError) as error:
+                self._discard()
+                raise RuntimeError(f"Worker process for node {self.name} exited") from error
+        if status == "error":
+            raise result
+        return result
+
+    def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
+        handles = _share_all(inputs, self._share_min_bytes)
+        try:
+            outputs = self._request("process", handles)
+        except BaseException:
+            for handle in handles.values():
+                try:
+                    handle.release()
+                except FileNotFoundError:
+                    pass
+            raise
+        return _attach_all(outputs)
+
+    def reset(self) -> None:
+        if self._connection is None:
+            self.node.reset()
+            return
+        self._request("reset", None)
+
+    def close(self) -> None:
+        """Stop the worker process; the next call starts a fresh one from ``node``."""
+
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.send(("stop", None))
+                except (BrokenPipeError, OSError):
+                    pass
+            self._discard()
+
+    def _discard(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if self._process is not None:
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+
+
+def isolate_plan(plan: ExecutionPlan, *, mp_context: str | None = None) -> ExecutionPlan:
+    """Return ``plan`` with every ``isolated`` node wrapped in an ``IsolatedNode``."""
+
+    if not any(getattr(step.node, "isolated", False) for step in plan.steps):
+        return plan
+
+    steps = tuple(
+        replace(step, node=IsolatedNode(step.node, mp_context=mp_context))
+        if getattr(step.node, "isolated", False)
+        else step
+        for step in plan.steps
+    )
+    return replace(plan, steps=steps)
@@ -0,0 +1,261 @@
+"""Run one compiled graph over many independent device streams."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterator, Mapping
+from time import perf_counter
+from typing import Dict, Hashable, Sequence
+
+from dev_environment.data import BaseTimeSeries, TimeSeriesBatch
+from dev_environment.io import StreamDataLoader
+from dev_environment.monitoring import BlockSummary, ErrorPolicy, PipelineMonitor
+
+from .base import PipelineExecutionError, ProcessingNode, _gather_inputs, _store_outputs
+from .fusion import declares_pure
+from .plan import ExecutionPlan
+
+StreamOutputs = Dict[Hashable, Dict[str, BaseTimeSeries]]
+
+
+class MultiStreamOrchestrator:
+    """Executes one ``ExecutionPlan`` for many streams in round-robin rounds.
+
+    Each round reads at most one block from every live stream, so a fast source cannot
+    starve the others. Blocks of a round that share shape and sample rate are stacked into
+    one ``TimeSeriesBatch`` along a leading stream axis. A step whose node is both ``pure``
+    (as declared by the class defining ``process``, see ``declares_pure``) and
+    ``supports_batch`` is shared by all streams and runs once per group; any other
+    node is copied per stream so that its state stays separate, and runs on that stream's
+    item of the group.
+
+    The monitor sees one "block" per round, numbered from zero. Under
+    ``ErrorPolicy.CONTINUE`` a failing group is dropped from the round while the other
+    groups still produce outputs. Nodes marked ``isolated`` run in-process here.
+    """
+
+    def __init__(
+        self,
+        *,
+        streams: Mapping[Hashable, StreamDataLoader],
+        plan: ExecutionPlan,
+        monitor: PipelineMonitor | None = None,
+        on_error: ErrorPolicy = ErrorPolicy.STOP,
+    ) -> None:
+        if len(plan.source_keys) != 1:
+            raise ValueError("MultiStreamOrchestrator requires a single input key")
+        if any(step.node.rate is not None for step in plan.steps):
+            raise ValueError("MultiStreamOrchestrator does not support rate-scheduled nodes")
+        self._streams = dict(streams)
+        self._ids = tuple(self._streams)
+        self._plan = plan
+        self._input_slot = plan.slots[plan.source_keys[0]]
+        self._shared = tuple(
+            declares_pure(step.node) and step.node.supports_batch for step in plan.steps
+        )
+        self._nodes: dict[Hashable, tuple[ProcessingNode | None, ...]] = {
+            stream_id: tuple(
+                None if shared else copy.deepcopy(step.node)
+                for step, shared in zip(plan.steps, self._shared)
+            )
+            for stream_id in self._ids
+        }
+        self._live = list(self._ids)
+        self._monitor = monitor
+        self._error_policy = on_error
+        self._next_round = 0
+
+    @property
+    def plan(self) -> ExecutionPlan:
+        return self._plan
+
+    @property
+    def stream_ids(self) -> tuple[Hashable, ...]:
+        return self._ids
+
+    def nodes_for(self, stream_id: Hashable) -> tuple[ProcessingNode, ...]:
+        """The node instances that run for ``stream_id``, shared ones included."""
+
+        own = self._nodes[stream_id]
+        return tuple(
+            step.node if node is None else node for step, node in zip(self._plan.steps, own)
+        )
+
+    def reset(self) -> None:
+        for loader in self._streams.values():
+            loader.reset()
+        for step, shared in zip(self._plan.steps, self._shared):
+            if shared:
+                step.node.reset()
+        for nodes in self._nodes.values():
+            for node in nodes:
+                if node is not None:
+                    node.reset()
+        self._live = list(self._ids)
+        self._next_round = 0
+
+    def process_next(self) -> StreamOutputs | None:
+        """Run the next round and return outputs keyed by stream id.
+
+        Returns ``None`` once every stream is exhausted.
+        """
+
+        while True:
+            read_start = perf_counter()
+            blocks = self._read_round()
+            if not blocks:
+                return None
+
+            produced = self._handle_round(blocks, read_start)
+            if produced is not None:
+                return produced
+
+    def run(self, *, max_rounds: int | None = None) -> Iterator[StreamOutputs]:
+        count = 0
+        while True:
+            if max_rounds is not None and count >= max_rounds:
+                return
+            result = self.process_next()
+            if result is None:
+                return
+            count += 1
+            yield result
+
+    def _read_round(self) -> dict[Hashable, BaseTimeSeries]:
+        blocks: dict[Hashable, BaseTimeSeries] = {}
+        live = []
+        for stream_id in self._live:
+            block = self._streams[stream_id].next_block()
+            if block is None:
+                continue
+            if isinstance(block, TimeSeriesBatch):
+                raise TypeError("Stream loaders must yield single blocks, not batches")
+            blocks[stream_id] = block
+            live.append(stream_id)
+        self._live = live
+        return blocks
+
+    def _handle_round(
+        self,
+        blocks: Mapping[Hashable, BaseTimeSeries],
+        read_start: float,
+    ) -> StreamOutputs | None:
+        round_index = self._next_round
+        self._next_round += 1
+        if self._monitor:
+            self._monitor.on_block_start(round_index)
+
+        round_start = perf_counter()
+        produced: StreamOutputs = {}
+        failed = False
+        for members in _group(blocks):
+            try:
+                produced.update(self._run_group(round_index, members, blocks))
+            except PipelineExecutionError as error:
+                if self._monitor:
+                    self._monitor.on_error(
+                        round_index, error.node_name, error.__cause__ or error
+                    )
+                if self._error_policy is ErrorPolicy.STOP:
+                    self._end_round(round_index, round_start, read_start, None)
+                    raise
+                failed = True
+
+        self._end_round(round_index, round_start, read_start, None if failed else produced)
+        if not produced:
+            return None
+        return produced
+
+    def _end_round(
+        self,
+        round_index: int,
+        round_start: float,
+        read_start: float,
+        produced: StreamOutputs | None,
+    ) -> None:
+        if not self._monitor:
+            return
+        round_end = perf_counter()
+        outputs = None
+        if produced is not None:
+            outputs = {
+                f"{stream_id}/{key}": value
+                for stream_id, values in produced.items()
+                for key, value in values.items()
+            }
+        self._monitor.on_block_end(
+            BlockSummary(
+                block_index=round_index,
+                duration_seconds=round_end - round_start,
+                outputs=outputs,
+                latency_seconds=round_end - read_start,
+            )
+        )
+
+    def _run_group(
+        self,
+        round_index: int,
+        members: Sequence[Hashable],
+        blocks: Mapping[Hashable, BaseTimeSeries],
+    ) -> StreamOutputs:
+        plan = self._plan
+        values: list[BaseTimeSeries | None] = [None] * plan.slot_count
+        values[self._input_slot] = TimeSeriesBatch.stack([blocks[member] for member in members])
+
+        monitor = self._monitor
+        for index, step in enumerate(plan.steps):
+            node_start = perf_counter()
+            if monitor:
+                monitor.on_node_start(round_index, step.name)
+
+            required = _gather_inputs(round_index, step, values)
+            try:
+                if self._shared[index]:
+                    outputs = step.node.process(required)
+                else:
+                    outputs = self._run_per_stream(index, members, required)
+            except Exception as error:  # pragma: no cover - user code
+                raise PipelineExecutionError(round_index, step.name, error) from error
+            finally:
+                if monitor:
+                    monitor.on_node_end(round_index, step.name, perf_counter() - node_start)
+
+            _store_outputs(round_index, step, outputs, values)
+
+        if plan.output_slots is None:
+            selected = [(key, values[slot]) for key, slot in plan.slots.items()]
+        else:
+            selected = [(key, values[slot]) for key, slot in plan.output_slots]
+        columns = [
+            (key, value.unbatch()) for key, value in selected if isinstance(value, TimeSeriesBatch)
+        ]
+        return {
+            member: {key: items[position] for key, items in columns}
+            for position, member in enumerate(members)
+        }
+
+    def _run_per_stream(
+        self,
+        index: int,
+        members: Sequence[Hashable],
+        inputs: Mapping[str, TimeSeriesBatch],
+    ) -> Dict[str, TimeSeriesBatch]:
+        columns = {key: batch.unbatch() for key, batch in inputs.items()}
+        collected: Dict[str, list[BaseTimeSeries]] = {}
+        for position, member in enumerate(members):
+            node = self._nodes[member][index]
+            assert node is not None
+            outputs = node.process({key: items[position] for key, items in columns.items()})
+            for key, value in outputs.items():
+                collected.setdefault(key, []).append(value)
+        return {key: TimeSeriesBatch.stack(items) for key, items in collected.items()}
+
+
+def _group(blocks: Mapping[Hashable, BaseTimeSeries]) -> list[list[Hashable]]:
+    """Group stream ids whose blocks can be stacked, keeping first-seen order."""
+
+    groups: dict[tuple[object, ...], list[Hashable]] = {}
+    for stream_id, block in blocks.items():
+        key = (block.values.shape, block.values.dtype.str, block.sample_rate)
+        groups.setdefault(key, []).append(stream_id)
+    return list(groups.values())
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 from typing import Iterable
 
 import numpy as np
 
-from dev_environment.data import BaseTimeSeries
+from dev_environment.data import BaseTimeSeries, TimeSeriesBatch
 
-from .base import ProcessingNode
+from .base import Gain, KernelResult, ProcessingNode
+
+
+def _exact_fingerprint(node: ProcessingNode, cls: type, *config: Hashable) -> Hashable | None:
+    # Subclasses usually change ``process``; they only merge if they declare their own.
+    return config if type(node) is cls else None
 
 
 class IdentityNode(ProcessingNode):
     """Pass-through node that optionally renames the incoming block."""
 
+    supports_batch = True
+    pure = True
+
     def __init__(
         self,
         input_key: str,
@@ -32,13 +40,27 @@ class IdentityNode(ProcessingNode):
     def produces(self) -> Iterable[str]:
         return [self._output_key]
 
+    def fingerprint(self) -> Hashable | None:
+        return _exact_fingerprint(self, IdentityNode)
+
     def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
         return {self._output_key: inputs[self._input_key]}
 
+    def process_span(
+        self,
+        inputs: Mapping[str, BaseTimeSeries],
+        lengths: np.ndarray,
+    ) -> Mapping[str, BaseTimeSeries]:
+        return {self._output_key: inputs[self._input_key]}
+
 
 class NormaliseAmplitudeNode(ProcessingNode):
     """Scale a block to the range [-1, 1] by peak amplitude."""
 
+    supports_batch = True
+    pure = True
+    fusible = True
+
     def __init__(
         self,
         input_key: str,
@@ -57,19 +79,55 @@ class NormaliseAmplitudeNode(ProcessingNode):
     def produces(self) -> Iterable[str]:
         return [self._output_key]
 
+    def fingerprint(self) -> Hashable | None:
+        return _exact_fingerprint(self, NormaliseAmplitudeNode, self._eps)
+
+    def kernel(self, values: np.ndarray, gain: Gain, *, batched: bool) -> KernelResult:
+        # The peak of ``values * gain`` is taken without materialising the product.
+        if batched:
+            axes = tuple(range(1, values.ndim))
+            peaks = np.max(np.abs(values), axis=axes, keepdims=True) * np.abs(gain)
+            scales = np.where(peaks < self._eps, 1.0, 1.0 / np.maximum(peaks, self._eps))
+            return values, gain * scales, [{"scale": float(scale)} for scale in scales.flat]
+
+        peak = np.max(np.abs(values)) * abs(gain)
+        scale = 1.0 if peak < self._eps else 1.0 / peak
+        return values, gain * scale, [{"scale": scale}]
+
     def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
+        source = inputs[self._input_key]
+        batched = isinstance(source, TimeSeriesBatch)
+        values, gain, updates = self.kernel(source.values, 1.0, batched=batched)
+        if batched:
+            metadata = [{**item, **update} for item, update in zip(source.metadata, updates)]
+        else:
+            metadata = {**source.metadata, **updates[0]}
+        return {self._output_key: source.copy_with(values=values * gain, metadata=metadata)}
+
+    def process_span(
+        self,
+        inputs: Mapping[str, BaseTimeSeries],
+        lengths: np.ndarray,
+    ) -> Mapping[str, BaseTimeSeries]:
+        # One peak per block, found with a single reduction over the whole span.
         source = inputs[self._input_key]
         values = source.values
-        peak = np.max(np.abs(values))
-        scale = 1.0 if peak < self._eps else 1.0 / peak
-        metadata = {**source.metadata, "scale": scale}
-        normalised = source.copy_with(values=values * scale, metadata=metadata)
-        return {self._output_key: normalised}
+        magnitudes = np.abs(values).reshape(values.shape[0], -1).max(axis=1)
+        peaks = np.maximum.reduceat(magnitudes, np.cumsum(lengths) - lengths)
+        scales = np.where(peaks < self._eps, 1.0, 1.0 / np.maximum(peaks, self._eps))
+        per_sample = np.repeat(scales, lengths).reshape((-1,) + (1,) * (values.ndim - 1))
+        # The span carries the first block's metadata, so it reports that block's scale.
+        metadata = {**source.metadata, "scale": float(scales[0])}
+        return {self._output_key: source.copy_with(values=values * per_sample, metadata=metadata)}
 
 
 class MovingAverageNode(ProcessingNode):
     """Apply a simple moving average across the first axis."""
 
+    supports_batch = True
+    pure = True
+    fusible = True
+
     def __init__(
         self,
         input_key: str,
@@ -90,21 +148,68 @@ class MovingAverageNode(ProcessingNode):
     def produces(self) -> Iterable[str]:
         return [self._output_key]
 
+    def fingerprint(self) -> Hashable | None:
+        return _exact_fingerprint(self, MovingAverageNode, self._window)
+
+    def kernel(self, values: np.ndarray, gain: Gain, *, batched: bool) -> KernelResult:
+        # Averaging is linear, so a pending gain passes through unchanged.
+        return _moving_average(values, self._window, 1 if batched else 0), gain, None
+
     def process(self, inputs: Mapping[str, BaseTimeSeries]) -> Mapping[str, BaseTimeSeries]:
         source = inputs[self._input_key]
-        values = source.values
-        if values.shape[0] < self._window:
-            averaged = values
-        else:
-            kernel = np.ones(self._window) / self._window
-            averaged = np.apply_along_axis(
-                lambda m: np.convolve(m, kernel, mode="valid"),
-                0,
-                values,
-            )
-            pad = values.shape[0] - averaged.shape[0]
-            if pad > 0:
-                front = np.repeat(averaged[0:1], pad, axis=0)
-                averaged = np.vstack([front, averaged])
-        result = source.copy_with(values=averaged)
+        axis = 1 if isinstance(source, TimeSeriesBatch) else 0
+        result = source.copy_with(values=_moving_average(source.values, self._window, axis))
         return {self._output_key: result}
+
+    def process_span(
+        self,
+        inputs: Mapping[str, BaseTimeSeries],
+        lengths: np.ndarray,
+    ) -> Mapping[str, BaseTimeSeries]:
+        source = inputs[self._input_key]
+        averaged = _moving_average_span(source.values, self._window, lengths)
+        return {self._output_key: source.copy_with(values=averaged)}
+
+
+def _moving_average(values: np.ndarray, window: int, axis: int) -> np.ndarray:
+    """Trailing mean along ``axis`` written into one new buffer, front-padded to full length."""
+
+    length = values.shape[axis]
+    if length < window:
+        return values
+
+    windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=axis)
+    dtype = values.dtype if values.dtype.kind in "fc" else np.float64
+    averaged = np.empty(values.shape, dtype=dtype)
+    pad = window - 1
+    body = [slice(None)] * values.ndim
+    body[axis] = slice(pad, None)
+    np.mean(windows, axis=-1, out=averaged[tuple(body)])
+    if pad:
+        front = [slice(None)] * values.ndim
+        front[axis] = slice(0, pad)
+        first = [slice(None)] * values.ndim
+        first[axis] = slice(pad, pad + 1)
+        averaged[tuple(front)] = averaged[tuple(first)]
+    return averaged
+
+
+def _moving_average_span(values: np.ndarray, window: int, lengths: np.ndarray) -> np.ndarray:
+    """``_moving_average`` of each block of ``lengths`` samples, computed in one pass.
+
+    Windows that reach back into the previous block only land on each block's first
+    ``window - 1`` samples, which are then overwritten with the block's first full window,
+    and blocks shorter than ``window`` are copied through, as in per-block processing.
+    """
+
+    averaged = _moving_average(values, window, 0)
+    if averaged is values:
+        return values
+
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    offsets = np.arange(values.shape[0]) - starts
+    full = np.repeat(lengths >= window, lengths)
+    heads = full & (offsets < window - 1)
+    averaged[heads] = averaged[starts[heads] + window - 1]
+    averaged[~full] = values[~full]
+    return averaged
@@ -0,0 +1,236 @@
+"""Frozen execution plans compiled from a resolved node order."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Hashable, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from .base import ProcessingNode
+
+
+@dataclass(slots=True, frozen=True)
+class NodeStep:
+    """One node with its input and output keys resolved to slot indices."""
+
+    node: "ProcessingNode"
+    name: str
+    inputs: tuple[tuple[str, int], ...]
+    outputs: Mapping[str, int]
+    dependencies: tuple[int, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionPlan:
+    """Slot layout and node steps shared by every block of a run.
+
+    Each key maps to one index into a per-block slot list of ``slot_count`` entries, so
+    executing a block needs no dictionary lookups for routing and no per-block buffer
+    allocation. Keys produced by a merged duplicate share the slot of the original result.
+
+    ``pruned`` lists the names of registered nodes that were dropped because none of their
+    outputs can reach a requested output key. ``merged`` lists nodes that were not
+    scheduled because an earlier node with the same type, ``fingerprint`` and inputs
+    already computes their outputs. ``fused`` lists the member names of each chain that
+    runs as one ``FusedNode`` step.
+    """
+
+    keys: tuple[str, ...]
+    slots: Mapping[str, int]
+    source_keys: tuple[str, ...]
+    steps: tuple[NodeStep, ...]
+    output_slots: tuple[tuple[str, int], ...] | None
+    pruned: tuple[str, ...] = ()
+    merged: tuple[str, ...] = ()
+    fused: tuple[tuple[str, ...], ...] = ()
+    slot_count: int = -1
+
+    def __post_init__(self) -> None:
+        if self.slot_count < 0:
+            object.__setattr__(self, "slot_count", len(self.keys))
+
+    @property
+    def nodes(self) -> tuple["ProcessingNode", ...]:
+        return tuple(step.node for step in self.steps)
+
+    def dependents(self) -> tuple[tuple[int, ...], ...]:
+        """For each step, the indices of steps that list it as a dependency."""
+
+        result: list[list[int]] = [[] for _ in self.steps]
+        for index, step in enumerate(self.steps):
+            for dependency in step.dependencies:
+                result[dependency].append(index)
+        return tuple(tuple(items) for items in result)
+
+
+def prune_dead_nodes(
+    nodes: Sequence["ProcessingNode"],
+    output_keys: Sequence[str],
+) -> tuple[list["ProcessingNode"], list["ProcessingNode"]]:
+    """Split ordered ``nodes`` into those that can affect ``output_keys`` and the rest.
+
+    Liveness is propagated backwards: a node is kept when it produces a key that is still
+    live at that point, after which the keys it produces stop being live and the keys it
+    requires become live. Nodes that produce nothing are kept, since they only exist for
+    their side effects.
+    """
+
+    live = set(output_keys)
+    kept: list["ProcessingNode"] = []
+    pruned: list["ProcessingNode"] = []
+    for node in reversed(nodes):
+        produced = set(node.produces())
+        if produced and not produced & live:
+            pruned.append(node)
+            continue
+        live -= produced
+        live.update(node.requires())
+        kept.append(node)
+    kept.reverse()
+    pruned.reverse()
+    return kept, pruned
+
+
+def compile_plan(
+    source_keys: Sequence[str],
+    nodes: Sequence["ProcessingNode"],
+    output_keys: Sequence[str] | None,
+    *,
+    fuse: bool = True,
+) -> ExecutionPlan:
+    """Assign slots to every key and validate the node contracts once.
+
+    ``nodes`` must already be in dependency order. When ``output_keys`` is given, nodes
+    that cannot contribute to it are left out of the plan and listed in
+    ``ExecutionPlan.pruned``, and with ``fuse`` chains of fusible nodes whose
+    intermediates are not requested become single steps. Nodes that repeat an earlier
+    node's computation, as decided by ``ProcessingNode.fingerprint``, are merged into it.
+    Raises ``ValueError`` when a node needs a key that no earlier node or source
+    provides, or when ``output_keys`` names a key nothing produces.
+    """
+
+    from .fusion import FusedNode, fuse_chains
+
+    pruned: list["ProcessingNode"] = []
+    if output_keys is not None:
+        nodes, pruned = prune_dead_nodes(nodes, output_keys)
+        if fuse:
+            nodes = fuse_chains(nodes, output_keys)
+
+    slots: dict[str, int] = {}
+    slot_count = 0
+    sharers: dict[int, int] = {}
+
+    def write_slot(key: str) -> int:
+        # A key that shares its slot with a merged alias moves to a fresh slot when it is
+        # written again, so the alias keeps the value it was bound to.
+        nonlocal slot_count
+        slot = slots.get(key)
+        if slot is None or sharers[slot] > 1:
+            if slot is not None:
+                sharers[slot] -= 1
+            slot = slot_count
+            slot_count += 1
+            slots[key] = slot
+            sharers[slot] = 1
+        return slot
+
+    for key in source_keys:
+        write_slot(key)
+
+    # A step depends on the last writer of each slot it reads (read after write), and on
+    # earlier readers and writers of each slot it overwrites, so that any schedule that
+    # honours ``dependencies`` observes the same values as sequential execution.
+    last_writer: dict[int, int] = {}
+    readers: dict[int, list[int]] = {}
+    versions: dict[int, int] = {}
+    computed: dict[Hashable, tuple[tuple[int, int], ...]] = {}
+    merged: list["ProcessingNode"] = []
+    steps: list[NodeStep] = []
+    for node in nodes:
+        required = tuple(node.requires())
+        missing = [key for key in required if key not in slots]
+        if missing:
+            raise ValueError(f"Node {node.name} requires unavailable keys: {missing}")
+        inputs = tuple((key, slots[key]) for key in required)
+        produced = tuple(node.produces())
+
+        identity = _identity(node, inputs, versions)
+        previous = computed.get(identity) if identity is not None else None
+        # Reuse an earlier result only while every slot it wrote still holds that value.
+        if previous is not None and len(previous) == len(produced):
+            if all(versions.get(slot, 0) == version for slot, version in previous):
+                for key, (slot, _) in zip(produced, previous):
+                    if key in slots:
+                        sharers[slots[key]] -= 1
+                    slots[key] = slot
+                    sharers[slot] += 1
+                merged.append(node)
+                continue
+
+        index = len(steps)
+        outputs = {key: write_slot(key) for key in produced}
+
+        dependencies = {last_writer[slot] for _, slot in inputs if slot in last_writer}
+        for slot in outputs.values():
+            if slot in last_writer:
+                dependencies.add(last_writer[slot])
+            dependencies.update(readers.get(slot, ()))
+        dependencies.discard(index)
+
+        for _, slot in inputs:
+            readers.setdefault(slot, []).append(index)
+        for slot in outputs.values():
+            last_writer[slot] = index
+            readers[slot] = []
+            versions[slot] = versions.get(slot, 0) + 1
+
+        if identity is not None:
+            computed[identity] = tuple((outputs[key], versions[outputs[key]]) for key in produced)
+
+        steps.append(
+            NodeStep(
+                node=node,
+                name=node.name,
+                inputs=inputs,
+                outputs=outputs,
+                dependencies=tuple(sorted(dependencies)),
+            )
+        )
+
+    output_slots = None
+    if output_keys is not None:
+        unknown = [key for key in output_keys if key not in slots]
+        if unknown:
+            raise ValueError(f"Requested output keys are never produced: {unknown}")
+        output_slots = tuple((key, slots[key]) for key in output_keys)
+
+    return ExecutionPlan(
+        keys=tuple(slots),
+        slots=slots,
+        source_keys=tuple(source_keys),
+        steps=tuple(steps),
+        output_slots=output_slots,
+        pruned=tuple(node.name for node in pruned),
+        merged=tuple(node.name for node in merged),
+        fused=tuple(
+            tuple(member.name for member in step.node.nodes)
+            for step in steps
+            if isinstance(step.node, FusedNode)
+        ),
+        slot_count=slot_count,
+    )
+
+
+def _identity(
+    node: "ProcessingNode",
+    inputs: tuple[tuple[str, int], ...],
+    versions: Mapping[int, int],
+) -> Hashable | None:
+    """Key under which two nodes compute the same values, or ``None`` to never merge."""
+
+    fingerprint = node.fingerprint()
+    if fingerprint is None or node.rate is not None:
+        return None
+    versioned = tuple((slot, versions.get(slot, 0)) for _, slot in inputs)
+    return (type(node), node.optional, fingerprint, versioned)
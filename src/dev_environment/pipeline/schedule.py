@@ -0,0 +1,155 @@
+"""Execution-rate declarations for nodes that should not run on every block."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .plan import NodeStep
+
+
+class RunCondition:
+    """Decides, once per block, whether a scheduled node runs.
+
+    A node that does not run leaves its outputs empty for that block, and nodes that read
+    those outputs are skipped as well instead of failing.
+    """
+
+    def should_run(
+        self,
+        block_index: int,
+        produced: Callable[[str], bool],
+        timestamp: datetime | None,
+    ) -> bool:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Forget any state before a new run."""
+
+
+class EveryNBlocks(RunCondition):
+    """Run on blocks ``offset``, ``offset + every``, ``offset + 2 * every`` and so on."""
+
+    def __init__(self, every: int, *, offset: int = 0) -> None:
+        if every <= 0:
+            raise ValueError("every must be positive")
+        if not 0 <= offset < every:
+            raise ValueError("offset must be in [0, every)")
+        self.every = every
+        self.offset = offset
+
+    def should_run(
+        self,
+        block_index: int,
+        produced: Callable[[str], bool],
+        timestamp: datetime | None,
+    ) -> bool:
+        return block_index % self.every == self.offset
+
+
+class OnTrigger(RunCondition):
+    """Run only on blocks where at least one of ``keys`` was produced.
+
+    A source key delivered through a ``MultiSensorBlock`` counts as produced only when the
+    sensor was updated in that block. Keys are checked when the node is about to start;
+    with an executor, only keys the node requires are guaranteed to be settled by then.
+    """
+
+    def __init__(self, *keys: str) -> None:
+        if not keys:
+            raise ValueError("OnTrigger needs at least one key")
+        self.keys = keys
+
+    def should_run(
+        self,
+        block_index: int,
+        produced: Callable[[str], bool],
+        timestamp: datetime | None,
+    ) -> bool:
+        return any(produced(key) for key in self.keys)
+
+
+class Periodic(RunCondition):
+    """Run at most once per ``seconds`` of stream time.
+
+    Time is taken from the block timestamps rather than the wall clock, so replays and
+    faster-than-real-time runs keep the same cadence. The first block always runs.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise ValueError("seconds must be positive")
+        self.interval = timedelta(seconds=seconds)
+        self._next: datetime | None = None
+
+    def should_run(
+        self,
+        block_index: int,
+        produced: Callable[[str], bool],
+        timestamp: datetime | None,
+    ) -> bool:
+        if timestamp is None:
+            return True
+        if self._next is not None and timestamp < self._next:
+            return False
+        self._next = timestamp + self.interval
+        return True
+
+    def reset(self) -> None:
+        self._next = None
+
+
+class BlockSchedule:
+    """Per-block bookkeeping of which scheduled nodes ran and which slots stayed empty.
+
+    ``stale`` holds the source slots of sensors that were not updated in this block and
+    ``absent`` those of sensors that have not delivered a block yet. Absent slots start
+    out idle. A node without a ``rate`` that reads a stale slot sits the block out, so
+    it never processes the same sensor block twice; a node with a ``rate`` decides for
+    itself, for example through ``OnTrigger``.
+    """
+
+    __slots__ = ("block_index", "timestamp", "stale", "idle", "_slots")
+
+    def __init__(
+        self,
+        block_index: int,
+        timestamp: datetime | None,
+        stale: frozenset[int],
+        slots: Mapping[str, int],
+        absent: frozenset[int] = frozenset(),
+    ) -> None:
+        self.block_index = block_index
+        self.timestamp = timestamp
+        self.stale = stale
+        self.idle: set[int] = set(absent)
+        self._slots = slots
+
+    def skips(self, step: "NodeStep", values: list[Any]) -> bool:
+        """Whether ``step`` sits this block out; its outputs are then marked idle."""
+
+        idle = self.idle
+        skip = any(slot in idle for _, slot in step.inputs)
+        rate = step.node.rate
+        if not skip and rate is None:
+            skip = any(slot in self.stale for _, slot in step.inputs)
+        elif not skip:
+
+            def produced(key: str) -> bool:
+                slot = self._slots.get(key)
+                return (
+                    slot is not None
+                    and values[slot] is not None
+                    and slot not in self.stale
+                    and slot not in idle
+                )
+
+            skip = not rate.should_run(self.block_index, produced, self.timestamp)
+        if skip:
+            idle.update(step.outputs.values())
+        return skip
+
+    def ran(self, step: "NodeStep") -> None:
+        self.idle.difference_update(step.outputs.values())
@@ -0,0 +1,115 @@
+"""Stage-pipelined execution of plan steps across consecutive blocks."""
+
+from __future__ import annotations
+
+import threading
+from queue import SimpleQueue
+from typing import Any, Callable, Sequence
+
+from .plan import NodeStep
+
+_STOP = object()
+
+
+class InFlightBlock:
+    """Per-block state carried from stage to stage.
+
+    Each block owns its slot list because several blocks are in the pipeline at once. Only
+    the stage currently holding the block touches it.
+    """
+
+    __slots__ = (
+        "index",
+        "values",
+        "batched",
+        "read_start",
+        "enter",
+        "started",
+        "durations",
+        "failure",
+        "failed_at",
+        "schedule",
+        "tally",
+    )
+
+    def __init__(
+        self,
+        index: int,
+        values: list[Any],
+        batched: bool,
+        read_start: float,
+        enter: float,
+        steps: int,
+    ) -> None:
+        self.index = index
+        self.values = values
+        self.batched = batched
+        self.read_start = read_start
+        self.enter = enter
+        self.started = [False] * steps
+        self.durations: list[float | None] = [None] * steps
+        self.failure: Exception | None = None
+        self.failed_at: int | None = None
+        self.schedule: Any = None
+        self.tally = [0, 0]
+
+
+class StagePipeline:
+    """One thread per step, linked by FIFO queues in plan order.
+
+    Block N+1 can run in an upstream stage while block N is still downstream. Every stage
+    sees blocks in submission order, so stateful nodes observe the same sequence as in
+    sequential execution. Blocks that failed upstream pass through later stages untouched.
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[NodeStep],
+        run_step: Callable[[InFlightBlock, int, NodeStep], None],
+    ) -> None:
+        self._run_step = run_step
+        self._cancelled = False
+        self._queues: list[SimpleQueue[Any]] = [SimpleQueue() for _ in range(len(steps) + 1)]
+        self._threads = [
+            threading.Thread(
+                target=self._stage,
+                args=(index, step, self._queues[index], self._queues[index + 1]),
+                name=f"pipeline-stage-{index}-{step.name}",
+                daemon=True,
+            )
+            for index, step in enumerate(steps)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _stage(
+        self,
+        index: int,
+        step: NodeStep,
+        inbox: SimpleQueue[Any],
+        outbox: SimpleQueue[Any],
+    ) -> None:
+        while True:
+            block = inbox.get()
+            if block is _STOP:
+                outbox.put(block)
+                return
+            if block.failure is None and not self._cancelled:
+                self._run_step(block, index, step)
+            outbox.put(block)
+
+    def submit(self, block: InFlightBlock) -> None:
+        self._queues[0].put(block)
+
+    def collect(self) -> InFlightBlock:
+        """Block until the oldest submitted block has left the last stage."""
+
+        return self._queues[-1].get()
+
+    def stop(self) -> None:
+        """Abandon in-flight blocks and join the stage threads."""
+
+        self._cancelled = True
+        self._queues[0].put(_STOP)
+        for thread in self._threads:
+            thread.join()
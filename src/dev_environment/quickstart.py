@@ -9,8 +9,8 @@ import numpy as np
 
 from dev_environment.io import (
     CollatedStreamDataset,
-    IterableDataSourceAdapter,
     StreamDataLoader,
+    StreamingIterableDataSourceAdapter,
 )
 from dev_environment.monitoring import ConsoleMonitor
 from dev_environment.pipeline import (
@@ -34,8 +34,7 @@ def generate_mock_samples(num_blocks: int = 3, block_size: int = 32) -> Iterable
 
 
 def build_pipeline() -> PipelineOrchestrator:
-    samples = generate_mock_samples()
-    adapter = IterableDataSourceAdapter(samples)
+    adapter = StreamingIterableDataSourceAdapter(generate_mock_samples)
     dataset = CollatedStreamDataset(adapter)
     loader = StreamDataLoader(dataset)
 
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Sequence
 
 import numpy as np
 import pytest
 
 from dev_environment.data import BaseTimeSeries
+from dev_environment.io import BufferedStreamDataset, StreamDataLoader
+from dev_environment.monitoring import BlockSummary
+from dev_environment.pipeline import NormaliseAmplitudeNode
 
 
 @pytest.fixture
@@ -34,3 +37,108 @@ def block_sequence() -> Iterable[BaseTimeSeries]:
             start_timestamp=now,
             metadata={"idx": idx},
         )
+
+
+@pytest.fixture
+def make_blocks() -> Callable[..., list[BaseTimeSeries]]:
+    """Factory for reproducible random blocks, one second apart and tagged with ``idx``.
+
+    ``size`` is the sample count of every block, or one count per block; ``start`` is a
+    float or a ``datetime``. ``contiguous`` starts each block where the previous one ends
+    instead. Different ``seed`` values give independent streams.
+    """
+
+    def make(
+        count: int = 4,
+        *,
+        size: int | Sequence[int] = 16,
+        channels: int = 2,
+        sample_rate: float = 50.0,
+        start: float | datetime = 0.0,
+        contiguous: bool = False,
+        seed: int = 0,
+    ) -> list[BaseTimeSeries]:
+        sizes = [size] * count if isinstance(size, int) else list(size)
+        offsets = (
+            np.concatenate([[0], np.cumsum(sizes[:-1])]) / sample_rate
+            if contiguous
+            else np.arange(len(sizes), dtype=np.float64)
+        )
+        blocks = []
+        for idx, (length, offset) in enumerate(zip(sizes, offsets)):
+            blocks.append(
+                BaseTimeSeries(
+                    values=np.random.default_rng([seed, idx]).normal(size=(length, channels)),
+                    sample_rate=sample_rate,
+                    start_timestamp=(
+                        start + timedelta(seconds=float(offset))
+                        if isinstance(start, datetime)
+                        else start + float(offset)
+                    ),
+                    metadata={"idx": idx},
+                )
+            )
+        return blocks
+
+    return make
+
+
+@pytest.fixture
+def make_loader(make_blocks) -> Callable[..., StreamDataLoader]:
+    """Like ``make_blocks`` but wraps the blocks in a fresh ``StreamDataLoader``."""
+
+    def make(*args, batch_size: int = 1, **kwargs) -> StreamDataLoader:
+        blocks = make_blocks(*args, **kwargs)
+        return StreamDataLoader(BufferedStreamDataset(blocks), batch_size=batch_size)
+
+    return make
+
+
+class SummaryMonitor:
+    """Records every monitor event, block summary and node error."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, int, str | None]] = []
+        self.summaries: list[BlockSummary] = []
+        self.errors: list[Exception] = []
+
+    def on_block_start(self, block_index: int) -> None:
+        self.events.append(("block_start", block_index, None))
+
+    def on_block_end(self, summary: BlockSummary) -> None:
+        self.events.append(("block_end", summary.block_index, None))
+        self.summaries.append(summary)
+
+    def on_node_start(self, block_index: int, node_name: str) -> None:
+        self.events.append(("node_start", block_index, node_name))
+
+    def on_node_end(self, block_index: int, node_name: str, duration_seconds: float) -> None:
+        self.events.append(("node_end", block_index, node_name))
+
+    def on_error(self, block_index: int, node_name: str | None, error: Exception) -> None:
+        self.events.append(("error", block_index, node_name))
+        self.errors.append(error)
+
+
+@pytest.fixture
+def make_monitor() -> type[SummaryMonitor]:
+    """Monitor class that records events, summaries and errors for later assertions."""
+
+    return SummaryMonitor
+
+
+@pytest.fixture
+def counting_normalise() -> type[NormaliseAmplitudeNode]:
+    """Normalise node class, fresh per test, that counts ``process`` calls."""
+
+    class CountingNormalise(NormaliseAmplitudeNode):
+        calls = 0
+
+        def fingerprint(self):
+            return ("counting", self._eps)
+
+        def process(self, inputs):
+            type(self).calls += 1
+            return super().process(inputs)
+
+    return CountingNormalise
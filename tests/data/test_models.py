@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import gc
+import pickle
 from datetime import datetime, timezone
+from multiprocessing import shared_memory
 
 import numpy as np
 import pytest
 
-from dev_environment.data import BaseTimeSeries
+from dev_environment.data import BaseTimeSeries, share_timeseries
 
 
 def test_base_time_series_validates_dimensions() -> None:
@@ -26,3 +29,23 @@ def test_copy_with_overrides(sample_block: BaseTimeSeries) -> None:
     assert np.allclose(result.values, new_values)
     assert result.metadata["scale"] == 2
     assert result.sample_rate == sample_block.sample_rate
+
+
+@pytest.mark.parametrize("min_bytes", [0, 1 << 30])
+def test_shared_timeseries_round_trip(sample_block: BaseTimeSeries, min_bytes: int) -> None:
+    handle = pickle.loads(pickle.dumps(share_timeseries(sample_block, min_bytes=min_bytes)))
+    assert (handle.segment is None) == (min_bytes > 0)
+    restored = handle.attach()
+    assert np.array_equal(restored.values, sample_block.values)
+    assert restored.start_timestamp == sample_block.start_timestamp
+    assert restored.metadata == sample_block.metadata
+
+
+def test_shared_timeseries_views_keep_the_segment_mapped(sample_block: BaseTimeSeries) -> None:
+    handle = share_timeseries(sample_block, min_bytes=0)
+    view = handle.attach().values[1:]
+    gc.collect()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle.segment)
+    assert np.array_equal(view, sample_block.values[1:])
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import itertools
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from dev_environment.data import BaseTimeSeries, collate_block
+from dev_environment.io import (
+    MemmapDataSourceAdapter,
+    SequenceDataSourceAdapter,
+    StreamingIterableDataSourceAdapter,
+)
+
+
+def test_memmap_adapter_yields_views_of_npy(tmp_path: Path) -> None:
+    recording = np.arange(20, dtype=np.float32).reshape(10, 2)
+    path = tmp_path / "recording.npy"
+    np.save(path, recording)
+
+    adapter = MemmapDataSourceAdapter(path, block_size=4, sample_rate=100.0)
+    assert len(adapter) == 3
+
+    blocks = []
+    while (block := adapter.read_block()) is not None:
+        blocks.append(block)
+
+    assert [block.block_size for block in blocks] == [4, 4, 2]
+    assert np.array_equal(np.concatenate([block.values for block in blocks]), recording)
+    assert np.shares_memory(blocks[0].values, adapter._array)
+    assert blocks[1].start_timestamp - blocks[0].start_timestamp == timedelta(seconds=0.04)
+
+    adapter.reset()
+    first = adapter.read_block()
+    assert first is not None and np.array_equal(first.values, recording[:4])
+
+
+def test_memmap_adapter_reads_raw_binary(tmp_path: Path) -> None:
+    recording = np.arange(15, dtype="<i2").reshape(5, 3)
+    path = tmp_path / "recording.bin"
+    path.write_bytes(recording.tobytes() + b"\x00")
+
+    adapter = MemmapDataSourceAdapter(path, block_size=2, sample_rate=10.0, dtype="<i2", channels=3)
+    assert adapter.num_samples == 5
+    assert len(adapter) == 3
+    block = adapter.read_block()
+    assert block is not None and np.array_equal(block.values, recording[:2])
+
+    with pytest.raises(ValueError):
+        MemmapDataSourceAdapter(path, block_size=2, sample_rate=10.0)
+
+
+def test_streaming_iterable_adapter_pulls_lazily() -> None:
+    pulled: list[int] = []
+
+    def endless() -> Iterator[int]:
+        for value in itertools.count():
+            pulled.append(value)
+            yield value
+
+    adapter = StreamingIterableDataSourceAdapter(endless)
+    assert [adapter.read_block() for _ in range(3)] == [0, 1, 2]
+    assert pulled == [0, 1, 2]
+
+    adapter.reset()
+    assert adapter.read_block() == 0
+
+
+def test_streaming_iterable_adapter_replays_bounded_cache() -> None:
+    adapter = StreamingIterableDataSourceAdapter(iter([1, 2, 3]), cycle=True, replay_cache=3)
+    assert [adapter.read_block() for _ in range(7)] == [1, 2, 3, 1, 2, 3, 1]
+
+    partial = StreamingIterableDataSourceAdapter(iter(range(10)), replay_cache=2)
+    assert [partial.read_block() for _ in range(2)] == [0, 1]
+    partial.reset()
+    assert [partial.read_block() for _ in range(4)] == [0, 1, 2, 3]
+    with pytest.raises(NotImplementedError):
+        partial.reset()
+
+    with pytest.raises(ValueError):
+        StreamingIterableDataSourceAdapter(iter([1]), cycle=True)
+
+
+def test_streaming_iterable_adapter_rejects_cycles_longer_than_the_cache() -> None:
+    adapter = StreamingIterableDataSourceAdapter(iter(range(5)), cycle=True, replay_cache=2)
+    assert [adapter.read_block() for _ in range(2)] == [0, 1]
+    with pytest.raises(ValueError, match="replay_cache=2"):
+        adapter.read_block()
+
+
+def test_sequence_adapter_slices_array_blocks() -> None:
+    data = np.arange(10, dtype=np.float64)[:, None]
+    adapter = SequenceDataSourceAdapter(data, block_size=4, sample_rate=8.0)
+
+    assert len(adapter) == 3
+    first = adapter.read_block()
+    assert isinstance(first, BaseTimeSeries)
+    assert collate_block(first) is first
+    assert np.shares_memory(first.values, data)
+
+    second = adapter.read_block()
+    assert second is not None
+    assert second.start_timestamp - first.start_timestamp == timedelta(seconds=0.5)
+    last = adapter.read_block()
+    assert last is not None and last.block_size == 2
+    assert adapter.read_block() is None
+
+    with pytest.raises(ValueError):
+        SequenceDataSourceAdapter(data, block_size=4)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.io import BlockLogDataset, BlockLogWriter, blocklog
+
+
+def make_blocks() -> list[BaseTimeSeries]:
+    blocks = []
+    for idx in range(5):
+        values = np.arange(idx, idx + 6, dtype=np.float32).reshape(3, 2)
+        metadata = {"session": "a"} if idx < 3 else {"session": "b", "gain": np.float64(2.0)}
+        blocks.append(
+            BaseTimeSeries(values=values, sample_rate=3.0, start_timestamp=float(idx), metadata=metadata)
+        )
+    return blocks
+
+
+def test_block_log_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "session.blog"
+    blocks = make_blocks()
+    with BlockLogWriter(path) as writer:
+        for block in blocks:
+            writer.write(block)
+        assert len(writer._metadata) == 2
+
+    dataset = BlockLogDataset(path)
+    replayed = list(dataset)
+    assert len(dataset) == len(replayed) == 5
+    for original, restored in zip(blocks, replayed):
+        assert np.array_equal(original.values, restored.values)
+        assert restored.values.dtype == np.float32
+        assert restored.start_timestamp == original.start_timestamp
+        assert restored.metadata == original.metadata
+        assert restored.sample_rate == original.sample_rate
+
+
+def test_block_log_seek(tmp_path: Path) -> None:
+    path = tmp_path / "session.blog"
+    blocks = make_blocks()
+    with BlockLogWriter(path) as writer:
+        for block in blocks:
+            writer.write(block)
+
+    dataset = BlockLogDataset(path)
+    dataset.seek(3)
+    assert dataset.next_block().start_timestamp == blocks[3].start_timestamp
+
+    assert dataset.seek_time(blocks[2].start_timestamp + timedelta(seconds=0.5)) == 2
+    assert dataset.next_block().start_timestamp == blocks[2].start_timestamp
+    assert dataset.seek_time(-10.0) == 0
+
+    with pytest.raises(IndexError):
+        dataset.seek(6)
+
+
+def test_block_log_requires_closed_file(tmp_path: Path) -> None:
+    path = tmp_path / "partial.blog"
+    writer = BlockLogWriter(path)
+    writer.write(make_blocks()[0])
+    writer._file.flush()
+
+    with pytest.raises(ValueError):
+        BlockLogDataset(path)
+    writer.close()
+
+
+def test_block_log_writes_array_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "arrays.blog"
+    calibration = {"offsets": np.array([0.5, -0.5])}
+    with BlockLogWriter(path) as writer:
+        for block in make_blocks()[:2]:
+            writer.write(block.copy_with(metadata=calibration))
+        writer.write(make_blocks()[2].copy_with(metadata={"offsets": np.array([1.0, 1.0])}))
+        assert len(writer._metadata) == 2
+
+    dataset = BlockLogDataset(path)
+    assert dataset.block_at(1).metadata == {"offsets": [0.5, -0.5]}
+    assert dataset.block_at(2).metadata == {"offsets": [1.0, 1.0]}
+
+
+def test_block_log_treats_naive_timestamps_as_utc(tmp_path: Path) -> None:
+    path = tmp_path / "naive.blog"
+    naive = datetime(2024, 1, 1, 12, 0, 0)
+    with BlockLogWriter(path) as writer:
+        writer.write(BaseTimeSeries(values=np.ones((3, 1)), sample_rate=3.0, start_timestamp=naive))
+
+    assert BlockLogDataset(path).block_at(0).start_timestamp == naive.replace(tzinfo=timezone.utc)
+
+
+def test_block_log_encodes_unchanged_metadata_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    encodings = []
+    dumps = blocklog.json.dumps
+    monkeypatch.setattr(blocklog.json, "dumps", lambda *args, **kwargs: encodings.append(args) or dumps(*args, **kwargs))
+    blocks = make_blocks()
+    with BlockLogWriter(tmp_path / "session.blog") as writer:
+        for block in blocks:
+            writer.write(block)
+            writer.write(block.copy_with(values=block.values * 2))
+        encoded = len(encodings)
+
+    assert encoded == 2
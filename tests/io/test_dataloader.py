@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Iterable
 
 import numpy as np
+import pytest
 from numpy.typing import NDArray
 
-from dev_environment.data import BaseTimeSeries
+from dev_environment.data import BaseTimeSeries, TimeSeriesBatch
 from dev_environment.io import (
+    AsyncDataSourceAdapter,
     CollatedStreamDataset,
     IterableDataSourceAdapter,
     StreamDataLoader,
 )
 
 
+def scale_raw(raw: dict[str, object]) -> dict[str, object]:
+    values = np.asarray(raw["values"], dtype=np.float64) * 2.0
+    return {**raw, "values": values}
+
+
 def make_blocks(num_blocks: int = 3) -> Iterable[BaseTimeSeries]:
     for idx in range(num_blocks):
         values: NDArray[np.float64] = np.full((4, 1), idx, dtype=np.float64)
@@ -47,3 +55,109 @@ def test_stream_dataloader_reset() -> None:
     second_pass = list(loader)
 
     assert len(first_pass) == len(second_pass) == 2
+
+
+def test_stream_dataloader_prefetch_preserves_order() -> None:
+    adapter = IterableDataSourceAdapter(make_blocks(5))
+    dataset = CollatedStreamDataset(adapter)
+    loader = StreamDataLoader(dataset, prefetch=2)
+
+    blocks = list(loader)
+    assert [float(block.values[0, 0]) for block in blocks] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert loader.is_exhausted
+    assert loader.next_block() is None
+
+    stats = loader.prefetch_stats
+    assert stats is not None
+    assert stats.capacity == 2
+    assert stats.depth == 0
+    assert 1 <= stats.peak_depth <= 2
+
+
+def test_stream_dataloader_prefetch_respects_max_blocks_and_reset() -> None:
+    adapter = IterableDataSourceAdapter(make_blocks(5))
+    dataset = CollatedStreamDataset(adapter)
+    loader = StreamDataLoader(dataset, max_blocks=3, prefetch=4)
+
+    first_pass = [float(block.values[0, 0]) for block in loader]
+    second_pass = [float(block.values[0, 0]) for block in loader]
+
+    assert first_pass == second_pass == [0.0, 1.0, 2.0]
+    assert loader.consumed_blocks == 3
+
+
+def test_stream_dataloader_prefetch_forwards_errors() -> None:
+    def failing_collate(raw: BaseTimeSeries) -> BaseTimeSeries:
+        if float(raw.values[0, 0]) == 1.0:
+            raise RuntimeError("decode failed")
+        return raw
+
+    adapter = IterableDataSourceAdapter(make_blocks())
+    dataset = CollatedStreamDataset(adapter)
+    loader = StreamDataLoader(dataset, collate_fn=failing_collate, prefetch=2)
+
+    assert loader.next_block() is not None
+    with pytest.raises(RuntimeError, match="decode failed"):
+        loader.next_block()
+    assert loader.next_block() is None
+
+
+def test_stream_dataloader_workers_keep_source_order() -> None:
+    raw = [
+        {"values": np.full((4, 2), idx, dtype=np.float64), "sample_rate": 10.0, "start_timestamp": idx}
+        for idx in range(6)
+    ]
+    adapter = IterableDataSourceAdapter(raw)
+    dataset = CollatedStreamDataset(adapter, transform=scale_raw)
+    loader = StreamDataLoader(dataset, num_workers=2, max_blocks=5, mp_context="spawn")
+
+    try:
+        first_pass = [float(block.values[0, 0]) for block in loader]
+        second_pass = [float(block.values[0, 0]) for block in loader]
+    finally:
+        loader.close()
+
+    assert first_pass == second_pass == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+class QueueSource(AsyncDataSourceAdapter[BaseTimeSeries]):
+    def __init__(self, blocks: Iterable[BaseTimeSeries]) -> None:
+        self._blocks = list(blocks)
+        self._cursor = 0
+
+    async def aread_block(self) -> BaseTimeSeries | None:
+        await asyncio.sleep(0)
+        if self._cursor >= len(self._blocks):
+            return None
+        block = self._blocks[self._cursor]
+        self._cursor += 1
+        return block
+
+    def reset(self) -> None:
+        self._cursor = 0
+
+
+def test_stream_dataloader_async_iteration() -> None:
+    loader = StreamDataLoader(CollatedStreamDataset(QueueSource(make_blocks())), max_blocks=2)
+
+    async def consume() -> list[float]:
+        return [float(block.values[0, 0]) async for block in loader]
+
+    assert asyncio.run(consume()) == [0.0, 1.0]
+    assert asyncio.run(consume()) == [0.0, 1.0]
+    loader.reset()
+    with pytest.raises(TypeError):
+        loader.next_block()
+
+
+def test_stream_dataloader_batches_consecutive_blocks() -> None:
+    blocks = list(make_blocks(5))
+    blocks.insert(3, BaseTimeSeries(values=np.zeros((2, 1)), sample_rate=10.0, start_timestamp=0.0))
+    loader = StreamDataLoader(CollatedStreamDataset(IterableDataSourceAdapter(blocks)), batch_size=2)
+
+    batches = list(loader)
+    assert all(isinstance(batch, TimeSeriesBatch) for batch in batches)
+    assert [batch.values.shape[:2] for batch in batches] == [(2, 4), (1, 4), (1, 2), (2, 4)]
+    assert [float(block.values[0, 0]) for block in batches[0].unbatch()] == [0.0, 1.0]
+    assert loader.consumed_blocks == 6
+    assert loader.is_exhausted
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.io import (
+    AdapterStreamDataset,
+    AsyncDataSourceAdapter,
+    BufferedStreamDataset,
+    MultiSensorStreamDataset,
+    RechunkStreamDataset,
+)
+
+
+def make_packets(sizes: list[int]) -> list[BaseTimeSeries]:
+    packets = []
+    offset = 0
+    for idx, size in enumerate(sizes):
+        values = np.arange(offset, offset + size, dtype=np.float64)[:, None]
+        packets.append(
+            BaseTimeSeries(
+                values=values,
+                sample_rate=10.0,
+                start_timestamp=offset / 10.0,
+                metadata={"packet": idx},
+            )
+        )
+        offset += size
+    return packets
+
+
+class AsyncListSource(AsyncDataSourceAdapter[BaseTimeSeries]):
+    def __init__(self, blocks: list[BaseTimeSeries]) -> None:
+        self._blocks = list(blocks)
+
+    async def aread_block(self) -> BaseTimeSeries | None:
+        await asyncio.sleep(0)
+        return self._blocks.pop(0) if self._blocks else None
+
+
+def collect(dataset) -> list:
+    async def consume() -> list:
+        return [item async for item in dataset]
+
+    return asyncio.run(consume())
+
+
+def test_rechunk_dataset_emits_fixed_blocks() -> None:
+    dataset = RechunkStreamDataset(BufferedStreamDataset(make_packets([3, 7, 1, 9, 2])), block_size=5)
+
+    blocks = list(dataset)
+    assert [block.block_size for block in blocks] == [5, 5, 5, 5, 2]
+    assert np.array_equal(np.concatenate([block.values for block in blocks])[:, 0], np.arange(22))
+    assert [block.metadata["packet"] for block in blocks] == [0, 1, 2, 3, 4]
+    for index, block in enumerate(blocks):
+        assert block.start_timestamp - blocks[0].start_timestamp == timedelta(seconds=index * 0.5)
+
+    dataset.reset()
+    assert np.array_equal(dataset.next_block().values, blocks[0].values)
+
+
+def test_rechunk_dataset_duration_and_validation() -> None:
+    dataset = RechunkStreamDataset(
+        BufferedStreamDataset(make_packets([4, 4, 4])),
+        duration=0.5,
+        drop_remainder=True,
+    )
+    assert [block.block_size for block in dataset] == [5, 5]
+
+    with pytest.raises(ValueError):
+        RechunkStreamDataset(BufferedStreamDataset([]), block_size=4, duration=1.0)
+
+
+def test_multi_sensor_dataset_aligns_by_timestamp() -> None:
+    fast = [
+        BaseTimeSeries(values=np.full((5, 1), idx), sample_rate=10.0, start_timestamp=idx * 0.5)
+        for idx in range(4)
+    ]
+    slow = [
+        BaseTimeSeries(values=np.full((2, 3), idx), sample_rate=2.0, start_timestamp=idx * 1.0)
+        for idx in range(2)
+    ]
+    dataset = MultiSensorStreamDataset(
+        {"fast": BufferedStreamDataset(fast), "slow": BufferedStreamDataset(slow)}
+    )
+
+    items = list(dataset)
+    assert [item.updated for item in items] == [
+        ("fast", "slow"),
+        ("fast",),
+        ("fast", "slow"),
+        ("fast",),
+    ]
+    assert [float(item["slow"].values[0, 0]) for item in items] == [0.0, 0.0, 1.0, 1.0]
+    assert set(items[-1]) == {"fast", "slow"}
+    assert items[0]._index is items[-1]._index
+
+    dataset.reset()
+    assert dataset.next_block().updated == ("fast", "slow")
+
+
+def test_multi_sensor_dataset_omits_sensors_without_data() -> None:
+    late = [BaseTimeSeries(values=np.ones(3), sample_rate=1.0, start_timestamp=5.0)]
+    early = [BaseTimeSeries(values=np.ones(3), sample_rate=1.0, start_timestamp=0.0)]
+    dataset = MultiSensorStreamDataset(
+        {"late": BufferedStreamDataset(late), "early": BufferedStreamDataset(early)}
+    )
+
+    first = dataset.next_block()
+    assert list(first) == ["early"]
+    with pytest.raises(KeyError):
+        first["late"]
+    assert list(dataset.next_block()) == ["late", "early"]
+    assert dataset.next_block() is None
+
+
+def test_rechunk_and_multi_sensor_datasets_read_async_sources() -> None:
+    packets = make_packets([3, 7, 1, 9, 2])
+    rechunked = collect(
+        RechunkStreamDataset(AdapterStreamDataset(AsyncListSource(packets)), block_size=5)
+    )
+    expected = list(RechunkStreamDataset(BufferedStreamDataset(packets), block_size=5))
+    assert [block.start_timestamp for block in rechunked] == [block.start_timestamp for block in expected]
+    assert [block.metadata for block in rechunked] == [block.metadata for block in expected]
+    for actual, reference in zip(rechunked, expected, strict=True):
+        assert np.array_equal(actual.values, reference.values)
+
+    fast = make_packets([5, 5, 5])
+    slow = make_packets([10])
+    merged = collect(
+        MultiSensorStreamDataset(
+            {
+                "fast": AdapterStreamDataset(AsyncListSource(fast)),
+                "slow": AdapterStreamDataset(AsyncListSource(slow)),
+            }
+        )
+    )
+    reference = list(
+        MultiSensorStreamDataset(
+            {"fast": BufferedStreamDataset(fast), "slow": BufferedStreamDataset(slow)}
+        )
+    )
+    assert [item.updated for item in merged] == [item.updated for item in reference]
+    assert [item.timestamp for item in merged] == [item.timestamp for item in reference]
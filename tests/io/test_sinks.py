@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.io import (
+    BlockLogDataset,
+    BlockLogSink,
+    BufferedStreamDataset,
+    CallbackSink,
+    OverflowPolicy,
+    SinkStage,
+    StreamDataLoader,
+)
+from dev_environment.pipeline import MovingAverageNode, NormaliseAmplitudeNode, PipelineBuilder
+
+
+def make_block(idx: int) -> BaseTimeSeries:
+    values = np.full((4, 2), float(idx))
+    return BaseTimeSeries(values=values, sample_rate=4.0, start_timestamp=float(idx))
+
+
+class GatedSink(CallbackSink):
+    """Records block indices but holds the worker until ``gate`` is set."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.seen: list[int] = []
+        super().__init__(self._write)
+
+    def _write(self, block_index, outputs) -> None:
+        self.entered.set()
+        self.gate.wait()
+        self.seen.append(block_index)
+
+
+def fill_stalled(overflow: OverflowPolicy, count: int, **options) -> tuple[GatedSink, SinkStage]:
+    sink = GatedSink()
+    stage = SinkStage(sink, capacity=2, overflow=overflow, **options)
+    stage.submit(0, {"x": make_block(0)})
+    assert sink.entered.wait(timeout=5)
+    for idx in range(1, count):
+        stage.submit(idx, {"x": make_block(idx)})
+    return sink, stage
+
+
+def test_drop_oldest_keeps_latest_blocks_while_sink_stalls() -> None:
+    sink, stage = fill_stalled(OverflowPolicy.DROP_OLDEST, 6)
+    sink.gate.set()
+    stage.close()
+
+    assert sink.seen == [0, 4, 5]
+    stats = stage.stats()
+    assert (stats.submitted, stats.written, stats.dropped, stats.peak_depth) == (6, 3, 3, 2)
+
+
+def test_sample_keeps_every_nth_overflowing_block() -> None:
+    sink, stage = fill_stalled(OverflowPolicy.SAMPLE, 9, sample_every=3)
+    sink.gate.set()
+    stage.close()
+
+    # Blocks 3..8 overflow; the 1st and 4th of them (3 and 6) evict the oldest entry.
+    assert sink.seen == [0, 3, 6]
+    assert stage.stats().dropped == 6
+
+
+def test_block_policy_waits_for_room_and_flushes_on_close() -> None:
+    sink, stage = fill_stalled(OverflowPolicy.BLOCK, 3)
+    blocked = threading.Thread(target=stage.submit, args=(3, {"x": make_block(3)}))
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()
+
+    sink.gate.set()
+    blocked.join(timeout=5)
+    stage.close()
+    assert sink.seen == [0, 1, 2, 3]
+    assert stage.stats().producer_waits == 1
+
+
+def test_sink_errors_are_raised_on_the_producer_side() -> None:
+    def fail(block_index, outputs):
+        raise OSError("collector unavailable")
+
+    stage = SinkStage(CallbackSink(fail))
+    stage.submit(0, {"x": make_block(0)})
+    with pytest.raises(RuntimeError) as info:
+        stage.flush()
+    assert isinstance(info.value.__cause__, OSError)
+    stage.close()
+
+
+def test_pipeline_exports_intermediate_keys_to_block_logs(tmp_path: Path) -> None:
+    blocks = [make_block(idx) for idx in range(1, 4)]
+    builder = PipelineBuilder(input_key="raw", output_keys=["smooth"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+    builder.add_node(MovingAverageNode("norm", output_key="smooth", window=2))
+    sink = BlockLogSink(tmp_path)
+    stage = SinkStage(sink, keys=["norm"], overflow=OverflowPolicy.DROP_OLDEST)
+    orchestrator = builder.build(StreamDataLoader(BufferedStreamDataset(blocks)), sinks=[stage])
+
+    outputs = list(orchestrator.run())
+    orchestrator.close()
+
+    assert [sorted(item) for item in outputs] == [["smooth"]] * 3
+    assert orchestrator.plan.fused == ()
+    log = BlockLogDataset(sink.path_for("norm"))
+    assert len(log) == 3
+    np.testing.assert_allclose(log.block_at(2).values, np.ones((4, 2)))
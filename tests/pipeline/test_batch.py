@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from functools import partial
+
+import numpy as np
+import pytest
+
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    ProcessingNode,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+LENGTHS = [16, 2, 9, 16, 4, 12, 16]
+
+
+@pytest.fixture
+def make_stream(make_loader):
+    """Loader factory for back-to-back blocks of uneven ``LENGTHS``."""
+
+    return partial(make_loader, size=LENGTHS, start=START, contiguous=True)
+
+
+class RunningSum(ProcessingNode):
+    """Stateful node without ``process_span``: carries its total across blocks."""
+
+    def __init__(self, input_key: str, output_key: str) -> None:
+        super().__init__()
+        self._input_key = input_key
+        self._output_key = output_key
+        self._total = 0.0
+
+    def requires(self):
+        return [self._input_key]
+
+    def produces(self):
+        return [self._output_key]
+
+    def reset(self) -> None:
+        self._total = 0.0
+
+    def process(self, inputs):
+        source = inputs[self._input_key]
+        values = np.cumsum(source.values, axis=0) + self._total
+        self._total = values[-1]
+        return {self._output_key: source.copy_with(values=values)}
+
+
+class Spy(IdentityNode):
+    calls = 0
+
+    def process(self, inputs):
+        type(self).calls += 1
+        return super().process(inputs)
+
+
+def make_builder() -> PipelineBuilder:
+    builder = PipelineBuilder(input_key="raw", output_keys=["smooth", "total"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+    builder.add_node(MovingAverageNode("norm", output_key="smooth", window=5))
+    builder.add_node(RunningSum("smooth", "total"))
+    return builder
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+@pytest.mark.parametrize("chunk_blocks", [None, 1, 3])
+def test_run_batch_matches_streaming(make_stream, fuse: bool, chunk_blocks: int | None) -> None:
+    streamed = list(make_builder().build(make_stream(), fuse=fuse).run())
+    orchestrator = make_builder().build(make_stream(), fuse=fuse)
+    chunks = list(orchestrator.run_batch(chunk_blocks=chunk_blocks))
+
+    assert len(chunks) == math.ceil(len(LENGTHS) / (chunk_blocks or len(LENGTHS)))
+    for key in ("smooth", "total"):
+        expected = np.concatenate([outputs[key].values for outputs in streamed])
+        actual = np.concatenate([chunk[key].values for chunk in chunks])
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+        firsts = streamed[:: chunk_blocks or len(LENGTHS)]
+        for chunk, outputs in zip(chunks, firsts, strict=True):
+            assert chunk[key].metadata == pytest.approx(outputs[key].metadata, rel=1e-12)
+    assert chunks[0]["smooth"].start_timestamp == START
+
+
+def test_run_batch_falls_back_to_blocks_for_overridden_process(make_stream) -> None:
+    Spy.calls = 0
+    builder = PipelineBuilder(input_key="raw", output_keys=["out"])
+    builder.add_node(Spy("raw", "out"))
+    (chunk,) = builder.build(make_stream()).run_batch()
+
+    assert Spy.calls == len(LENGTHS)
+    assert chunk["out"].block_size == sum(LENGTHS)
+
+
+def test_run_batch_keeps_per_block_metadata_for_per_block_consumers(make_stream) -> None:
+    class ScaleReader(IdentityNode):
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            scale = np.full((source.block_size, 1), source.metadata["scale"])
+            return {self._output_key: source.copy_with(values=scale)}
+
+    def make() -> PipelineBuilder:
+        builder = PipelineBuilder(input_key="raw", output_keys=["scale"])
+        builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+        builder.add_node(ScaleReader("norm", "scale"))
+        return builder
+
+    streamed = np.concatenate([out["scale"].values for out in make().build(make_stream()).run()])
+    (chunk,) = make().build(make_stream()).run_batch()
+
+    assert len(np.unique(streamed)) == len(LENGTHS)
+    np.testing.assert_array_equal(chunk["scale"].values, streamed)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+
+from dev_environment.io import BufferedStreamDataset, StreamDataLoader
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    NodeResultCache,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+)
+
+
+def replay(
+    cache: NodeResultCache,
+    blocks,
+    normalise: type,
+    decision_offset: float,
+    monitor=None,
+    norm_key: str = "norm",
+):
+    class Decision(IdentityNode):
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            return {self._output_key: source.copy_with(values=source.values + decision_offset)}
+
+    builder = PipelineBuilder(input_key="raw", output_keys=["decision"])
+    builder.add_node(normalise("raw", output_key=norm_key))
+    builder.add_node(MovingAverageNode(norm_key, output_key="smooth", window=3))
+    builder.add_node(Decision("smooth", output_key="decision", name="decision"))
+    loader = StreamDataLoader(BufferedStreamDataset(blocks))
+    return list(builder.build(loader, cache=cache, monitor=monitor, fuse=False).run())
+
+
+def test_cache_reuses_upstream_results_across_replays(make_blocks, make_monitor, counting_normalise) -> None:
+    blocks = make_blocks(3)
+    cache = NodeResultCache()
+    first = replay(cache, blocks, counting_normalise, 0.0)
+    monitor = make_monitor()
+    second = replay(cache, blocks, counting_normalise, 1.0, monitor)
+
+    assert counting_normalise.calls == 3
+    for before, after in zip(first, second):
+        np.testing.assert_allclose(after["decision"].values, before["decision"].values + 1.0)
+    assert [(item.cache_hits, item.cache_misses) for item in monitor.summaries] == [(2, 0)] * 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (6, 6, 6)
+    assert stats.hit_rate == 0.5
+
+
+def test_cache_serves_hits_under_the_requesting_nodes_output_keys(make_blocks, counting_normalise) -> None:
+    blocks = make_blocks(3)
+    cache = NodeResultCache()
+    first = replay(cache, blocks, counting_normalise, 0.0)
+    second = replay(cache, blocks, counting_normalise, 0.0, norm_key="renamed")
+
+    assert counting_normalise.calls == 3
+    for before, after in zip(first, second):
+        np.testing.assert_array_equal(after["decision"].values, before["decision"].values)
+
+
+def test_cache_key_covers_metadata_and_config(make_blocks) -> None:
+    cache = NodeResultCache()
+    block = make_blocks(1)[0]
+    node = NormaliseAmplitudeNode("raw")
+
+    key = cache.key_for(node, {"raw": block})
+    assert key == cache.key_for(NormaliseAmplitudeNode("raw", "other"), {"raw": block})
+    assert key != cache.key_for(NormaliseAmplitudeNode("raw", eps=1e-3), {"raw": block})
+    assert key != cache.key_for(node, {"raw": block.copy_with(metadata={"idx": 9})})
+    assert cache.key_for(IdentityNode("raw", name="custom"), {"raw": block}) is not None
+
+
+def test_cache_evicts_least_recently_used_by_bytes(make_blocks) -> None:
+    blocks = make_blocks(3)
+    cache = NodeResultCache(max_bytes=2 * blocks[0].values.nbytes)
+    for index, block in enumerate(blocks[:2]):
+        cache.put(("key", index), {"out": block})
+    assert cache.get(("key", 0)) is not None
+    cache.put(("key", 2), {"out": blocks[2]})
+
+    assert cache.get(("key", 1)) is None
+    assert cache.get(("key", 0)) is not None
+    assert cache.stats().bytes == 2 * blocks[0].values.nbytes
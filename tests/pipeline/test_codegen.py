@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+import dev_environment.pipeline.codegen as codegen_module
+from dev_environment.io import (
+    BufferedStreamDataset,
+    CollatedStreamDataset,
+    IterableDataSourceAdapter,
+    MultiSensorStreamDataset,
+    StreamDataLoader,
+)
+from dev_environment.monitoring import ErrorPolicy
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    NodeResultCache,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    PipelineExecutionError,
+)
+
+
+class OffsetNode(IdentityNode):
+    supports_batch = False
+
+    def process(self, inputs):
+        source = inputs[self._input_key]
+        if source.metadata.get("fail"):
+            raise RuntimeError("boom")
+        return {self._output_key: source.copy_with(values=source.values + 1.0)}
+
+
+def build(blocks, *, codegen: bool, batch_size: int = 1, **options):
+    loader = StreamDataLoader(
+        CollatedStreamDataset(IterableDataSourceAdapter(blocks)), batch_size=batch_size
+    )
+    builder = PipelineBuilder(input_key="raw", output_keys=["smooth", "norm"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+    builder.add_node(OffsetNode("norm", output_key="shifted", name="offset"))
+    builder.add_node(MovingAverageNode("shifted", output_key="smooth", window=4))
+    return builder.build(loader, codegen=codegen, **options)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_codegen_matches_interpreted_execution(make_blocks, batch_size: int) -> None:
+    interpreted = list(build(make_blocks(), codegen=False, batch_size=batch_size).run())
+    orchestrator = build(make_blocks(), codegen=True, batch_size=batch_size)
+    compiled = list(orchestrator.run())
+
+    assert len(compiled) == len(interpreted)
+    for expected, actual in zip(interpreted, compiled):
+        assert list(actual) == list(expected)
+        for key in expected:
+            np.testing.assert_array_equal(actual[key].values, expected[key].values)
+
+    source = orchestrator.generated_source
+    assert source is not None and "monitor." not in source and "try:" in source
+    assert source.count("try:") == 1
+
+
+def test_codegen_reports_monitor_events_and_errors_like_interpreted(make_blocks, make_monitor) -> None:
+    blocks = make_blocks(3)
+    blocks[1] = blocks[1].copy_with(metadata={"fail": True})
+
+    runs = []
+    for codegen in (False, True):
+        monitor = make_monitor()
+        orchestrator = build(blocks, codegen=codegen, monitor=monitor, on_error=ErrorPolicy.CONTINUE)
+        assert len(list(orchestrator.run())) == 2
+        runs.append(monitor)
+
+    interpreted, compiled = runs
+    assert compiled.events == interpreted.events
+    assert [summary.outputs is None for summary in compiled.summaries] == [
+        summary.outputs is None for summary in interpreted.summaries
+    ]
+    assert ("error", 1, "offset") in compiled.events
+    assert [str(error) for error in compiled.errors] == ["boom"]
+
+
+def test_codegen_seeds_multi_sensor_inputs(make_blocks) -> None:
+    def run(codegen: bool):
+        dataset = MultiSensorStreamDataset(
+            {"accel": BufferedStreamDataset(make_blocks()), "gyro": BufferedStreamDataset(make_blocks())}
+        )
+        builder = PipelineBuilder(input_keys=["accel", "gyro"], output_keys=["accel_norm", "gyro"])
+        builder.add_node(NormaliseAmplitudeNode("accel", output_key="accel_norm"))
+        return list(builder.build(StreamDataLoader(dataset), codegen=codegen).run())
+
+    for expected, actual in zip(run(False), run(True)):
+        assert set(actual) == set(expected)
+        for key in expected:
+            np.testing.assert_array_equal(actual[key].values, expected[key].values)
+
+
+def test_codegen_source_is_cached_by_graph_layout(make_blocks, make_monitor) -> None:
+    first = build(make_blocks(), codegen=True)
+    second = build(make_blocks(), codegen=True)
+    monitored = build(make_blocks(), codegen=True, monitor=make_monitor())
+
+    assert first._runner.fingerprint == second._runner.fingerprint
+    assert first.generated_source is second.generated_source
+    assert monitored._runner.fingerprint != first._runner.fingerprint
+    assert build(make_blocks(), codegen=False).generated_source is None
+
+
+def test_codegen_rejects_unsupported_modes(make_blocks) -> None:
+    with pytest.raises(ValueError, match="codegen"):
+        build(make_blocks(), codegen=True, cache=NodeResultCache())
+    with pytest.raises(ValueError, match="codegen"):
+        build(make_blocks(), codegen=True, pipelined=True)
+
+
+def test_codegen_rejects_unexpected_output_keys(make_loader) -> None:
+    class ExtraKeyNode(IdentityNode):
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            return {self._output_key: source, "extra": source}
+
+    for codegen in (False, True):
+        builder = PipelineBuilder(input_key="raw")
+        builder.add_node(ExtraKeyNode("raw", "out", name="extra"))
+        orchestrator = builder.build(make_loader(1), codegen=codegen)
+        with pytest.raises(PipelineExecutionError, match="unexpected key 'extra'") as excinfo:
+            orchestrator.process_next()
+        assert excinfo.value.node_name == "extra"
+
+
+def test_codegen_cache_keeps_only_recent_layouts(make_loader, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(codegen_module, "_CODE_CACHE", OrderedDict())
+    monkeypatch.setattr(codegen_module, "_CODE_CACHE_SIZE", 2)
+    for window in (2, 3, 4):
+        builder = PipelineBuilder(input_key="raw")
+        for index in range(window):
+            builder.add_node(IdentityNode("raw", f"copy{index}"))
+        builder.build(make_loader(1), codegen=True)
+
+    assert len(codegen_module._CODE_CACHE) == 2
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from dev_environment.pipeline import IdentityNode, PipelineBuilder
+from dev_environment.pipeline.deadline import CostHistory
+
+
+class SleepNode(IdentityNode):
+    supports_batch = False
+
+    def __init__(self, input_key: str, output_key: str, seconds: float, *, optional: bool = False) -> None:
+        super().__init__(input_key, output_key, name=output_key)
+        self.optional = optional
+        self.seconds = seconds
+        self.calls = 0
+
+    def process(self, inputs):
+        self.calls += 1
+        time.sleep(self.seconds)
+        return super().process(inputs)
+
+
+def test_cost_history_rolls_over_window() -> None:
+    history = CostHistory(1, window=2)
+    assert history.estimate(0) == 0.0
+    for duration in (1.0, 2.0, 4.0):
+        history.record(0, duration)
+    assert history.estimate(0) == pytest.approx(3.0)
+
+
+def test_budget_skips_optional_nodes_once_costs_are_known(make_loader, make_monitor) -> None:
+    diagnostic = SleepNode("raw", "diagnostic", 0.03, optional=True)
+    follow_up = SleepNode("diagnostic", "diagnostic_summary", 0.0, optional=True)
+    core = SleepNode("raw", "decision", 0.0)
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(diagnostic)
+    builder.add_node(follow_up)
+    builder.add_node(core)
+    monitor = make_monitor()
+
+    outputs = list(builder.build(make_loader(), monitor=monitor, budget_seconds=0.01).run())
+
+    # The first block measures the diagnostic node, which already overruns the budget, so
+    # its follow-up is dropped; afterwards the diagnostic node is predicted to overrun.
+    assert diagnostic.calls == 1
+    assert core.calls == 4
+    assert "diagnostic" in outputs[0]
+    assert all("decision" in item and "diagnostic" not in item for item in outputs[1:])
+    assert [summary.skipped for summary in monitor.summaries] == [("diagnostic_summary",)] + [
+        ("diagnostic", "diagnostic_summary")
+    ] * 3
+
+
+def test_budget_rejects_required_node_reading_optional_output(make_loader) -> None:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(SleepNode("raw", "diagnostic", 0.0, optional=True))
+    builder.add_node(SleepNode("diagnostic", "decision", 0.0))
+
+    with pytest.raises(ValueError, match="optional node"):
+        builder.build(make_loader(), budget_seconds=0.01)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dev_environment.data import TimeSeriesBatch
+from dev_environment.pipeline import (
+    FusedNode,
+    IdentityNode,
+    MovingAverageNode,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    PipelineExecutionError,
+    compile_plan,
+)
+
+
+def build(loader, fuse: bool):
+    builder = PipelineBuilder(input_key="raw", output_keys=["smooth"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+    builder.add_node(MovingAverageNode("norm", output_key="smooth", window=4))
+    return builder.build(loader, fuse=fuse)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_fused_chain_matches_unfused(make_loader, batch_size: int) -> None:
+    fused = build(make_loader(size=32, channels=4, batch_size=batch_size), fuse=True)
+    unfused = build(make_loader(size=32, channels=4, batch_size=batch_size), fuse=False)
+
+    assert fused.plan.fused == (("NormaliseAmplitudeNode", "MovingAverageNode"),)
+    assert isinstance(fused.plan.steps[0].node, FusedNode)
+    assert unfused.plan.fused == ()
+
+    for expected, actual in zip(unfused.run(), fused.run(), strict=True):
+        assert set(actual) == {"smooth"}
+        np.testing.assert_allclose(actual["smooth"].values, expected["smooth"].values)
+        if batch_size == 1:
+            assert actual["smooth"].metadata["scale"] == pytest.approx(expected["smooth"].metadata["scale"])
+            assert actual["smooth"].metadata["idx"] == expected["smooth"].metadata["idx"]
+        else:
+            assert isinstance(actual["smooth"], TimeSeriesBatch)
+            assert actual["smooth"].metadata == pytest.approx(expected["smooth"].metadata)
+
+
+
+def test_fusion_is_opt_in_and_renames_the_fused_step(make_loader, make_monitor) -> None:
+    class BrokenAverage(MovingAverageNode):
+        def kernel(self, values, gain, *, batched):
+            raise RuntimeError("boom")
+
+    monitors = {fuse: make_monitor() for fuse in (False, True)}
+    builder = PipelineBuilder(input_key="raw", output_keys=["smooth"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+    builder.add_node(MovingAverageNode("norm", output_key="smooth", window=4))
+    default = builder.build(make_loader(1), monitor=monitors[False])
+    assert default.plan.fused == ()
+    list(default.run())
+    list(builder.build(make_loader(1), monitor=monitors[True], fuse=True).run())
+
+    assert [event[2] for event in monitors[False].events if event[0] == "node_start"] == [
+        "NormaliseAmplitudeNode",
+        "MovingAverageNode",
+    ]
+    assert [event[2] for event in monitors[True].events if event[0] == "node_start"] == [
+        "NormaliseAmplitudeNode+MovingAverageNode"
+    ]
+
+    broken = PipelineBuilder(input_key="raw", output_keys=["smooth"])
+    broken.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+    broken.add_node(BrokenAverage("norm", output_key="smooth", window=4))
+    with pytest.raises(PipelineExecutionError) as excinfo:
+        broken.build(make_loader(1), fuse=True).process_next()
+    assert excinfo.value.node_name == "NormaliseAmplitudeNode+BrokenAverage"
+
+
+def test_fusion_keeps_requested_and_shared_intermediates() -> None:
+    norm = NormaliseAmplitudeNode("raw", output_key="norm")
+    smooth = MovingAverageNode("norm", output_key="smooth", window=3)
+    peek = IdentityNode("norm", output_key="peek")
+
+    requested = compile_plan(["raw"], [norm, smooth], ["norm", "smooth"])
+    shared = compile_plan(["raw"], [norm, smooth, peek], ["smooth", "peek"])
+
+    assert requested.fused == () and shared.fused == ()
+
+
+def test_subclass_overriding_process_is_not_fused() -> None:
+    class Offset(NormaliseAmplitudeNode):
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            return {self._output_key: source.copy_with(values=source.values + 1.0)}
+
+    plan = compile_plan(
+        ["raw"],
+        [Offset("raw", output_key="norm"), MovingAverageNode("norm", output_key="smooth")],
+        ["smooth"],
+    )
+
+    assert plan.fused == ()
+
+
+def test_fused_node_allocates_only_the_final_buffer(make_blocks) -> None:
+    (block,) = make_blocks(1, size=32, channels=4)
+    node = FusedNode(
+        [
+            NormaliseAmplitudeNode("raw", output_key="norm"),
+            MovingAverageNode("norm", output_key="smooth", window=4),
+        ]
+    )
+
+    result = node.process({"raw": block})["smooth"]
+
+    assert not np.shares_memory(result.values, block.values)
+    assert np.max(np.abs(result.values)) <= 1.0
+
+
+def test_fused_node_never_scales_a_view_of_the_input_in_place(make_blocks) -> None:
+    class FirstChannels(IdentityNode):
+        fusible = True
+
+        def kernel(self, values, gain, *, batched):
+            return values[..., :2], gain, None
+
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            return {self._output_key: source.copy_with(values=source.values[..., :2])}
+
+    (block,) = make_blocks(1, size=32, channels=4)
+    original = block.values.copy()
+    node = FusedNode(
+        [NormaliseAmplitudeNode("raw", output_key="norm"), FirstChannels("norm", output_key="head")]
+    )
+
+    result = node.process({"raw": block})["head"]
+
+    np.testing.assert_array_equal(block.values, original)
+    np.testing.assert_allclose(result.values, original[:, :2] / np.max(np.abs(original)))
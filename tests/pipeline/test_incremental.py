@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from dev_environment.pipeline import (
+    IdentityNode,
+    IntermediateStore,
+    MovingAverageNode,
+    PipelineBuilder,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Offset(IdentityNode):
+    def __init__(self, input_key: str, output_key: str, offset: float) -> None:
+        super().__init__(input_key, output_key, name="offset")
+        self._offset = offset
+
+    def fingerprint(self):
+        return (self._offset,)
+
+    def process(self, inputs):
+        source = inputs[self._input_key]
+        return {self._output_key: source.copy_with(values=source.values + self._offset)}
+
+
+def make_builder(normalise: type, window: int, offset: float) -> PipelineBuilder:
+    builder = PipelineBuilder(input_key="raw", output_keys=["decision"])
+    builder.add_node(normalise("raw", output_key="norm"))
+    builder.add_node(MovingAverageNode("norm", output_key="smooth", window=window))
+    builder.add_node(Offset("smooth", "decision", offset))
+    return builder
+
+
+def test_incremental_run_reuses_persisted_intermediates(
+    tmp_path, make_loader, counting_normalise
+) -> None:
+    store = IntermediateStore(tmp_path / "run")
+    recorded = list(
+        make_builder(counting_normalise, 3, 0.0)
+        .build(make_loader(start=START), store=store, persist_keys=["smooth"])
+        .run()
+    )
+    assert [sorted(outputs) for outputs in recorded] == [["decision"]] * 4
+
+    counting_normalise.calls = 0
+    builder = make_builder(counting_normalise, 3, 2.0)
+    orchestrator = builder.build_incremental(make_loader(start=START), store)
+    replayed = list(orchestrator.run())
+
+    assert counting_normalise.calls == 0
+    assert orchestrator.plan.source_keys == ("smooth",)
+    assert set(orchestrator.plan.pruned) >= {"CountingNormalise", "MovingAverageNode"}
+    assert len(replayed) == len(recorded)
+    for before, after in zip(recorded, replayed):
+        np.testing.assert_allclose(after["decision"].values, before["decision"].values + 2.0)
+
+
+def test_incremental_run_recomputes_when_upstream_changes(
+    tmp_path, make_loader, counting_normalise
+) -> None:
+    store = IntermediateStore(tmp_path / "run")
+    builder = make_builder(counting_normalise, 3, 0.0)
+    list(builder.build(make_loader(start=START), store=store, persist_keys=["smooth"]).run())
+
+    counting_normalise.calls = 0
+    builder = make_builder(counting_normalise, 5, 0.0)
+    replayed = list(builder.build_incremental(make_loader(start=START), store).run())
+    expected = list(builder.build(make_loader(start=START)).run())
+
+    assert counting_normalise.calls == 8
+    for want, got in zip(expected, replayed):
+        np.testing.assert_allclose(got["decision"].values, want["decision"].values)
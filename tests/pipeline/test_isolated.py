@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.pipeline import IdentityNode, PipelineBuilder, PipelineExecutionError
+from dev_environment.pipeline.isolated import IsolatedNode
+
+
+class RunningSumNode(IdentityNode):
+    isolated = True
+
+    def __init__(self) -> None:
+        super().__init__("raw", "total", name="running_sum")
+        self.total = 0.0
+
+    def reset(self) -> None:
+        self.total = 0.0
+
+    def process(self, inputs):
+        block = inputs["raw"]
+        self.total += float(block.values.sum())
+        values = np.full_like(block.values, self.total)
+        values[0, 0] = os.getpid()
+        return {"total": BaseTimeSeries(values=values, sample_rate=block.sample_rate, start_timestamp=block.start_timestamp)}
+
+
+class IsolatedFailingNode(IdentityNode):
+    isolated = True
+
+    def process(self, inputs):
+        raise ValueError("bad block")
+
+
+def test_isolated_node_keeps_state_in_one_worker_process(make_blocks, make_loader) -> None:
+    totals = np.cumsum([block.values.sum() for block in make_blocks()])
+    node = RunningSumNode()
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(node)
+    builder.add_node(IdentityNode("total", "final"))
+    orchestrator = builder.build(make_loader(), mp_context="spawn")
+
+    try:
+        assert isinstance(orchestrator.plan.steps[0].node, IsolatedNode)
+        first = [result["final"].values for result in orchestrator.run()]
+        orchestrator.reset()
+        second = [result["final"].values for result in orchestrator.run()]
+    finally:
+        orchestrator.close()
+
+    pids = {int(values[0, 0]) for values in first + second}
+    assert len(pids) == 1 and os.getpid() not in pids
+    assert [float(values[-1, -1]) for values in first] == pytest.approx(totals)
+    assert [float(values[-1, -1]) for values in second] == pytest.approx(totals)
+    assert node.total == 0.0
+
+
+def test_isolated_node_errors_are_wrapped(make_loader) -> None:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(IsolatedFailingNode("raw", "out", name="failing"))
+    orchestrator = builder.build(make_loader(), mp_context="spawn")
+
+    try:
+        with pytest.raises(PipelineExecutionError) as excinfo:
+            orchestrator.process_next()
+    finally:
+        orchestrator.close()
+
+    assert excinfo.value.node_name == "failing"
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+@pytest.mark.parametrize("share_min_bytes", [0, 1 << 30])
+def test_isolated_node_moves_blocks_inline_or_through_segments(share_min_bytes: int) -> None:
+    node = IsolatedNode(RunningSumNode(), mp_context="spawn", share_min_bytes=share_min_bytes)
+    block = BaseTimeSeries(values=np.ones((64, 4)), sample_rate=20.0, start_timestamp=0.0)
+
+    try:
+        first = node.process({"raw": block})["total"]
+        second = node.process({"raw": block})["total"]
+    finally:
+        node.close()
+
+    assert first.values.shape == (64, 4)
+    assert float(first.values[-1, -1]) == 256.0
+    assert float(second.values[-1, -1]) == 512.0
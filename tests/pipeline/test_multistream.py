@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dev_environment.monitoring import ErrorPolicy
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    MultiStreamOrchestrator,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    PipelineExecutionError,
+)
+
+
+class CountingNode(IdentityNode):
+    """Stateful node that tags each block with how many blocks it has seen."""
+
+    supports_batch = False
+
+    def __init__(self) -> None:
+        super().__init__("smooth", "counted", name="counter")
+        self.seen = 0
+
+    def reset(self) -> None:
+        self.seen = 0
+
+    def process(self, inputs):
+        self.seen += 1
+        block = inputs["smooth"]
+        return {"counted": block.copy_with(metadata={**block.metadata, "seen": self.seen})}
+
+
+class BatchCallCounter(NormaliseAmplitudeNode):
+    pure = True
+
+    def __init__(self) -> None:
+        super().__init__("raw", "norm")
+        self.calls = 0
+
+    def process(self, inputs):
+        self.calls += 1
+        return super().process(inputs)
+
+
+def make_builder(normalise: NormaliseAmplitudeNode | None = None) -> PipelineBuilder:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(normalise or NormaliseAmplitudeNode("raw", "norm"))
+    builder.add_node(MovingAverageNode("norm", "smooth", window=3))
+    builder.add_node(CountingNode())
+    return builder
+
+
+def test_multistream_matches_separate_orchestrators(make_loader) -> None:
+    counts = {"a": 3, "b": 2, "c": 3}
+    normalise = BatchCallCounter()
+    multi = make_builder(normalise).build_multi(
+        {name: make_loader(counts[name], seed=seed) for seed, name in enumerate(counts)}
+    )
+    assert isinstance(multi, MultiStreamOrchestrator)
+
+    rounds = list(multi.run())
+
+    assert [sorted(result) for result in rounds] == [["a", "b", "c"], ["a", "b", "c"], ["a", "c"]]
+    assert normalise.calls == 3
+    for seed, name in enumerate(counts):
+        expected = list(make_builder().build(make_loader(counts[name], seed=seed)).run())
+        actual = [result[name] for result in rounds if name in result]
+        assert len(actual) == len(expected)
+        for single, multiple in zip(expected, actual):
+            assert single.keys() == multiple.keys()
+            for key in single:
+                np.testing.assert_allclose(multiple[key].values, single[key].values)
+                assert multiple[key].start_timestamp == single[key].start_timestamp
+            assert multiple["counted"].metadata["seen"] == single["counted"].metadata["seen"]
+
+    shared = multi.nodes_for("a")
+    assert shared[0] is multi.nodes_for("b")[0]
+    assert shared[2] is not multi.nodes_for("b")[2]
+
+    multi.reset()
+    assert len(list(multi.run())) == 3
+
+
+def test_multistream_groups_by_block_shape(make_loader) -> None:
+    normalise = BatchCallCounter()
+    multi = make_builder(normalise).build_multi(
+        {"short": make_loader(1, size=6, seed=0), "long": make_loader(1, size=10, seed=1)}
+    )
+
+    (result,) = list(multi.run())
+
+    assert result["short"]["smooth"].values.shape == (6, 2)
+    assert result["long"]["smooth"].values.shape == (10, 2)
+    assert normalise.calls == 2
+
+
+def test_multistream_error_policies(make_loader) -> None:
+    class FailOnLong(IdentityNode):
+        supports_batch = False
+
+        def process(self, inputs):
+            if inputs["raw"].values.shape[0] > 6:
+                raise RuntimeError("too long")
+            return super().process(inputs)
+
+    def build(policy: ErrorPolicy):
+        builder = PipelineBuilder(input_key="raw")
+        builder.add_node(FailOnLong("raw", "out", name="fail_on_long"))
+        streams = {"short": make_loader(2, size=6, seed=0), "long": make_loader(2, size=10, seed=1)}
+        return builder.build_multi(streams, on_error=policy)
+
+    rounds = list(build(ErrorPolicy.CONTINUE).run())
+    assert [sorted(result) for result in rounds] == [["short"], ["short"]]
+
+    with pytest.raises(PipelineExecutionError):
+        list(build(ErrorPolicy.STOP).run())
+
+
+def test_multistream_copies_stateful_subclasses_of_pure_nodes(make_loader) -> None:
+    class DeltaNode(IdentityNode):
+        """Inherits ``pure`` and ``supports_batch`` but keeps the previous block."""
+
+        def __init__(self) -> None:
+            super().__init__("raw", "delta", name="delta")
+            self.previous = None
+
+        def process(self, inputs):
+            block = inputs["raw"]
+            previous = self.previous if self.previous is not None else block.values
+            self.previous = block.values
+            return {"delta": block.copy_with(values=block.values - previous)}
+
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(DeltaNode())
+    multi = builder.build_multi({"a": make_loader(3, seed=0), "b": make_loader(2, seed=1)})
+    rounds = list(multi.run())
+
+    assert multi.nodes_for("a")[0] is not multi.nodes_for("b")[0]
+    assert [sorted(result) for result in rounds] == [["a", "b"], ["a", "b"], ["a"]]
+    for seed, name in enumerate(["a", "b"]):
+        single = PipelineBuilder(input_key="raw")
+        single.add_node(DeltaNode())
+        expected = list(single.build(make_loader(3 - seed, seed=seed)).run())
+        actual = [result[name] for result in rounds if name in result]
+        for want, got in zip(expected, actual):
+            np.testing.assert_allclose(got["delta"].values, want["delta"].values)
+
+
+def test_build_multi_uses_the_configured_input_keys(make_loader) -> None:
+    builder = PipelineBuilder(input_keys=["accel"], output_keys=["norm"])
+    builder.add_node(NormaliseAmplitudeNode("accel", "norm"))
+    multi = builder.build_multi({"a": make_loader(2, seed=0)})
+    assert multi.plan.source_keys == ("accel",)
+    assert len(list(multi.run())) == 2
+
+    builder = PipelineBuilder(input_keys=["accel", "gyro"])
+    builder.add_node(NormaliseAmplitudeNode("accel", "norm"))
+    with pytest.raises(ValueError, match="single input key"):
+        builder.build_multi({"a": make_loader(2, seed=0)})
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from dev_environment.monitoring import ErrorPolicy
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    PipelineExecutionError,
+)
+
+
+class BarrierNode(IdentityNode):
+    def __init__(self, input_key: str, output_key: str, barrier: threading.Barrier) -> None:
+        super().__init__(input_key, output_key, name=output_key)
+        self._barrier = barrier
+
+    def process(self, inputs):
+        self._barrier.wait()
+        return super().process(inputs)
+
+
+class FailingNode(IdentityNode):
+    def process(self, inputs):
+        raise RuntimeError(self.name)
+
+
+def build_branches(builder: PipelineBuilder) -> PipelineBuilder:
+    for branch in ("a", "b"):
+        builder.add_node(NormaliseAmplitudeNode("raw", output_key=f"{branch}_norm"))
+        builder.add_node(MovingAverageNode(f"{branch}_norm", output_key=f"{branch}_ma", window=3))
+    return builder
+
+
+def test_parallel_execution_matches_sequential(make_loader, make_monitor) -> None:
+    sequential_monitor = make_monitor()
+    parallel_monitor = make_monitor()
+    sequential = build_branches(PipelineBuilder(input_key="raw")).build(make_loader(size=12), monitor=sequential_monitor)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = build_branches(PipelineBuilder(input_key="raw")).build(
+            make_loader(size=12), monitor=parallel_monitor, executor=executor
+        )
+        parallel_outputs = list(parallel.run())
+    sequential_outputs = list(sequential.run())
+
+    assert len(parallel_outputs) == len(sequential_outputs) == 4
+    for expected, actual in zip(sequential_outputs, parallel_outputs):
+        assert list(expected) == list(actual)
+        for key in expected:
+            assert np.array_equal(expected[key].values, actual[key].values)
+    assert parallel_monitor.events == sequential_monitor.events
+
+
+def test_parallel_execution_runs_independent_nodes_concurrently(make_loader) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    builder = PipelineBuilder(input_key="raw", output_keys=["left", "right"])
+    builder.add_node(BarrierNode("raw", "left", barrier))
+    builder.add_node(BarrierNode("raw", "right", barrier))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        outputs = list(builder.build(make_loader(size=12), executor=executor).run(max_blocks=2))
+
+    assert [sorted(item) for item in outputs] == [["left", "right"], ["left", "right"]]
+
+
+@pytest.mark.parametrize("policy", [ErrorPolicy.STOP, ErrorPolicy.CONTINUE])
+def test_parallel_execution_reports_first_failure_in_plan_order(make_loader, make_monitor, policy: ErrorPolicy) -> None:
+    monitor = make_monitor()
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(FailingNode("raw", "first", name="first"))
+    builder.add_node(FailingNode("raw", "second", name="second"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        orchestrator = builder.build(make_loader(size=12), monitor=monitor, on_error=policy, executor=executor)
+        if policy is ErrorPolicy.STOP:
+            with pytest.raises(PipelineExecutionError) as info:
+                orchestrator.process_next()
+            assert info.value.node_name == "first"
+        else:
+            assert list(orchestrator.run()) == []
+
+    errors = [event for event in monitor.events if event[0] == "error"]
+    assert errors and all(event[2] == "first" for event in errors)
+    assert ("node_start", 0, "second") not in monitor.events
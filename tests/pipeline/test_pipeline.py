@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
 import numpy as np
 import pytest
 
-from dev_environment.data import BaseTimeSeries
+from dev_environment.data import BaseTimeSeries, TimeSeriesBatch
 from dev_environment.io import (
+    AsyncDataSourceAdapter,
+    BufferedStreamDataset,
     CollatedStreamDataset,
     IterableDataSourceAdapter,
+    MultiSensorStreamDataset,
     StreamDataLoader,
 )
 from dev_environment.monitoring import ErrorPolicy
@@ -90,3 +95,111 @@ def test_pipeline_identity_node(sample_block: BaseTimeSeries) -> None:
     orchestrator = builder.build(loader)
     outputs = list(orchestrator.run())
     assert outputs[0]["alias"].metadata == sample_block.metadata
+
+
+def test_pipeline_arun_matches_run() -> None:
+    class AsyncListSource(AsyncDataSourceAdapter[BaseTimeSeries]):
+        def __init__(self) -> None:
+            self._blocks = list(make_blocks())
+
+        async def aread_block(self) -> BaseTimeSeries | None:
+            await asyncio.sleep(0)
+            return self._blocks.pop(0) if self._blocks else None
+
+    builder = PipelineBuilder(input_key="raw", output_keys=["raw_norm"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="raw_norm"))
+    orchestrator = builder.build(StreamDataLoader(CollatedStreamDataset(AsyncListSource())))
+    expected = list(builder.build(StreamDataLoader(BufferedStreamDataset(list(make_blocks())))).run())
+
+    async def consume() -> list:
+        return [outputs async for outputs in orchestrator.arun()]
+
+    outputs = asyncio.run(consume())
+    assert len(outputs) == len(expected) == 3
+    for actual, reference in zip(outputs, expected):
+        assert np.array_equal(actual["raw_norm"].values, reference["raw_norm"].values)
+        assert actual["raw_norm"].metadata == reference["raw_norm"].metadata
+
+
+def test_pipeline_seeds_multi_sensor_inputs() -> None:
+    dataset = MultiSensorStreamDataset(
+        {
+            "accel": BufferedStreamDataset(list(make_blocks())),
+            "gyro": BufferedStreamDataset(list(make_blocks())),
+        }
+    )
+    loader = StreamDataLoader(dataset)
+    builder = PipelineBuilder(input_keys=["accel", "gyro"], output_keys=["accel_norm", "gyro"])
+    builder.add_node(NormaliseAmplitudeNode("accel", output_key="accel_norm"))
+
+    orchestrator = builder.build(loader)
+    outputs = list(orchestrator.run())
+
+    assert len(outputs) == 3
+    assert set(outputs[0]) == {"accel_norm", "gyro"}
+    assert outputs[2]["gyro"].metadata == {"idx": 2}
+    assert orchestrator.available_outputs() == {"accel", "gyro", "accel_norm"}
+
+
+@pytest.mark.parametrize("mode", ["sequential", "executor", "pipelined", "codegen"])
+def test_multi_sensor_nodes_run_only_on_fresh_sensor_blocks(mode: str) -> None:
+    def sensor(offset: float) -> BufferedStreamDataset:
+        return BufferedStreamDataset(
+            [
+                BaseTimeSeries(values=np.full((4, 1), idx + 1.0), sample_rate=40.0, start_timestamp=offset + idx * 0.1)
+                for idx in range(3)
+            ]
+        )
+
+    class CallCounter(IdentityNode):
+        supports_batch = False
+
+        def __init__(self, input_key: str, output_key: str) -> None:
+            super().__init__(input_key, output_key)
+            self.calls = 0
+
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            self.calls += 1
+            return {self._output_key: source.copy_with(values=source.values + self.calls)}
+
+    builder = PipelineBuilder(input_keys=["a", "b"], output_keys=["a_count", "b_copy"])
+    builder.add_node(CallCounter("a", "a_count"))
+    builder.add_node(IdentityNode("b", output_key="b_copy"))
+    loader = StreamDataLoader(MultiSensorStreamDataset({"a": sensor(0.0), "b": sensor(0.01)}))
+
+    if mode == "executor":
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            outputs = list(builder.build(loader, executor=executor).run())
+    else:
+        outputs = list(builder.build(loader, pipelined=mode == "pipelined", codegen=mode == "codegen").run())
+
+    assert [sorted(item) for item in outputs] == [["a_count"], ["b_copy"]] * 3
+    assert [float(item["a_count"].values[0, 0]) for item in outputs[::2]] == [2.0, 4.0, 6.0]
+
+def test_pipeline_batched_mode_matches_block_mode(make_loader) -> None:
+    class OffsetNode(IdentityNode):
+        supports_batch = False
+
+        def process(self, inputs):
+            source = inputs[self._input_key]
+            return {self._output_key: source.copy_with(values=source.values + 1.0)}
+
+    def build(batch_size: int):
+        loader = make_loader(5, batch_size=batch_size)
+        builder = PipelineBuilder(input_key="raw", output_keys=["smooth"])
+        builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm"))
+        builder.add_node(OffsetNode("norm", output_key="shifted"))
+        builder.add_node(MovingAverageNode("shifted", output_key="smooth", window=4))
+        return builder.build(loader)
+
+    streamed = [outputs["smooth"] for outputs in build(1).run()]
+    batches = [outputs["smooth"] for outputs in build(2).run()]
+
+    assert all(isinstance(batch, TimeSeriesBatch) for batch in batches)
+    unbatched = [block for batch in batches for block in batch.unbatch()]
+    assert len(unbatched) == len(streamed) == 5
+    for expected, actual in zip(streamed, unbatched):
+        assert np.allclose(expected.values, actual.values)
+        assert expected.metadata["scale"] == pytest.approx(actual.metadata["scale"])
+        assert expected.start_timestamp == actual.start_timestamp
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.io import BufferedStreamDataset, StreamDataLoader
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    compile_plan,
+)
+
+
+def test_compile_plan_assigns_slots_once() -> None:
+    norm = NormaliseAmplitudeNode("raw", output_key="norm")
+    smooth = MovingAverageNode("norm", output_key="smooth", window=3)
+    plan = compile_plan(["raw"], [norm, smooth], ["smooth"], fuse=False)
+
+    assert plan.keys == ("raw", "norm", "smooth")
+    assert plan.steps[1].inputs == (("norm", 1),)
+    assert dict(plan.steps[1].outputs) == {"smooth": 2}
+    assert plan.output_slots == (("smooth", 2),)
+    assert plan.nodes == (norm, smooth)
+
+
+def test_compile_plan_rejects_unknown_outputs() -> None:
+    with pytest.raises(ValueError, match="never produced"):
+        compile_plan(["raw"], [IdentityNode("raw", output_key="alias")], ["missing"])
+
+
+def test_builder_exposes_compiled_plan() -> None:
+    builder = PipelineBuilder(input_key="raw", output_keys=["alias"])
+    builder.add_node(IdentityNode("raw", output_key="alias"))
+    orchestrator = builder.build(StreamDataLoader(BufferedStreamDataset([])))
+
+    assert orchestrator.plan.source_keys == ("raw",)
+    assert [step.name for step in orchestrator.plan.steps] == ["IdentityNode"]
+
+
+def test_compile_plan_prunes_nodes_that_cannot_reach_outputs() -> None:
+    norm = NormaliseAmplitudeNode("raw", output_key="norm")
+    diagnostic = MovingAverageNode("norm", output_key="diagnostic", window=5)
+    smooth = MovingAverageNode("norm", output_key="smooth", window=3)
+    overwritten = IdentityNode("raw", output_key="final", name="overwritten")
+    final = IdentityNode("smooth", output_key="final", name="final")
+    nodes = [norm, diagnostic, smooth, overwritten, final]
+    plan = compile_plan(["raw"], nodes, ["final"], fuse=False)
+
+    assert plan.nodes == (norm, smooth, final)
+    assert plan.pruned == ("MovingAverageNode", "overwritten")
+    assert "diagnostic" not in plan.slots
+
+    unpruned = compile_plan(["raw"], nodes, None)
+    assert len(unpruned.steps) == 5 and unpruned.pruned == ()
+
+
+def test_builder_skips_pruned_nodes_at_runtime() -> None:
+    class ExplodingNode(IdentityNode):
+        def process(self, inputs):
+            raise AssertionError("pruned node must not run")
+
+    block = BaseTimeSeries(values=[[1.0], [2.0]], sample_rate=10.0, start_timestamp=0.0)
+    builder = PipelineBuilder(input_key="raw", output_keys=["alias"])
+    builder.add_node(IdentityNode("raw", output_key="alias"))
+    builder.add_node(ExplodingNode("raw", output_key="debug", name="debug"))
+    orchestrator = builder.build(StreamDataLoader(BufferedStreamDataset([block])))
+
+    assert orchestrator.plan.pruned == ("debug",)
+    assert [sorted(outputs) for outputs in orchestrator.run()] == [["alias"]]
+
+
+def test_compile_plan_merges_duplicate_nodes() -> None:
+    first = NormaliseAmplitudeNode("raw", output_key="norm_a")
+    second = NormaliseAmplitudeNode("raw", output_key="norm_b")
+    other_eps = NormaliseAmplitudeNode("raw", output_key="norm_c", eps=1e-3)
+    smooth_a = MovingAverageNode("norm_a", output_key="smooth_a", window=3)
+    smooth_b = MovingAverageNode("norm_b", output_key="smooth_b", window=3)
+    plan = compile_plan(["raw"], [first, second, other_eps, smooth_a, smooth_b], None)
+
+    assert plan.nodes == (first, other_eps, smooth_a)
+    assert plan.merged == ("NormaliseAmplitudeNode", "MovingAverageNode")
+    assert plan.slots["norm_a"] == plan.slots["norm_b"]
+    assert plan.slots["smooth_a"] == plan.slots["smooth_b"]
+    assert plan.slot_count == 4
+
+
+def test_compile_plan_does_not_merge_across_overwrites() -> None:
+    class Rewrite(IdentityNode):
+        pass
+
+    first = MovingAverageNode("raw", output_key="smooth_a", window=3)
+    rewrite = Rewrite("raw", output_key="raw", name="rewrite")
+    second = MovingAverageNode("raw", output_key="smooth_b", window=3)
+    alias = IdentityNode("smooth_a", output_key="alias")
+    overwrite_alias = Rewrite("raw", output_key="smooth_a", name="overwrite")
+    third = IdentityNode("smooth_a", output_key="copy")
+    plan = compile_plan(["raw"], [first, rewrite, second, alias, overwrite_alias, third], None)
+
+    assert plan.merged == ()
+    assert plan.slots["smooth_a"] != plan.slots["smooth_b"]
+
+
+def test_merged_nodes_produce_aliased_outputs() -> None:
+    block = BaseTimeSeries(values=[[1.0], [-4.0], [2.0]], sample_rate=10.0, start_timestamp=0.0)
+    builder = PipelineBuilder(input_key="raw", output_keys=["norm_a", "norm_b"])
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm_a"))
+    builder.add_node(NormaliseAmplitudeNode("raw", output_key="norm_b"))
+    orchestrator = builder.build(StreamDataLoader(BufferedStreamDataset([block])))
+
+    (outputs,) = list(orchestrator.run())
+
+    assert orchestrator.plan.merged == ("NormaliseAmplitudeNode",)
+    assert outputs["norm_a"] is outputs["norm_b"]
+    assert outputs["norm_a"].values.min() == -1.0
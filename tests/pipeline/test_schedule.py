@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from dev_environment.data import BaseTimeSeries
+from dev_environment.io import BufferedStreamDataset, MultiSensorStreamDataset, StreamDataLoader
+from dev_environment.pipeline import (
+    EveryNBlocks,
+    IdentityNode,
+    OnTrigger,
+    Periodic,
+    PipelineBuilder,
+)
+
+
+def make_blocks(count: int, step: float = 0.25) -> list[BaseTimeSeries]:
+    return [
+        BaseTimeSeries(values=np.full((4, 1), float(idx)), sample_rate=16.0, start_timestamp=idx * step)
+        for idx in range(count)
+    ]
+
+
+class EveryOtherNode(IdentityNode):
+    """Produces its output only on even-valued blocks, like an event detector."""
+
+    supports_batch = False
+
+    def process(self, inputs):
+        block = inputs[self._input_key]
+        if int(block.values[0, 0]) % 2:
+            return {}
+        return super().process(inputs)
+
+
+def run_keys(builder: PipelineBuilder, count: int = 8, **options) -> list[list[str]]:
+    loader = StreamDataLoader(BufferedStreamDataset(make_blocks(count)))
+    if options.pop("executor", False):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return [sorted(out) for out in builder.build(loader, executor=executor).run()]
+    return [sorted(out) for out in builder.build(loader, **options).run()]
+
+
+@pytest.mark.parametrize("mode", ["sequential", "executor", "pipelined"])
+def test_every_n_blocks_skips_node_and_its_consumers(mode: str) -> None:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(IdentityNode("raw", "spectrum"), rate=EveryNBlocks(4, offset=1))
+    builder.add_node(IdentityNode("spectrum", "peaks"))
+    builder.add_node(IdentityNode("raw", "fast"))
+
+    options = {"executor": True} if mode == "executor" else {"pipelined": mode == "pipelined"}
+    keys = run_keys(builder, **options)
+
+    full = ["fast", "peaks", "raw", "spectrum"]
+    assert keys == [["fast", "raw"], full, ["fast", "raw"], ["fast", "raw"]] * 2
+
+
+def test_periodic_uses_stream_time() -> None:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(IdentityNode("raw", "slow"), rate=Periodic(1.0))
+
+    keys = run_keys(builder, count=9)
+
+    assert [index for index, item in enumerate(keys) if "slow" in item] == [0, 4, 8]
+
+
+def test_on_trigger_runs_only_when_key_was_produced() -> None:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(EveryOtherNode("raw", "event"))
+    builder.add_node(IdentityNode("event", "reaction"), rate=OnTrigger("event"))
+
+    keys = run_keys(builder, count=4)
+
+    assert keys == [["event", "raw", "reaction"], ["raw"], ["event", "raw", "reaction"], ["raw"]]
+
+
+def test_on_trigger_honours_multi_sensor_updates() -> None:
+    dataset = MultiSensorStreamDataset(
+        {
+            "fast": BufferedStreamDataset(make_blocks(4, step=0.5)),
+            "slow": BufferedStreamDataset(make_blocks(2, step=1.0)),
+        }
+    )
+    builder = PipelineBuilder(input_keys=["fast", "slow"])
+    builder.add_node(IdentityNode("slow", "slow_copy"), rate=OnTrigger("slow"))
+
+    outputs = list(builder.build(StreamDataLoader(dataset)).run())
+
+    assert ["slow_copy" in item for item in outputs] == [True, False, True, False]
+
+
+def test_rate_state_resets_with_orchestrator() -> None:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(IdentityNode("raw", "slow"), rate=Periodic(10.0))
+    orchestrator = builder.build(StreamDataLoader(BufferedStreamDataset(make_blocks(2))))
+
+    first = ["slow" in item for item in orchestrator.run()]
+    orchestrator.reset()
+    second = ["slow" in item for item in orchestrator.run()]
+
+    assert first == second == [True, False]
+
+
+def test_one_rate_object_serves_two_registrations() -> None:
+    rate = Periodic(1.0)
+    first = IdentityNode("raw", "slow")
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(first, rate=rate)
+    builder.add_node(IdentityNode("raw", "slower"), rate=rate)
+
+    keys = run_keys(builder, count=9)
+
+    assert [index for index, item in enumerate(keys) if "slow" in item] == [0, 4, 8]
+    assert [index for index, item in enumerate(keys) if "slower" in item] == [0, 4, 8]
+    assert first.rate is None
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from dev_environment.monitoring import ErrorPolicy
+from dev_environment.pipeline import (
+    IdentityNode,
+    MovingAverageNode,
+    NormaliseAmplitudeNode,
+    PipelineBuilder,
+    PipelineExecutionError,
+)
+
+
+def make_builder() -> PipelineBuilder:
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(NormaliseAmplitudeNode("raw", "norm"))
+    builder.add_node(MovingAverageNode("norm", "smooth", window=3))
+    builder.add_node(IdentityNode("smooth", "final"))
+    return builder
+
+
+class OrderRecordingNode(IdentityNode):
+    def __init__(self, input_key: str, output_key: str) -> None:
+        super().__init__(input_key, output_key, name=output_key)
+        self.seen: list[float] = []
+
+    def process(self, inputs):
+        self.seen.append(inputs[self._input_key].start_timestamp.timestamp())
+        return super().process(inputs)
+
+
+class FailOnceNode(IdentityNode):
+    def process(self, inputs):
+        if inputs[self._input_key].start_timestamp.timestamp() == 2.0:
+            raise RuntimeError("boom")
+        return super().process(inputs)
+
+
+def test_pipelined_matches_sequential_outputs_and_events(make_loader, make_monitor) -> None:
+    sequential_monitor = make_monitor()
+    pipelined_monitor = make_monitor()
+    sequential = list(make_builder().build(make_loader(5, size=12), monitor=sequential_monitor).run())
+    orchestrator = make_builder().build(make_loader(5, size=12), monitor=pipelined_monitor, pipelined=True)
+    pipelined = list(orchestrator.run())
+
+    assert len(pipelined) == len(sequential) == 5
+    for expected, actual in zip(sequential, pipelined):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            np.testing.assert_allclose(actual[key].values, expected[key].values)
+    assert pipelined_monitor.events == sequential_monitor.events
+    for summary in sequential_monitor.summaries + pipelined_monitor.summaries:
+        assert summary.latency_seconds is not None
+        assert summary.latency_seconds >= summary.duration_seconds >= 0.0
+
+
+def test_pipelined_stages_overlap_and_keep_order(make_loader) -> None:
+    first_stage_ready = threading.Event()
+
+    class WaitForUpstream(IdentityNode):
+        def process(self, inputs):
+            # Block 0 can only finish here once the first stage has moved on to block 1.
+            assert first_stage_ready.wait(timeout=5)
+            return super().process(inputs)
+
+    class SignalNode(OrderRecordingNode):
+        def process(self, inputs):
+            result = super().process(inputs)
+            if len(self.seen) == 2:
+                first_stage_ready.set()
+            return result
+
+    recorder = SignalNode("raw", "first")
+    builder = PipelineBuilder(input_key="raw")
+    builder.add_node(recorder)
+    builder.add_node(WaitForUpstream("first", "second", name="second"))
+    orchestrator = builder.build(make_loader(5, size=12), pipelined=True)
+
+    results = list(orchestrator.run())
+
+    assert [result["second"].start_timestamp.timestamp() for result in results] == [
+        0.0,
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+    ]
+    assert recorder.seen == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_pipelined_error_policies(make_loader, make_monitor) -> None:
+    def build(policy: ErrorPolicy, monitor):
+        builder = PipelineBuilder(input_key="raw")
+        builder.add_node(FailOnceNode("raw", "checked", name="checked"))
+        builder.add_node(IdentityNode("checked", "final"))
+        return builder.build(make_loader(5, size=12), monitor=monitor, on_error=policy, pipelined=True)
+
+    monitor = make_monitor()
+    results = list(build(ErrorPolicy.CONTINUE, monitor).run())
+    assert [result["final"].start_timestamp.timestamp() for result in results] == [0.0, 1.0, 3.0, 4.0]
+    assert ("error", 2, "checked") in monitor.events
+    assert ("node_start", 2, "IdentityNode") not in monitor.events
+
+    orchestrator = build(ErrorPolicy.STOP, make_monitor())
+    with pytest.raises(PipelineExecutionError):
+        list(orchestrator.run())
+    orchestrator.reset()
+    assert orchestrator.process_next() is not None
+    orchestrator.close()
+
+
+def test_pipelined_rejects_executor(make_loader) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError):
+            make_builder().build(make_loader(5, size=12), executor=executor, pipelined=True)